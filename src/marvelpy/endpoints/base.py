@@ -8,13 +8,15 @@ handling errors, and managing authentication.
 from typing import Any, Dict, Optional, Type, TypeVar, Union
 
 import httpx
+from pydantic import ValidationError
 
 from marvelpy.models.base import BaseListResponse, BaseResponse
 from marvelpy.utils.error_handling import (
+    CircuitBreaker,
     create_marvel_error,
     handle_httpx_error,
-    retry_with_backoff,
 )
+from marvelpy.utils.exceptions import MarvelAPIError
 
 T = TypeVar("T", bound=BaseResponse[Any])
 U = TypeVar("U", bound=BaseListResponse[Any])
@@ -56,6 +58,27 @@ class BaseEndpoint:
         self.private_key = private_key
         self.timeout = timeout
         self.max_retries = max_retries
+        # One breaker per resource path, so an outage of one does not block others
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def _circuit_breaker(self, endpoint: str) -> CircuitBreaker:
+        """Return this endpoint's circuit breaker for a path, creating it if needed.
+
+        Args:
+            endpoint: API endpoint path (e.g., '/v1/public/characters/1009368')
+
+        Returns:
+            The breaker shared by all paths under the same resource
+        """
+        key = "/".join(endpoint.split("/")[:4])
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            breaker = self._breakers[key] = CircuitBreaker()
+        return breaker
+
+    def reset_circuit_breakers(self) -> None:
+        """Close all of this endpoint's circuit breakers, forgetting past failures."""
+        self._breakers.clear()
 
     def _generate_auth_params(self) -> Dict[str, str]:
         """Generate authentication parameters for API requests.
@@ -115,18 +138,23 @@ class BaseEndpoint:
         async with httpx.AsyncClient(timeout=self.timeout) as client:
             # Define the request function for retry logic
             async def make_request() -> httpx.Response:
-                response = await client.request(method, url, params=params)
-                response.raise_for_status()
+                try:
+                    response = await client.request(method, url, params=params)
+                    response.raise_for_status()
+                except httpx.HTTPError as error:
+                    # Convert here so the retry loop sees which failures are retryable
+                    raise handle_httpx_error(error, {"url": url, "params": params}) from error
                 return response
 
-            # Make request with retry logic
+            # Make request with retry logic, failing fast while the resource is down
+            breaker = self._circuit_breaker(endpoint)
             try:
-                response = await retry_with_backoff(
+                response = await breaker.call(
                     make_request,
                     max_retries=self.max_retries,
                 )
-            except httpx.HTTPError as error:
-                raise handle_httpx_error(error, {"url": url, "params": params}) from error
+            except MarvelAPIError:
+                raise
             except Exception as error:
                 raise create_marvel_error(
                     status_code=0,  # Use 0 for unknown errors
@@ -136,9 +164,30 @@ class BaseEndpoint:
                     original_error=error,
                 ) from error
 
-            # Parse response
+            # Parse and validate the raw body in a single pass
+            if response_model:
+                try:
+                    return response_model.from_response(response)
+                except ValidationError as error:
+                    if any(detail["type"] == "json_invalid" for detail in error.errors()):
+                        raise create_marvel_error(
+                            status_code=response.status_code,
+                            message="Failed to parse JSON response",
+                            response_data=response.text,
+                            request_data={"url": url, "params": params},
+                            original_error=error,
+                        ) from error
+                    raise create_marvel_error(
+                        status_code=response.status_code,
+                        message="Failed to parse response into model",
+                        response_data=response.json(),
+                        request_data={"url": url, "params": params},
+                        original_error=error,
+                    ) from error
+
+            # Return raw data
             try:
-                data = response.json()
+                return response.json()  # type: ignore[no-any-return]
             except Exception as error:
                 raise create_marvel_error(
                     status_code=response.status_code,
@@ -148,21 +197,6 @@ class BaseEndpoint:
                     original_error=error,
                 ) from error
 
-            # Return parsed model or raw data
-            if response_model:
-                try:
-                    return response_model(**data)
-                except Exception as error:
-                    raise create_marvel_error(
-                        status_code=response.status_code,
-                        message="Failed to parse response into model",
-                        response_data=data,
-                        request_data={"url": url, "params": params},
-                        original_error=error,
-                    ) from error
-            else:
-                return data  # type: ignore[no-any-return]
-
     async def get(
         self,
         endpoint: str,
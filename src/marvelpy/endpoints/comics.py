@@ -11,6 +11,7 @@ from marvelpy.endpoints.base import BaseEndpoint
 from marvelpy.models.character import CharacterListResponse
 from marvelpy.models.comic import (
     Comic,
+    ComicListBody,
     ComicListResponse,
 )
 from marvelpy.models.creator import CreatorListResponse
@@ -56,7 +57,7 @@ class ComicsEndpoint(BaseEndpoint):
         response = await self._make_request(
             "GET",
             f"/v1/public/comics/{comic_id}",
-            response_model=ComicListResponse,
+            response_model=ComicListBody,  # type: ignore[arg-type]
         )
         if not response.data.results:  # type: ignore[attr-defined]
             raise MarvelAPIError(f"Comic with ID {comic_id} not found")
@@ -1,190 +1,266 @@
-"""Marvel API data models."""
+"""Marvel API data models.
 
-from .base import BaseListResponse, BaseModel, BaseResponse, DataContainer
-from .character import (
-    Character,
-    CharacterListResponse,
-    CharacterResponse,
-    ComicList,
-    EventList,
-    SeriesList,
-    StoryList,
-)
-from .comic import (
-    CharacterList,
-    Comic,
-    ComicListResponse,
-    ComicResponse,
-    CreatorList,
-)
-from .comic import (
-    EventList as ComicEventList,
-)
-from .comic import (
-    StoryList as ComicStoryList,
-)
-from .common import (
-    URL,
-    CharacterSummary,
-    ComicSummary,
-    CreatorSummary,
-    Date,
-    EventSummary,
-    Image,
-    Price,
-    SeriesSummary,
-    StorySummary,
-    TextObject,
-)
-from .creator import (
-    CharacterList as CreatorCharacterList,
-)
-from .creator import (
-    ComicList as CreatorComicList,
-)
-from .creator import (
-    Creator,
-    CreatorListResponse,
-    CreatorResponse,
-)
-from .creator import (
-    EventList as CreatorEventList,
-)
-from .creator import (
-    SeriesList as CreatorSeriesList,
-)
-from .creator import (
-    StoryList as CreatorStoryList,
-)
-from .event import (
-    CharacterList as EventCharacterList,
-)
-from .event import (
-    ComicList as EventComicList,
-)
-from .event import (
-    CreatorList as EventCreatorList,
-)
-from .event import (
-    Event,
-    EventListResponse,
-    EventResponse,
-)
-from .event import (
-    SeriesList as EventSeriesList,
-)
-from .event import (
-    StoryList as EventStoryList,
-)
-from .series import (
-    CharacterList as SeriesCharacterList,
-)
-from .series import (
-    ComicList as SeriesComicList,
-)
-from .series import (
-    CreatorList as SeriesCreatorList,
-)
-from .series import (
-    EventList as SeriesEventList,
-)
-from .series import (
-    Series,
-    SeriesListResponse,
-    SeriesResponse,
-)
-from .series import (
-    StoryList as SeriesStoryList,
-)
-from .story import (
-    CharacterList as StoryCharacterList,
-)
-from .story import (
-    ComicList as StoryComicList,
-)
-from .story import (
-    CreatorList as StoryCreatorList,
-)
-from .story import (
-    EventList as StoryEventList,
-)
-from .story import (
-    SeriesList as StorySeriesList,
-)
-from .story import (
-    Story,
-    StoryListResponse,
-    StoryResponse,
-)
+Models are loaded on first use (PEP 562), so importing a single model only
+imports the module that defines it. Exports are listed once, in the tables
+below; related-resource lists that share a name across modules are exported
+under a prefixed name through ``_RENAMED_EXPORTS``.
+"""
 
-__all__ = [
-    "URL",
-    "BaseListResponse",
-    # Base models
-    "BaseModel",
-    "BaseResponse",
-    # Character models
-    "Character",
-    "CharacterList",
-    "CharacterListResponse",
-    "CharacterResponse",
-    "CharacterSummary",
-    # Comic models
-    "Comic",
-    "ComicEventList",
-    "ComicList",
-    "ComicListResponse",
-    "ComicResponse",
-    "ComicStoryList",
-    "ComicSummary",
-    # Creator models
-    "Creator",
-    "CreatorCharacterList",
-    "CreatorComicList",
-    "CreatorEventList",
-    "CreatorList",
-    "CreatorListResponse",
-    "CreatorResponse",
-    "CreatorSeriesList",
-    "CreatorStoryList",
-    "CreatorSummary",
-    "DataContainer",
-    "Date",
-    # Event models
-    "Event",
-    "EventCharacterList",
-    "EventComicList",
-    "EventCreatorList",
-    "EventList",
-    "EventListResponse",
-    "EventResponse",
-    "EventSeriesList",
-    "EventStoryList",
-    "EventSummary",
-    # Common types
-    "Image",
-    "Price",
-    # Series models
-    "Series",
-    "SeriesCharacterList",
-    "SeriesComicList",
-    "SeriesCreatorList",
-    "SeriesEventList",
-    "SeriesList",
-    "SeriesListResponse",
-    "SeriesResponse",
-    "SeriesStoryList",
-    "SeriesSummary",
-    # Story models
-    "Story",
-    "StoryCharacterList",
-    "StoryComicList",
-    "StoryCreatorList",
-    "StoryEventList",
-    "StoryList",
-    "StoryListResponse",
-    "StoryResponse",
-    "StorySeriesList",
-    "StorySummary",
-    "TextObject",
-]
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+# Names exported unchanged, by defining module.
+_MODULE_EXPORTS: Dict[str, Tuple[str, ...]] = {
+    "_descriptions": ("generate_json_schema",),
+    "base": (
+        "BaseListResponse",
+        "BaseModel",
+        "BaseResponse",
+        "DataContainer",
+        "FrozenModel",
+        "LazyField",
+    ),
+    "character": (
+        "Character",
+        "CharacterListResponse",
+        "CharacterResponse",
+        "ComicList",
+        "EventList",
+        "SeriesList",
+        "StoryList",
+    ),
+    "comic": (
+        "CharacterList",
+        "Comic",
+        "ComicBatch",
+        "ComicListBody",
+        "ComicListResponse",
+        "ComicResponse",
+        "CreatorList",
+        "dump_comic_list",
+        "parse_comic",
+        "parse_comic_list",
+    ),
+    "common": (
+        "URL",
+        "CharacterSummary",
+        "ComicSummary",
+        "CreatorSummary",
+        "Date",
+        "EventSummary",
+        "Image",
+        "Price",
+        "SeriesSummary",
+        "StorySummary",
+        "SummaryList",
+        "TextObject",
+    ),
+    "creator": (
+        "Creator",
+        "CreatorBatch",
+        "CreatorListResponse",
+        "CreatorResponse",
+    ),
+    "event": (
+        "Event",
+        "EventBatch",
+        "EventListResponse",
+        "EventResponse",
+    ),
+    "series": (
+        "Series",
+        "SeriesListResponse",
+        "SeriesResponse",
+        "iter_series",
+    ),
+    "story": (
+        "Story",
+        "StoryListResponse",
+        "StoryResponse",
+        "iter_stories",
+    ),
+}
+
+# Public name -> (defining module, name in that module).
+_RENAMED_EXPORTS: Dict[str, Tuple[str, str]] = {
+    "ComicEventList": ("comic", "EventList"),
+    "ComicStoryList": ("comic", "StoryList"),
+    "CreatorCharacterList": ("creator", "CharacterList"),
+    "CreatorComicList": ("creator", "ComicList"),
+    "CreatorEventList": ("creator", "EventList"),
+    "CreatorSeriesList": ("creator", "SeriesList"),
+    "CreatorStoryList": ("creator", "StoryList"),
+    "EventCharacterList": ("event", "CharacterList"),
+    "EventComicList": ("event", "ComicList"),
+    "EventCreatorList": ("event", "CreatorList"),
+    "EventSeriesList": ("event", "SeriesList"),
+    "EventStoryList": ("event", "StoryList"),
+    "SeriesCharacterList": ("series", "CharacterList"),
+    "SeriesComicList": ("series", "ComicList"),
+    "SeriesCreatorList": ("series", "CreatorList"),
+    "SeriesEventList": ("series", "EventList"),
+    "SeriesStoryList": ("series", "StoryList"),
+    "StoryCharacterList": ("story", "CharacterList"),
+    "StoryComicList": ("story", "ComicList"),
+    "StoryCreatorList": ("story", "CreatorList"),
+    "StoryEventList": ("story", "EventList"),
+    "StorySeriesList": ("story", "SeriesList"),
+}
+
+_EXPORTS: Dict[str, Tuple[str, str]] = {
+    name: (module, name) for module, names in _MODULE_EXPORTS.items() for name in names
+}
+_EXPORTS.update(_RENAMED_EXPORTS)
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attribute = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module_name}", __name__), attribute)
+    globals()[name] = value  # Later lookups skip __getattr__ entirely
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    from ._descriptions import generate_json_schema
+    from .base import (
+        BaseListResponse,
+        BaseModel,
+        BaseResponse,
+        DataContainer,
+        FrozenModel,
+        LazyField,
+    )
+    from .character import (
+        Character,
+        CharacterListResponse,
+        CharacterResponse,
+        ComicList,
+        EventList,
+        SeriesList,
+        StoryList,
+    )
+    from .comic import (
+        CharacterList,
+        Comic,
+        ComicBatch,
+        ComicListBody,
+        ComicListResponse,
+        ComicResponse,
+        CreatorList,
+        dump_comic_list,
+        parse_comic,
+        parse_comic_list,
+    )
+    from .comic import (
+        EventList as ComicEventList,
+    )
+    from .comic import (
+        StoryList as ComicStoryList,
+    )
+    from .common import (
+        URL,
+        CharacterSummary,
+        ComicSummary,
+        CreatorSummary,
+        Date,
+        EventSummary,
+        Image,
+        Price,
+        SeriesSummary,
+        StorySummary,
+        SummaryList,
+        TextObject,
+    )
+    from .creator import (
+        CharacterList as CreatorCharacterList,
+    )
+    from .creator import (
+        ComicList as CreatorComicList,
+    )
+    from .creator import (
+        Creator,
+        CreatorBatch,
+        CreatorListResponse,
+        CreatorResponse,
+    )
+    from .creator import (
+        EventList as CreatorEventList,
+    )
+    from .creator import (
+        SeriesList as CreatorSeriesList,
+    )
+    from .creator import (
+        StoryList as CreatorStoryList,
+    )
+    from .event import (
+        CharacterList as EventCharacterList,
+    )
+    from .event import (
+        ComicList as EventComicList,
+    )
+    from .event import (
+        CreatorList as EventCreatorList,
+    )
+    from .event import (
+        Event,
+        EventBatch,
+        EventListResponse,
+        EventResponse,
+    )
+    from .event import (
+        SeriesList as EventSeriesList,
+    )
+    from .event import (
+        StoryList as EventStoryList,
+    )
+    from .series import (
+        CharacterList as SeriesCharacterList,
+    )
+    from .series import (
+        ComicList as SeriesComicList,
+    )
+    from .series import (
+        CreatorList as SeriesCreatorList,
+    )
+    from .series import (
+        EventList as SeriesEventList,
+    )
+    from .series import (
+        Series,
+        SeriesListResponse,
+        SeriesResponse,
+        iter_series,
+    )
+    from .series import (
+        StoryList as SeriesStoryList,
+    )
+    from .story import (
+        CharacterList as StoryCharacterList,
+    )
+    from .story import (
+        ComicList as StoryComicList,
+    )
+    from .story import (
+        CreatorList as StoryCreatorList,
+    )
+    from .story import (
+        EventList as StoryEventList,
+    )
+    from .story import (
+        SeriesList as StorySeriesList,
+    )
+    from .story import (
+        Story,
+        StoryListResponse,
+        StoryResponse,
+        iter_stories,
+    )
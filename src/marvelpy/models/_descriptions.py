@@ -0,0 +1,105 @@
+"""Field descriptions for Marvel API data models.
+
+Field descriptions are only needed when exporting a JSON schema, so they are
+kept out of the model definitions (where pydantic would store them on every
+``FieldInfo``) and attached on demand by :func:`generate_json_schema`.
+"""
+
+from typing import Any, Dict, Type
+
+from pydantic import BaseModel
+from pydantic.json_schema import GenerateJsonSchema, JsonSchemaValue
+from pydantic_core import core_schema
+
+# Keyed by model class name, then by Python field name.
+FIELD_DESCRIPTIONS: Dict[str, Dict[str, str]] = {
+    "BaseResponse": {
+        "code": "HTTP status code",
+        "status": "Status message",
+        "copyright": "Copyright notice",
+        "attribution_text": "Attribution text",
+        "attribution_html": "Attribution HTML",
+        "etag": "ETag for caching",
+        "data": "Response data",
+    },
+    "BaseListResponse": {
+        "code": "HTTP status code",
+        "status": "Status message",
+        "copyright": "Copyright notice",
+        "attribution_text": "Attribution text",
+        "attribution_html": "Attribution HTML",
+        "etag": "ETag for caching",
+        "data": "Response data container",
+    },
+    "DataContainer": {
+        "offset": "Number of skipped results",
+        "limit": "Maximum number of results returned",
+        "total": "Total number of results available",
+        "count": "Number of results returned in this response",
+        "results": "List of results",
+    },
+    "Character": {
+        "id": "Unique identifier for the character",
+        "name": "Name of the character",
+        "description": "Description of the character",
+        "modified": "Date the character was last modified",
+        "resource_uri": "URI of the character resource",
+        "urls": "List of URLs associated with the character",
+        "thumbnail": "Character thumbnail image",
+        "comics": "Comics featuring this character",
+        "stories": "Stories featuring this character",
+        "events": "Events featuring this character",
+        "series": "Series featuring this character",
+    },
+    "CharacterListResponse": {
+        "data": "Character data container",
+    },
+    "CharacterResponse": {
+        "data": "Character data",
+    },
+}
+
+
+def _lookup_description(model: Type[BaseModel], field_name: str) -> Any:
+    """Find the description for a field, searching the model's bases in order."""
+    origin = model.__pydantic_generic_metadata__["origin"] or model
+    for klass in origin.__mro__:
+        description = FIELD_DESCRIPTIONS.get(klass.__name__, {}).get(field_name)
+        if description is not None:
+            return description
+    return None
+
+
+class _DescribedJsonSchema(GenerateJsonSchema):
+    """JSON schema generator that fills in descriptions from FIELD_DESCRIPTIONS."""
+
+    def model_schema(self, schema: core_schema.ModelSchema) -> JsonSchemaValue:
+        json_schema = super().model_schema(schema)
+        model = schema["cls"]
+        properties = json_schema.get("properties", {})
+        for name, field in model.model_fields.items():
+            key = field.validation_alias if isinstance(field.validation_alias, str) else name
+            prop = properties.get(key)
+            if prop is None or "description" in prop:
+                continue
+            description = _lookup_description(model, name)
+            if description is not None:
+                prop["description"] = description
+        return json_schema
+
+
+def generate_json_schema(model: Type[BaseModel]) -> Dict[str, Any]:
+    """Generate a JSON schema for a Marvel API model, including field descriptions.
+
+    Args:
+        model: The model class to generate a schema for
+
+    Returns:
+        The JSON schema as a dictionary
+
+    Example:
+        >>> schema = generate_json_schema(Character)
+        >>> schema["properties"]["name"]["description"]
+        'Name of the character'
+    """
+    return model.model_json_schema(schema_generator=_DescribedJsonSchema)
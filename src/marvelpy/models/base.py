@@ -1,13 +1,155 @@
 """Base model classes for Marvel API responses."""
 
-from typing import Generic, List, TypeVar
+import sys
+from functools import lru_cache, partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
 
 from pydantic import BaseModel as PydanticBaseModel
-from pydantic import ConfigDict, Field
+from pydantic import (
+    ConfigDict,
+    Field,
+    GetCoreSchemaHandler,
+    GetJsonSchemaHandler,
+    TypeAdapter,
+    field_validator,
+)
+from pydantic.json_schema import JsonSchemaValue
+from pydantic_core import core_schema
+from typing_extensions import Self
+
+if TYPE_CHECKING:
+    import httpx
+
+try:
+    from pydantic_core import from_json as _from_json
+except ImportError:  # pragma: no cover - pydantic-core releases before from_json
+    from json import loads as _from_json  # type: ignore[assignment]
+
+# Parses in Rust and reuses string objects for repeated keys and values. Public
+# so the model modules and error handling share one JSON parser.
+parse_json: Callable[[Union[str, bytes]], Any] = _from_json
 
 T = TypeVar("T")
 
 
+class LazyField:
+    """Marker that defers validation of a nested field until it is first read.
+
+    Annotating a field with ``LazyField()`` stores the raw payload as-is during
+    model validation. The value is validated against the annotated type the
+    first time the attribute is accessed, and the result replaces the raw
+    payload so later reads return it without validating again. Serialization
+    validates any still-raw payload first, so dumps look the same as for an
+    eager field.
+
+    Validation errors in a lazy field are raised on first access rather than
+    when the enclosing model is built. Strict validation (``strict=True``)
+    checks lazy fields eagerly like any other field, so malformed payloads
+    are still rejected where the model is parsed.
+
+    Example:
+        >>> class Character(BaseModel):
+        ...     name: str
+        ...     comics: Annotated[ComicList, LazyField()]
+        >>> character = Character.model_validate(payload)  # comics not validated yet
+        >>> character.comics.available  # validated here, then cached
+        100
+    """
+
+    def __init__(self) -> None:
+        self._inner_schema: Optional[core_schema.CoreSchema] = None
+
+    def __get_pydantic_core_schema__(
+        self, source_type: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        self._inner_schema = handler(source_type)
+        adapter = _LazyAdapter(source_type)
+
+        def serialize(value: Any, nxt: core_schema.SerializerFunctionWrapHandler) -> Any:
+            return nxt(adapter.validate(value))
+
+        return core_schema.lax_or_strict_schema(
+            lax_schema=core_schema.any_schema(),
+            strict_schema=self._inner_schema,
+            serialization=core_schema.wrap_serializer_function_ser_schema(
+                serialize, schema=self._inner_schema
+            ),
+        )
+
+    def __get_pydantic_json_schema__(
+        self, schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler
+    ) -> JsonSchemaValue:
+        if self._inner_schema is None:
+            return handler(schema)
+        return handler(self._inner_schema)
+
+
+class _LazyAdapter:
+    """Validates raw payloads for a lazy field, building its TypeAdapter on first use."""
+
+    def __init__(self, annotation: Any) -> None:
+        self._annotation = annotation
+        self._adapter: Optional[TypeAdapter[Any]] = None
+
+    def validate(self, value: Any) -> Any:
+        if self._adapter is None:
+            self._adapter = TypeAdapter(self._annotation)
+        return self._adapter.validate_python(value)
+
+
+class _LazyFieldDescriptor:
+    """Class attribute installed for each ``LazyField`` to validate on first read."""
+
+    def __init__(self, name: str, annotation: Any) -> None:
+        self._name = name
+        self._adapter = _LazyAdapter(annotation)
+
+    def __get__(self, instance: Any, owner: Any = None) -> Any:
+        if instance is None:
+            # Behave like any other pydantic field, which is not a class attribute.
+            # Otherwise subclasses would pick the descriptor up as a default.
+            raise AttributeError(self._name)
+        values: Dict[str, Any] = instance.__dict__
+        try:
+            value = values[self._name]
+        except KeyError:
+            raise AttributeError(self._name) from None
+        try:
+            loaded: Dict[str, Any] = instance.__lazy_loaded__
+        except AttributeError:
+            loaded = {}
+            _object_setattr(instance, "__lazy_loaded__", loaded)
+        else:
+            if loaded.get(self._name) is value:
+                return value
+        validated = self._adapter.validate(value)
+        values[self._name] = validated
+        # Remember the validated object itself: a later assignment or copy
+        # stores a different object, which is then validated again.
+        loaded[self._name] = validated
+        return validated
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        # Only reached if pydantic's own __setattr__ is bypassed; keep the raw
+        # value and let the next read validate it.
+        instance.__dict__[self._name] = value
+
+
 class BaseModel(PydanticBaseModel):  # type: ignore[misc]
     """Base model class for all Marvel API data models.
 
@@ -15,8 +157,13 @@ class BaseModel(PydanticBaseModel):  # type: ignore[misc]
     including field validation, extra field handling, and enum value processing.
 
     Configuration:
-        - extra="allow": Allows additional fields from the API that aren't defined
-          in the model schema, ensuring compatibility with API changes
+        - extra="ignore": Drops fields from the API that aren't defined in the
+          model schema, so new API fields never break parsing. Models whose
+          payloads are still in flux can opt back in with
+          ``model_config = ConfigDict(extra="allow")``
+        - populate_by_name=True: Accepts fields by their Python name as well as
+          by the camelCase name the API uses (e.g. ``resource_uri`` or
+          ``resourceURI``)
         - validate_assignment=True: Validates field assignments after model creation
           to maintain data integrity
         - use_enum_values=True: Uses enum values instead of enum objects for
@@ -26,17 +173,212 @@ class BaseModel(PydanticBaseModel):  # type: ignore[misc]
         >>> class Character(BaseModel):
         ...     name: str
         ...     id: int
-        >>> char = Character(name="Iron Man", id=1009368, extra_field="allowed")
+        >>> char = Character(name="Iron Man", id=1009368, extra_field="ignored")
         >>> char.name
         'Iron Man'
+        >>> hasattr(char, "extra_field")
+        False
     """
 
     model_config = ConfigDict(
-        extra="allow",  # Allow extra fields from API
+        extra="ignore",  # Tolerate, but don't store, unknown API fields
+        populate_by_name=True,
         validate_assignment=True,
         use_enum_values=True,
     )
 
+    # Validated lazy field values by name, set on the first lazy read.
+    __slots__ = ("__lazy_loaded__",)
+
+    # Names of fields declared with LazyField, filled in per subclass.
+    __lazy_fields__: ClassVar[Tuple[str, ...]] = ()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        lazy_fields = tuple(
+            name
+            for name, field in cls.model_fields.items()
+            if any(isinstance(item, LazyField) for item in field.metadata)
+        )
+        for name in lazy_fields:
+            setattr(cls, name, _LazyFieldDescriptor(name, cls.model_fields[name].annotation))
+        cls.__lazy_fields__ = lazy_fields
+
+    def __eq__(self, other: Any) -> bool:
+        # Compare validated values, not a raw payload against its parsed model.
+        if isinstance(other, BaseModel):
+            self._load_lazy_fields()
+            other._load_lazy_fields()
+        return super().__eq__(other)
+
+    def _load_lazy_fields(self) -> None:
+        """Validate any lazy fields that are still holding raw payloads."""
+        for name in self.__lazy_fields__:
+            getattr(self, name)
+
+    def to_bytes(self) -> bytes:
+        """Serialize this model to JSON bytes using the API's field names.
+
+        Calls the model's compiled serializer directly, skipping the argument
+        handling of ``model_dump_json``. The output can be parsed back with
+        ``from_json`` or ``model_validate_json``.
+
+        Returns:
+            UTF-8 encoded JSON
+
+        Example:
+            >>> Image(path="http://i.annihil.us/u/prod/marvel/i/mg/c", extension="jpg").to_bytes()
+            b'{"path":"http://i.annihil.us/u/prod/marvel/i/mg/c","extension":"jpg"}'
+        """
+        return self.__pydantic_serializer__.to_json(self, by_alias=True)
+
+    @classmethod
+    def trusted_construct(cls, raw: Dict[str, Any]) -> Self:
+        """Build a model from trusted Marvel API data without validating it.
+
+        Keys may be the API's camelCase names or the Python field names, and
+        nested models (including lists and tuples of models) are built the
+        same way. Nothing is type-checked or coerced and no validators run,
+        so strings are not interned and values are not pooled. This is
+        several times faster than ``model_validate`` but unsafe for untrusted
+        input: only use it for data that was validated before, such as a
+        cache of ``model_dump(by_alias=True)`` output. Unknown keys are dropped.
+
+        Args:
+            raw: Field values keyed by API or Python field name
+
+        Returns:
+            Model instance built from ``raw`` as-is
+
+        Example:
+            >>> cached = comic.model_dump(by_alias=True)
+            >>> Comic.trusted_construct(cached) == comic
+            True
+        """
+        plan = _construct_plan(cls)
+        values: Dict[str, Any] = {}
+        for key, value in raw.items():
+            entry = plan.get(key)
+            if entry is not None:
+                name, build = entry
+                values[name] = value if build is None else build(value)
+        defaults = _construct_defaults(cls)
+        if defaults is None:
+            return cls.model_construct(**values)
+        fields_set = set(values)
+        if len(fields_set) < len(cls.model_fields):
+            for name, default in defaults:
+                if name not in fields_set:
+                    values[name] = default()
+        # Same instance state model_construct produces, without its generic
+        # per-field alias and default handling.
+        instance = cls.__new__(cls)
+        _object_setattr(instance, "__dict__", values)
+        _object_setattr(instance, "__pydantic_fields_set__", fields_set)
+        _object_setattr(
+            instance, "__pydantic_extra__", {} if cls.model_config.get("extra") == "allow" else None
+        )
+        _object_setattr(instance, "__pydantic_private__", None)
+        return instance
+
+
+_Builder = Callable[..., Any]
+
+# Defaults that can be shared between instances without copying.
+_IMMUTABLE_DEFAULTS = (type(None), bool, int, float, str, bytes, tuple, frozenset)
+
+_object_setattr = object.__setattr__
+
+
+@lru_cache(maxsize=None)
+def _construct_plan(model: Type[BaseModel]) -> Dict[str, Tuple[str, Optional[_Builder]]]:
+    """Map every accepted input key of ``model`` to its field name and nested builder."""
+    plan: Dict[str, Tuple[str, Optional[_Builder]]] = {}
+    for name, field in model.model_fields.items():
+        entry = (name, _nested_builder(field.annotation))
+        plan[name] = entry
+        if isinstance(field.validation_alias, str):
+            plan[field.validation_alias] = entry
+    return plan
+
+
+@lru_cache(maxsize=None)
+def _construct_defaults(model: Type[BaseModel]) -> Optional[Tuple[Tuple[str, _Builder], ...]]:
+    """Return a default-value maker per optional field, or None to use model_construct.
+
+    Models with private attributes or a ``model_post_init`` hook need the
+    extra set-up ``model_construct`` does, so they get no fast path.
+    """
+    if (
+        model.__private_attributes__
+        or model.model_post_init is not PydanticBaseModel.model_post_init
+    ):
+        return None
+    defaults: List[Tuple[str, _Builder]] = []
+    for name, field in model.model_fields.items():
+        if field.is_required():
+            continue
+        if field.default_factory is None and isinstance(field.default, _IMMUTABLE_DEFAULTS):
+            defaults.append((name, lambda default=field.default: default))
+        else:
+            defaults.append((name, partial(field.get_default, call_default_factory=True)))
+    return tuple(defaults)
+
+
+def _nested_builder(annotation: Any) -> Optional[_Builder]:
+    """Return a function building nested models for ``annotation``, if it has any."""
+    origin = get_origin(annotation)
+    if origin is Union:
+        members = [arg for arg in get_args(annotation) if arg is not type(None)]
+        inner = _nested_builder(members[0]) if len(members) == 1 else None
+        if inner is None:
+            return None
+        return lambda value: None if value is None else inner(value)
+    if origin in (list, tuple):
+        args = get_args(annotation)
+        item = _nested_builder(args[0]) if args else None
+        container: Callable[[Any], Any] = tuple if origin is tuple else list
+        if item is None:
+            return container if origin is tuple else None
+        return lambda values: container(item(value) for value in values)
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        model = annotation
+        return lambda value: model.trusted_construct(value) if isinstance(value, dict) else value
+    return None
+
+
+class FrozenModel(BaseModel):
+    """Base class for immutable Marvel API value objects.
+
+    Summaries, images, prices and the other small objects nested inside API
+    responses are never modified after parsing. Freezing them skips
+    assignment validation entirely and lets identical values be hashed and
+    shared safely.
+
+    Configuration:
+        - frozen=True: Instances are immutable; assigning to a field raises
+          a ValidationError
+
+    Example:
+        >>> class Image(FrozenModel):
+        ...     path: str
+        ...     extension: str
+        >>> image = Image(path="http://i.annihil.us/u/prod/marvel/i/mg/9/c0/527bb7b37ff55", extension="jpg")
+        >>> image.extension = "png"
+        Traceback (most recent call last):
+        ...
+        pydantic_core._pydantic_core.ValidationError: 1 validation error for Image
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    def __hash__(self) -> int:
+        # Hash validated values, matching __eq__; raw lazy payloads are dicts.
+        self._load_lazy_fields()
+        values = self.__dict__
+        return hash((type(self), tuple(values[name] for name in type(self).model_fields)))
+
 
 class BaseResponse(BaseModel, Generic[T]):
     """Base response wrapper for single Marvel API items.
@@ -68,13 +410,68 @@ class BaseResponse(BaseModel, Generic[T]):
         'Iron Man'
     """
 
-    code: int = Field(..., description="HTTP status code")
-    status: str = Field(..., description="Status message")
-    copyright: str = Field(..., description="Copyright notice")
-    attribution_text: str = Field(..., alias="attributionText", description="Attribution text")
-    attribution_html: str = Field(..., alias="attributionHTML", description="Attribution HTML")
-    etag: str = Field(..., description="ETag for caching")
-    data: T = Field(..., description="Response data")
+    code: int
+    status: str
+    copyright: str
+    attribution_text: str = Field(
+        ..., validation_alias="attributionText", serialization_alias="attributionText"
+    )
+    attribution_html: str = Field(
+        ..., validation_alias="attributionHTML", serialization_alias="attributionHTML"
+    )
+    etag: str
+    data: T
+
+    @field_validator("copyright", "attribution_text", "attribution_html")
+    @classmethod
+    def _intern_attribution(cls, value: str) -> str:
+        """Intern attribution text, which Marvel repeats on every response."""
+        return sys.intern(value)
+
+    @classmethod
+    def from_json(
+        cls, data: bytes, *, strict: Optional[bool] = None, trust_source: bool = False
+    ) -> Self:
+        """Parse a raw JSON body into this response model.
+
+        The bytes are handed straight to pydantic-core, which parses and
+        validates them in a single pass without building an intermediate
+        Python dictionary.
+
+        Args:
+            data: Raw JSON response body
+            strict: Validate in strict mode, rejecting any value that would
+                need type coercion (e.g. a numeric string for an ``int``)
+            trust_source: Skip validation and build the model with
+                :meth:`trusted_construct`. Only for bodies known to match the
+                model, such as previously validated responses read from a cache
+
+        Returns:
+            Validated response model
+
+        Raises:
+            pydantic.ValidationError: If the body is not valid JSON or does not
+                match the model
+        """
+        if trust_source:
+            return cls.trusted_construct(parse_json(data))
+        return cls.model_validate_json(data, strict=strict)
+
+    @classmethod
+    def from_response(cls, response: "httpx.Response") -> Self:
+        """Parse an HTTP response body into this response model.
+
+        Args:
+            response: HTTP response returned by the Marvel API
+
+        Returns:
+            Validated response model
+
+        Raises:
+            pydantic.ValidationError: If the body is not valid JSON or does not
+                match the model
+        """
+        return cls.from_json(response.content)
 
 
 class BaseListResponse(BaseModel, Generic[T]):
@@ -113,13 +510,64 @@ class BaseListResponse(BaseModel, Generic[T]):
         'Iron Man'
     """
 
-    code: int = Field(..., description="HTTP status code")
-    status: str = Field(..., description="Status message")
-    copyright: str = Field(..., description="Copyright notice")
-    attribution_text: str = Field(..., alias="attributionText", description="Attribution text")
-    attribution_html: str = Field(..., alias="attributionHTML", description="Attribution HTML")
-    etag: str = Field(..., description="ETag for caching")
-    data: "DataContainer[T]" = Field(..., description="Response data container")
+    code: int
+    status: str
+    copyright: str
+    attribution_text: str = Field(
+        ..., validation_alias="attributionText", serialization_alias="attributionText"
+    )
+    attribution_html: str = Field(
+        ..., validation_alias="attributionHTML", serialization_alias="attributionHTML"
+    )
+    etag: str
+    data: "DataContainer[T]"
+
+    @field_validator("copyright", "attribution_text", "attribution_html")
+    @classmethod
+    def _intern_attribution(cls, value: str) -> str:
+        """Intern attribution text, which Marvel repeats on every response."""
+        return sys.intern(value)
+
+    @classmethod
+    def from_json(
+        cls, data: bytes, *, strict: Optional[bool] = None, trust_source: bool = False
+    ) -> Self:
+        """Parse a raw JSON body into this list response model.
+
+        Args:
+            data: Raw JSON response body
+            strict: Validate in strict mode, rejecting any value that would
+                need type coercion
+            trust_source: Skip validation and build the model with
+                :meth:`trusted_construct`. Only for bodies known to match the
+                model, such as previously validated responses read from a cache
+
+        Returns:
+            Validated list response model
+
+        Raises:
+            pydantic.ValidationError: If the body is not valid JSON or does not
+                match the model
+        """
+        if trust_source:
+            return cls.trusted_construct(parse_json(data))
+        return cls.model_validate_json(data, strict=strict)
+
+    @classmethod
+    def from_response(cls, response: "httpx.Response") -> Self:
+        """Parse an HTTP response body into this list response model.
+
+        Args:
+            response: HTTP response returned by the Marvel API
+
+        Returns:
+            Validated list response model
+
+        Raises:
+            pydantic.ValidationError: If the body is not valid JSON or does not
+                match the model
+        """
+        return cls.from_json(response.content)
 
 
 class DataContainer(BaseModel, Generic[T]):
@@ -152,8 +600,8 @@ class DataContainer(BaseModel, Generic[T]):
         True  # if total > offset + count
     """
 
-    offset: int = Field(..., description="Number of skipped results")
-    limit: int = Field(..., description="Maximum number of results returned")
-    total: int = Field(..., description="Total number of results available")
-    count: int = Field(..., description="Number of results returned in this response")
-    results: List[T] = Field(..., description="List of results")
+    offset: int
+    limit: int
+    total: int
+    count: int
+    results: List[T]
@@ -1,16 +1,18 @@
 """Character data models for Marvel API.
 
 This module contains data models for Marvel characters, including the main
-Character model and related list structures. Characters are one of the
+Character model and its related-resource collections. Characters are one of the
 primary entities in the Marvel API, representing superheroes, villains,
 and other characters from the Marvel universe.
 """
 
-from typing import List, Optional
+import weakref
+from typing import Optional, Tuple
 
-from pydantic import Field
+from pydantic import Field, model_validator
+from typing_extensions import Annotated
 
-from .base import BaseListResponse, BaseModel, BaseResponse, DataContainer
+from .base import BaseListResponse, BaseResponse, DataContainer, FrozenModel, LazyField
 from .common import (
     URL,
     ComicSummary,
@@ -18,142 +20,17 @@ from .common import (
     Image,
     SeriesSummary,
     StorySummary,
+    SummaryList,
 )
 
+# Related-resource collections embedded in a character.
+ComicList = SummaryList[ComicSummary]
+StoryList = SummaryList[StorySummary]
+EventList = SummaryList[EventSummary]
+SeriesList = SummaryList[SeriesSummary]
 
-class ComicList(BaseModel):
-    """Comic list for character.
 
-    Represents a collection of comics featuring a specific character,
-    including pagination metadata and a list of comic summaries.
-
-    Attributes:
-        available: Number of comics available for this character
-        returned: Number of comics returned in this response
-        collection_uri: URI of the comics collection for this character
-        items: List of comic summaries featuring this character
-
-    Example:
-        >>> comic_list = ComicList(
-        ...     available=100,
-        ...     returned=20,
-        ...     collectionURI="http://gateway.marvel.com/v1/public/characters/1009368/comics",
-        ...     items=[ComicSummary(resourceURI="...", name="Avengers #1")]
-        ... )
-        >>> comic_list.available
-        100
-        >>> len(comic_list.items)
-        1
-    """
-
-    available: int = Field(..., description="Number of comics available")
-    returned: int = Field(..., description="Number of comics returned")
-    collection_uri: str = Field(
-        ..., alias="collectionURI", description="URI of the comics collection"
-    )
-    items: List[ComicSummary] = Field(default_factory=list, description="List of comic summaries")
-
-
-class StoryList(BaseModel):
-    """Story list for character.
-
-    Represents a collection of stories featuring a specific character,
-    including pagination metadata and a list of story summaries.
-
-    Attributes:
-        available: Number of stories available for this character
-        returned: Number of stories returned in this response
-        collection_uri: URI of the stories collection for this character
-        items: List of story summaries featuring this character
-
-    Example:
-        >>> story_list = StoryList(
-        ...     available=50,
-        ...     returned=10,
-        ...     collectionURI="http://gateway.marvel.com/v1/public/characters/1009368/stories",
-        ...     items=[StorySummary(resourceURI="...", name="Cover #1", type="cover")]
-        ... )
-        >>> story_list.available
-        50
-        >>> len(story_list.items)
-        1
-    """
-
-    available: int = Field(..., description="Number of stories available")
-    returned: int = Field(..., description="Number of stories returned")
-    collection_uri: str = Field(
-        ..., alias="collectionURI", description="URI of the stories collection"
-    )
-    items: List[StorySummary] = Field(default_factory=list, description="List of story summaries")
-
-
-class EventList(BaseModel):
-    """Event list for character.
-
-    Represents a collection of events featuring a specific character,
-    including pagination metadata and a list of event summaries.
-
-    Attributes:
-        available: Number of events available for this character
-        returned: Number of events returned in this response
-        collection_uri: URI of the events collection for this character
-        items: List of event summaries featuring this character
-
-    Example:
-        >>> event_list = EventList(
-        ...     available=25,
-        ...     returned=5,
-        ...     collectionURI="http://gateway.marvel.com/v1/public/characters/1009368/events",
-        ...     items=[EventSummary(resourceURI="...", name="Secret Invasion")]
-        ... )
-        >>> event_list.available
-        25
-        >>> len(event_list.items)
-        1
-    """
-
-    available: int = Field(..., description="Number of events available")
-    returned: int = Field(..., description="Number of events returned")
-    collection_uri: str = Field(
-        ..., alias="collectionURI", description="URI of the events collection"
-    )
-    items: List[EventSummary] = Field(default_factory=list, description="List of event summaries")
-
-
-class SeriesList(BaseModel):
-    """Series list for character.
-
-    Represents a collection of series featuring a specific character,
-    including pagination metadata and a list of series summaries.
-
-    Attributes:
-        available: Number of series available for this character
-        returned: Number of series returned in this response
-        collection_uri: URI of the series collection for this character
-        items: List of series summaries featuring this character
-
-    Example:
-        >>> series_list = SeriesList(
-        ...     available=75,
-        ...     returned=15,
-        ...     collectionURI="http://gateway.marvel.com/v1/public/characters/1009368/series",
-        ...     items=[SeriesSummary(resourceURI="...", name="Avengers (1998 - 2004)")]
-        ... )
-        >>> series_list.available
-        75
-        >>> len(series_list.items)
-        1
-    """
-
-    available: int = Field(..., description="Number of series available")
-    returned: int = Field(..., description="Number of series returned")
-    collection_uri: str = Field(
-        ..., alias="collectionURI", description="URI of the series collection"
-    )
-    items: List[SeriesSummary] = Field(default_factory=list, description="List of series summaries")
-
-
-class Character(BaseModel):
+class Character(FrozenModel):
     """Character data model for Marvel API.
 
     Represents a Marvel character with all associated information including
@@ -174,6 +51,13 @@ class Character(BaseModel):
         events: Events featuring this character
         series: Series featuring this character
 
+    The ``comics``, ``stories``, ``events`` and ``series`` collections are
+    validated lazily on first access, so code that only reads a character's
+    basic details never pays for parsing them.
+
+    Characters are immutable, since list responses share one instance per
+    character; use ``model_copy(update=...)`` to derive a modified copy.
+
     Example:
         >>> character = Character(
         ...     id=1009368,
@@ -194,19 +78,45 @@ class Character(BaseModel):
         1009368
     """
 
-    id: int = Field(..., description="Unique identifier for the character")
-    name: str = Field(..., description="Name of the character")
-    description: str = Field(..., description="Description of the character")
-    modified: str = Field(..., description="Date the character was last modified")
-    resource_uri: str = Field(..., alias="resourceURI", description="URI of the character resource")
-    urls: List[URL] = Field(
-        default_factory=list, description="List of URLs associated with the character"
+    id: int
+    name: str
+    description: str
+    modified: str
+    resource_uri: str = Field(
+        ..., validation_alias="resourceURI", serialization_alias="resourceURI"
     )
-    thumbnail: Optional[Image] = Field(None, description="Character thumbnail image")
-    comics: ComicList = Field(..., description="Comics featuring this character")
-    stories: StoryList = Field(..., description="Stories featuring this character")
-    events: EventList = Field(..., description="Events featuring this character")
-    series: SeriesList = Field(..., description="Series featuring this character")
+    urls: Tuple[URL, ...] = ()
+    thumbnail: Optional[Image] = None
+    comics: Annotated[ComicList, LazyField()]
+    stories: Annotated[StoryList, LazyField()]
+    events: Annotated[EventList, LazyField()]
+    series: Annotated[SeriesList, LazyField()]
+
+
+# Live characters keyed by ID. Entries disappear as soon as the last response
+# holding a character is garbage collected, so the cache never pins memory.
+_CHARACTER_CACHE: "weakref.WeakValueDictionary[int, Character]" = weakref.WeakValueDictionary()
+
+
+def _dedupe_character(character: Character) -> Character:
+    """Return the shared instance for a character that has already been parsed.
+
+    The same character frequently appears across pages and related-resource
+    lookups. When a live instance with the same ID and ``modified`` timestamp
+    exists it is returned instead of the freshly parsed copy; otherwise the
+    given character becomes the shared instance.
+
+    Args:
+        character: Freshly validated character
+
+    Returns:
+        The canonical Character instance for this ID
+    """
+    cached = _CHARACTER_CACHE.get(character.id)
+    if cached is not None and cached.modified == character.modified:
+        return cached
+    _CHARACTER_CACHE[character.id] = character
+    return character
 
 
 class CharacterListResponse(BaseListResponse[Character]):
@@ -214,7 +124,8 @@ class CharacterListResponse(BaseListResponse[Character]):
 
     Represents a Marvel API response containing a list of characters
     with pagination metadata. This is the standard response format
-    for character list endpoints.
+    for character list endpoints. Characters that are already held by
+    another live response are shared rather than duplicated.
 
     Attributes:
         code: HTTP status code
@@ -245,7 +156,15 @@ class CharacterListResponse(BaseListResponse[Character]):
         'Iron Man'
     """
 
-    data: DataContainer[Character] = Field(..., description="Character data container")
+    data: DataContainer[Character]
+
+    @model_validator(mode="after")
+    def _share_characters(self) -> "CharacterListResponse":
+        """Replace parsed characters with their shared instances, if any."""
+        results = self.data.results
+        for index, character in enumerate(results):
+            results[index] = _dedupe_character(character)
+        return self
 
 
 class CharacterResponse(BaseResponse[Character]):
@@ -278,4 +197,4 @@ class CharacterResponse(BaseResponse[Character]):
         'Iron Man'
     """
 
-    data: Character = Field(..., description="Character data")
+    data: Character
@@ -1,16 +1,21 @@
 """Comic data models for Marvel API.
 
 This module contains data models for Marvel comics, including the main
-Comic model and related list structures. Comics are central entities
+Comic model and its related-resource collections. Comics are central entities
 in the Marvel API, representing individual comic book issues with
 detailed information about publication, creators, characters, and more.
 """
 
-from typing import List, Optional
+from array import array
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable, List, Optional, Tuple
 
-from pydantic import Field
+from pydantic import Field, TypeAdapter, field_validator
+from typing_extensions import Self
 
-from .base import BaseListResponse, BaseModel, BaseResponse, DataContainer
+from .base import BaseListResponse, BaseModel, BaseResponse, DataContainer, FrozenModel
 from .common import (
     URL,
     CharacterSummary,
@@ -22,147 +27,24 @@ from .common import (
     Price,
     SeriesSummary,
     StorySummary,
+    SummaryList,
     TextObject,
+    _make_image,
+    _make_price,
+    _make_url,
 )
 
+if TYPE_CHECKING:
+    import httpx
 
-class CharacterList(BaseModel):
-    """Character list for comic.
+# Related-resource collections embedded in a comic.
+CharacterList = SummaryList[CharacterSummary]
+CreatorList = SummaryList[CreatorSummary]
+StoryList = SummaryList[StorySummary]
+EventList = SummaryList[EventSummary]
 
-    Represents a collection of characters appearing in a specific comic,
-    including pagination metadata and a list of character summaries.
 
-    Attributes:
-        available: Number of characters available for this comic
-        returned: Number of characters returned in this response
-        collection_uri: URI of the characters collection for this comic
-        items: List of character summaries appearing in this comic
-
-    Example:
-        >>> character_list = CharacterList(
-        ...     available=10,
-        ...     returned=5,
-        ...     collectionURI="http://gateway.marvel.com/v1/public/comics/21366/characters",
-        ...     items=[CharacterSummary(resourceURI="...", name="Iron Man")]
-        ... )
-        >>> character_list.available
-        10
-        >>> len(character_list.items)
-        1
-    """
-
-    available: int = Field(..., description="Number of characters available")
-    returned: int = Field(..., description="Number of characters returned")
-    collection_uri: str = Field(
-        ..., alias="collectionURI", description="URI of the characters collection"
-    )
-    items: List[CharacterSummary] = Field(
-        default_factory=list, description="List of character summaries"
-    )
-
-
-class CreatorList(BaseModel):
-    """Creator list for comic.
-
-    Represents a collection of creators (writers, artists, etc.) who worked
-    on a specific comic, including pagination metadata and a list of creator summaries.
-
-    Attributes:
-        available: Number of creators available for this comic
-        returned: Number of creators returned in this response
-        collection_uri: URI of the creators collection for this comic
-        items: List of creator summaries who worked on this comic
-
-    Example:
-        >>> creator_list = CreatorList(
-        ...     available=5,
-        ...     returned=3,
-        ...     collectionURI="http://gateway.marvel.com/v1/public/comics/21366/creators",
-        ...     items=[CreatorSummary(resourceURI="...", name="Stan Lee", role="writer")]
-        ... )
-        >>> creator_list.available
-        5
-        >>> len(creator_list.items)
-        1
-    """
-
-    available: int = Field(..., description="Number of creators available")
-    returned: int = Field(..., description="Number of creators returned")
-    collection_uri: str = Field(
-        ..., alias="collectionURI", description="URI of the creators collection"
-    )
-    items: List[CreatorSummary] = Field(
-        default_factory=list, description="List of creator summaries"
-    )
-
-
-class StoryList(BaseModel):
-    """Story list for comic.
-
-    Represents a collection of stories contained in a specific comic,
-    including pagination metadata and a list of story summaries.
-
-    Attributes:
-        available: Number of stories available for this comic
-        returned: Number of stories returned in this response
-        collection_uri: URI of the stories collection for this comic
-        items: List of story summaries contained in this comic
-
-    Example:
-        >>> story_list = StoryList(
-        ...     available=3,
-        ...     returned=2,
-        ...     collectionURI="http://gateway.marvel.com/v1/public/comics/21366/stories",
-        ...     items=[StorySummary(resourceURI="...", name="Cover #1", type="cover")]
-        ... )
-        >>> story_list.available
-        3
-        >>> len(story_list.items)
-        1
-    """
-
-    available: int = Field(..., description="Number of stories available")
-    returned: int = Field(..., description="Number of stories returned")
-    collection_uri: str = Field(
-        ..., alias="collectionURI", description="URI of the stories collection"
-    )
-    items: List[StorySummary] = Field(default_factory=list, description="List of story summaries")
-
-
-class EventList(BaseModel):
-    """Event list for comic.
-
-    Represents a collection of events that a specific comic is part of,
-    including pagination metadata and a list of event summaries.
-
-    Attributes:
-        available: Number of events available for this comic
-        returned: Number of events returned in this response
-        collection_uri: URI of the events collection for this comic
-        items: List of event summaries that this comic is part of
-
-    Example:
-        >>> event_list = EventList(
-        ...     available=2,
-        ...     returned=1,
-        ...     collectionURI="http://gateway.marvel.com/v1/public/comics/21366/events",
-        ...     items=[EventSummary(resourceURI="...", name="Secret Invasion")]
-        ... )
-        >>> event_list.available
-        2
-        >>> len(event_list.items)
-        1
-    """
-
-    available: int = Field(..., description="Number of events available")
-    returned: int = Field(..., description="Number of events returned")
-    collection_uri: str = Field(
-        ..., alias="collectionURI", description="URI of the events collection"
-    )
-    items: List[EventSummary] = Field(default_factory=list, description="List of event summaries")
-
-
-class Comic(BaseModel):
+class Comic(FrozenModel):
     """Comic data model for Marvel API.
 
     Represents a Marvel comic with all associated information including
@@ -200,6 +82,7 @@ class Comic(BaseModel):
         characters: Characters appearing in this comic
         stories: Stories contained in this comic
         events: Events this comic is part of
+        modified_dt: ``modified`` parsed as a timezone-aware datetime (may be None)
 
     Example:
         >>> comic = Comic(
@@ -237,52 +120,183 @@ class Comic(BaseModel):
         'Avengers (1963) #1'
         >>> comic.issue_number
         1
+        >>> comic.modified_dt
+        datetime.datetime(2014, 4, 29, 14, 18, 17, tzinfo=datetime.timezone(datetime.timedelta(days=-1, seconds=72000)))
     """
 
     id: int = Field(..., description="Unique identifier for the comic")
-    digital_id: int = Field(..., alias="digitalId", description="Digital identifier for the comic")
+    digital_id: int = Field(
+        ...,
+        validation_alias="digitalId",
+        serialization_alias="digitalId",
+        description="Digital identifier for the comic",
+    )
     title: str = Field(..., description="Title of the comic")
-    issue_number: float = Field(..., alias="issueNumber", description="Issue number of the comic")
+    issue_number: float = Field(
+        ...,
+        validation_alias="issueNumber",
+        serialization_alias="issueNumber",
+        description="Issue number of the comic",
+    )
     variant_description: Optional[str] = Field(
-        None, alias="variantDescription", description="Description of variant covers"
+        None,
+        validation_alias="variantDescription",
+        serialization_alias="variantDescription",
+        description="Description of variant covers",
     )
     description: Optional[str] = Field(None, description="Description of the comic")
     modified: str = Field(..., description="Date the comic was last modified")
     isbn: str = Field(..., description="ISBN of the comic")
     upc: str = Field(..., description="UPC barcode of the comic")
-    diamond_code: str = Field(..., alias="diamondCode", description="Diamond distribution code")
+    diamond_code: str = Field(
+        ...,
+        validation_alias="diamondCode",
+        serialization_alias="diamondCode",
+        description="Diamond distribution code",
+    )
     ean: str = Field(..., description="EAN barcode of the comic")
     issn: str = Field(..., description="ISSN of the comic")
     format: str = Field(..., description="Format of the comic")
-    page_count: int = Field(..., alias="pageCount", description="Number of pages in the comic")
-    text_objects: List[TextObject] = Field(
-        ..., alias="textObjects", description="List of text objects"
+    page_count: int = Field(
+        ...,
+        validation_alias="pageCount",
+        serialization_alias="pageCount",
+        description="Number of pages in the comic",
     )
-    resource_uri: str = Field(..., alias="resourceURI", description="URI of the comic resource")
-    urls: List[URL] = Field(
-        default_factory=list, description="List of URLs associated with the comic"
+    text_objects: Tuple[TextObject, ...] = Field(
+        ...,
+        validation_alias="textObjects",
+        serialization_alias="textObjects",
+        description="List of text objects",
     )
-    series: SeriesSummary = Field(..., description="Series this comic belongs to")
-    variants: List["ComicSummary"] = Field(
-        default_factory=list, description="List of variant comics"
+    resource_uri: str = Field(
+        ...,
+        validation_alias="resourceURI",
+        serialization_alias="resourceURI",
+        description="URI of the comic resource",
     )
-    collections: List["ComicSummary"] = Field(
-        default_factory=list, description="List of collections this comic is part of"
+    urls: Tuple[URL, ...] = Field(default=(), description="List of URLs associated with the comic")
+    series: SeriesSummary = Field(..., description="Series this comic belongs to")
+    variants: Tuple[ComicSummary, ...] = Field(default=(), description="List of variant comics")
+    collections: Tuple[ComicSummary, ...] = Field(
+        default=(), description="List of collections this comic is part of"
     )
-    collected_issues: List["ComicSummary"] = Field(
-        ..., alias="collectedIssues", description="List of issues collected in this comic"
+    collected_issues: Tuple[ComicSummary, ...] = Field(
+        ...,
+        validation_alias="collectedIssues",
+        serialization_alias="collectedIssues",
+        description="List of issues collected in this comic",
     )
-    dates: List[Date] = Field(default_factory=list, description="List of important dates")
-    prices: List[Price] = Field(
-        default_factory=list, description="List of prices for different formats"
+    dates: Tuple[Date, ...] = Field(default=(), description="List of important dates")
+    prices: Tuple[Price, ...] = Field(
+        default=(), description="List of prices for different formats"
     )
     thumbnail: Optional[Image] = Field(None, description="Comic thumbnail image")
-    images: List[Image] = Field(default_factory=list, description="List of images for this comic")
+    images: Tuple[Image, ...] = Field(default=(), description="List of images for this comic")
     creators: CreatorList = Field(..., description="Creators who worked on this comic")
     characters: CharacterList = Field(..., description="Characters appearing in this comic")
     stories: StoryList = Field(..., description="Stories contained in this comic")
     events: EventList = Field(..., description="Events this comic is part of")
 
+    @field_validator("prices")
+    @classmethod
+    def _pool_prices(cls, prices: Tuple[Price, ...]) -> Tuple[Price, ...]:
+        return tuple(_make_price(price.type, price.price) for price in prices)
+
+    @field_validator("urls")
+    @classmethod
+    def _pool_urls(cls, urls: Tuple[URL, ...]) -> Tuple[URL, ...]:
+        return tuple(_make_url(url.type, url.url) for url in urls)
+
+    @field_validator("images")
+    @classmethod
+    def _pool_images(cls, images: Tuple[Image, ...]) -> Tuple[Image, ...]:
+        return tuple(_make_image(image.path, image.extension) for image in images)
+
+    @field_validator("thumbnail")
+    @classmethod
+    def _pool_thumbnail(cls, thumbnail: Optional[Image]) -> Optional[Image]:
+        if thumbnail is None:
+            return None
+        return _make_image(thumbnail.path, thumbnail.extension)
+
+    @property
+    def modified_dt(self) -> Optional[datetime]:
+        """Last-modified timestamp as a timezone-aware datetime.
+
+        Parsed timestamps are cached by value, since many comics share one.
+        Marvel uses placeholder values such as ``-0001-11-30T00:00:00-0500``
+        for comics with no known modification date; those yield None.
+        """
+        return _parse_modified(self.modified)
+
+
+@lru_cache(maxsize=4096)
+def _parse_modified(modified: str) -> Optional[datetime]:
+    try:
+        return datetime.strptime(modified, "%Y-%m-%dT%H:%M:%S%z")
+    except ValueError:
+        return None
+
+
+@dataclass(frozen=True)
+class ComicBatch:
+    """Column-oriented view of many comics for scanning and filtering.
+
+    Each attribute holds one field for every comic, in the same order.
+    Numeric columns are compact ``array.array`` buffers, so scans touch
+    only the bytes of the column being filtered instead of every Comic
+    object. They support the buffer protocol and can be wrapped without
+    copying, e.g. ``numpy.frombuffer(batch.page_counts, dtype=numpy.int64)``.
+
+    Attributes:
+        ids: Comic IDs
+        digital_ids: Digital identifiers
+        issue_numbers: Issue numbers
+        page_counts: Page counts
+        titles: Titles
+        formats: Formats (e.g., 'Comic', 'Trade Paperback')
+
+    Example:
+        >>> batch = ComicBatch.from_comics(response.data.results)
+        >>> [
+        ...     comic_id
+        ...     for comic_id, pages in zip(batch.ids, batch.page_counts)
+        ...     if pages > 32
+        ... ]
+        [21366]
+    """
+
+    ids: "array[int]" = field(default_factory=lambda: array("q"))
+    digital_ids: "array[int]" = field(default_factory=lambda: array("q"))
+    issue_numbers: "array[float]" = field(default_factory=lambda: array("d"))
+    page_counts: "array[int]" = field(default_factory=lambda: array("q"))
+    titles: List[str] = field(default_factory=list)
+    formats: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_comics(cls, comics: Iterable[Comic]) -> "ComicBatch":
+        """Build a batch from comics in a single pass.
+
+        Args:
+            comics: Comics to convert, e.g. ``response.data.results``
+
+        Returns:
+            ComicBatch with one entry per comic, in iteration order
+        """
+        batch = cls()
+        for comic in comics:
+            batch.ids.append(comic.id)
+            batch.digital_ids.append(comic.digital_id)
+            batch.issue_numbers.append(comic.issue_number)
+            batch.page_counts.append(comic.page_count)
+            batch.titles.append(comic.title)
+            batch.formats.append(comic.format)
+        return batch
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
 
 class ComicListResponse(BaseListResponse[Comic]):
     """Comic list response.
@@ -323,6 +337,83 @@ class ComicListResponse(BaseListResponse[Comic]):
     data: DataContainer[Comic] = Field(..., description="Comic data container")
 
 
+class ComicListBody(BaseModel):
+    """Comic list response body without the response envelope.
+
+    Only ``data`` is declared; the envelope fields (code, status, copyright,
+    attribution and etag) are undeclared and therefore skipped during
+    validation instead of being copied onto a model. Use this when only the
+    comics are needed; ComicListResponse keeps the full API response.
+
+    Attributes:
+        data: DataContainer with comic list and pagination info
+
+    Example:
+        >>> body = ComicListBody.from_response(response)
+        >>> body.data.results[0].title
+        'Avengers (1963) #1'
+    """
+
+    data: DataContainer[Comic] = Field(..., description="Comic data container")
+
+    @classmethod
+    def from_response(cls, response: "httpx.Response") -> Self:
+        """Parse an HTTP response body, skipping the response envelope.
+
+        Args:
+            response: HTTP response returned by a comic endpoint
+
+        Returns:
+            Validated comic list body
+
+        Raises:
+            pydantic.ValidationError: If the body is not valid JSON or does not
+                match the model
+        """
+        return cls.model_validate_json(response.content)
+
+
+def parse_comic_list(response: "httpx.Response") -> List[Comic]:
+    """Parse the comics out of a comic list response.
+
+    Args:
+        response: HTTP response returned by a comic list endpoint
+
+    Returns:
+        Comics in the order returned by the API
+    """
+    return ComicListBody.from_response(response).data.results
+
+
+def parse_comic(response: "httpx.Response") -> Optional[Comic]:
+    """Parse the comic out of a single-comic response.
+
+    Args:
+        response: HTTP response returned by the single-comic endpoint
+
+    Returns:
+        The comic, or None if the response has no results
+    """
+    results = parse_comic_list(response)
+    return results[0] if results else None
+
+
+# Built once at import; reused for every batch of comics.
+_COMIC_LIST_ADAPTER: TypeAdapter[List[Comic]] = TypeAdapter(List[Comic])
+
+
+def dump_comic_list(comics: List[Comic]) -> bytes:
+    """Serialize a list of comics to a JSON array in one call.
+
+    Args:
+        comics: Comics to serialize, e.g. ``response.data.results``
+
+    Returns:
+        UTF-8 encoded JSON array using the API's field names
+    """
+    return _COMIC_LIST_ADAPTER.dump_json(comics, by_alias=True)
+
+
 class ComicResponse(BaseResponse[Comic]):
     """Single comic response.
 
@@ -6,12 +6,24 @@ images, URLs, dates, prices, and summary objects that appear in
 various API responses.
 """
 
-from pydantic import Field
+import sys
+from functools import lru_cache
+from typing import Generic, Tuple, TypeVar
 
-from .base import BaseModel
+from pydantic import AfterValidator, ConfigDict, Field, field_validator
+from typing_extensions import Annotated
 
+from .base import FrozenModel
 
-class Image(BaseModel):
+T = TypeVar("T")
+
+# Strings drawn from a small, repeated vocabulary (URL types, date types,
+# languages, creator roles, ...). Interning them makes every occurrence share
+# one string object instead of one per parsed item.
+InternedStr = Annotated[str, AfterValidator(sys.intern)]
+
+
+class Image(FrozenModel):
     """Image data model for Marvel API resources.
 
     Represents image information for characters, comics, events, and other
@@ -21,6 +33,7 @@ class Image(BaseModel):
     Attributes:
         path: Base path to the image on Marvel's CDN (without extension)
         extension: File extension for the image (e.g., 'jpg', 'png', 'gif')
+        url: Full image URL, built from the path and extension
 
     Example:
         >>> image = Image(
@@ -31,7 +44,8 @@ class Image(BaseModel):
         'http://i.annihil.us/u/prod/marvel/i/mg/9/c0/527bb7b37ff55'
         >>> image.extension
         'jpg'
-        >>> # Full URL can be constructed as: f"{image.path}.{image.extension}"
+        >>> image.url
+        'http://i.annihil.us/u/prod/marvel/i/mg/9/c0/527bb7b37ff55.jpg'
     """
 
     path: str = Field(..., description="Base path to the image on Marvel's CDN")
@@ -39,8 +53,13 @@ class Image(BaseModel):
         ..., description="File extension for the image (e.g., 'jpg', 'png', 'gif')"
     )
 
+    @property
+    def url(self) -> str:
+        """Full URL of the image, built from its path and extension."""
+        return f"{self.path}.{self.extension}"
 
-class URL(BaseModel):
+
+class URL(FrozenModel):
     """URL data model for Marvel API resources.
 
     Represents external URLs associated with Marvel API resources, such as
@@ -62,13 +81,13 @@ class URL(BaseModel):
         'http://marvel.com/characters/9/iron_man?utm_campaign=apiRef&utm_source=...'
     """
 
-    type: str = Field(
+    type: InternedStr = Field(
         ..., description="Type of URL (e.g., 'detail', 'wiki', 'comiclink', 'purchase')"
     )
     url: str = Field(..., description="The actual URL value")
 
 
-class TextObject(BaseModel):
+class TextObject(FrozenModel):
     """Text object data model for Marvel API resources.
 
     Represents text content associated with Marvel API resources, such as
@@ -92,14 +111,16 @@ class TextObject(BaseModel):
         'en-us'
     """
 
-    type: str = Field(
+    type: InternedStr = Field(
         ..., description="Type of text object (e.g., 'description', 'summary', 'full')"
     )
-    language: str = Field(..., description="Language code for the text (e.g., 'en-us', 'es')")
+    language: InternedStr = Field(
+        ..., description="Language code for the text (e.g., 'en-us', 'es')"
+    )
     text: str = Field(..., description="The actual text content")
 
 
-class Date(BaseModel):
+class Date(FrozenModel):
     """Date data model for Marvel API resources.
 
     Represents date information associated with Marvel API resources, such as
@@ -121,7 +142,7 @@ class Date(BaseModel):
         '2014-04-29T00:00:00-0400'
     """
 
-    type: str = Field(
+    type: InternedStr = Field(
         ..., description="Type of date (e.g., 'onsaleDate', 'focDate', 'unlimitedDate')"
     )
     date: str = Field(
@@ -129,7 +150,7 @@ class Date(BaseModel):
     )
 
 
-class Price(BaseModel):
+class Price(FrozenModel):
     """Price data model for Marvel API resources.
 
     Represents pricing information for Marvel API resources, typically
@@ -151,11 +172,11 @@ class Price(BaseModel):
         3.99
     """
 
-    type: str = Field(..., description="Type of price (e.g., 'printPrice', 'digitalPrice')")
+    type: InternedStr = Field(..., description="Type of price (e.g., 'printPrice', 'digitalPrice')")
     price: float = Field(..., description="Price value as a float (typically in USD)")
 
 
-class CreatorSummary(BaseModel):
+class CreatorSummary(FrozenModel):
     """Creator summary data model for Marvel API resources.
 
     Represents a summary of creator information (writers, artists, etc.)
@@ -177,16 +198,26 @@ class CreatorSummary(BaseModel):
         'Stan Lee'
         >>> creator.role
         'writer'
+
+    Unlike most models, extra fields are kept, since creator summaries carry
+    endpoint-specific details beyond the documented ones.
     """
 
-    resource_uri: str = Field(..., alias="resourceURI", description="URI of the creator resource")
+    model_config = ConfigDict(extra="allow")
+
+    resource_uri: str = Field(
+        ...,
+        validation_alias="resourceURI",
+        serialization_alias="resourceURI",
+        description="URI of the creator resource",
+    )
     name: str = Field(..., description="Name of the creator")
-    role: str = Field(
+    role: InternedStr = Field(
         ..., description="Role of the creator (e.g., 'writer', 'artist', 'penciller')"
     )
 
 
-class CharacterSummary(BaseModel):
+class CharacterSummary(FrozenModel):
     """Character summary data model for Marvel API resources.
 
     Represents a summary of character information that appears in Marvel API
@@ -206,11 +237,16 @@ class CharacterSummary(BaseModel):
         'Iron Man'
     """
 
-    resource_uri: str = Field(..., alias="resourceURI", description="URI of the character resource")
+    resource_uri: str = Field(
+        ...,
+        validation_alias="resourceURI",
+        serialization_alias="resourceURI",
+        description="URI of the character resource",
+    )
     name: str = Field(..., description="Name of the character")
 
 
-class StorySummary(BaseModel):
+class StorySummary(FrozenModel):
     """Story summary data model for Marvel API resources.
 
     Represents a summary of story information that appears in Marvel API
@@ -234,14 +270,19 @@ class StorySummary(BaseModel):
         'cover'
     """
 
-    resource_uri: str = Field(..., alias="resourceURI", description="URI of the story resource")
+    resource_uri: str = Field(
+        ...,
+        validation_alias="resourceURI",
+        serialization_alias="resourceURI",
+        description="URI of the story resource",
+    )
     name: str = Field(..., description="Name of the story")
-    type: str = Field(
+    type: InternedStr = Field(
         ..., description="Type of the story (e.g., 'cover', 'interiorStory', 'promo')"
     )
 
 
-class EventSummary(BaseModel):
+class EventSummary(FrozenModel):
     """Event summary data model for Marvel API resources.
 
     Represents a summary of event information that appears in Marvel API
@@ -261,11 +302,16 @@ class EventSummary(BaseModel):
         'Secret Invasion'
     """
 
-    resource_uri: str = Field(..., alias="resourceURI", description="URI of the event resource")
+    resource_uri: str = Field(
+        ...,
+        validation_alias="resourceURI",
+        serialization_alias="resourceURI",
+        description="URI of the event resource",
+    )
     name: str = Field(..., description="Name of the event")
 
 
-class SeriesSummary(BaseModel):
+class SeriesSummary(FrozenModel):
     """Series summary data model for Marvel API resources.
 
     Represents a summary of series information that appears in Marvel API
@@ -285,11 +331,16 @@ class SeriesSummary(BaseModel):
         'Avengers (1998 - 2004)'
     """
 
-    resource_uri: str = Field(..., alias="resourceURI", description="URI of the series resource")
+    resource_uri: str = Field(
+        ...,
+        validation_alias="resourceURI",
+        serialization_alias="resourceURI",
+        description="URI of the series resource",
+    )
     name: str = Field(..., description="Name of the series")
 
 
-class ComicSummary(BaseModel):
+class ComicSummary(FrozenModel):
     """Comic summary data model for Marvel API resources.
 
     Represents a summary of comic information that appears in Marvel API
@@ -309,5 +360,82 @@ class ComicSummary(BaseModel):
         'Avengers (1963) #1'
     """
 
-    resource_uri: str = Field(..., alias="resourceURI", description="URI of the comic resource")
+    resource_uri: str = Field(
+        ...,
+        validation_alias="resourceURI",
+        serialization_alias="resourceURI",
+        description="URI of the comic resource",
+    )
     name: str = Field(..., description="Name of the comic")
+
+
+class SummaryList(FrozenModel, Generic[T]):
+    """Generic collection of summaries attached to a Marvel API resource.
+
+    Every Marvel resource embeds its related resources (comics, stories,
+    events, series, ...) using the same shape: pagination counters, the URI
+    of the full collection and a list of summaries. Parametrizing this single
+    model by summary type lets pydantic build and cache one schema per item
+    type instead of one per resource module.
+
+    Attributes:
+        available: Number of items available in the collection
+        returned: Number of items returned in this response
+        collection_uri: URI of the full collection
+        items: List of summaries of type T
+
+    Example:
+        >>> comic_list = SummaryList[ComicSummary](
+        ...     available=100,
+        ...     returned=20,
+        ...     collectionURI="http://gateway.marvel.com/v1/public/characters/1009368/comics",
+        ...     items=[ComicSummary(resourceURI="...", name="Avengers #1")]
+        ... )
+        >>> comic_list.available
+        100
+        >>> len(comic_list.items)
+        1
+    """
+
+    available: int = Field(..., description="Number of items available")
+    returned: int = Field(..., description="Number of items returned")
+    collection_uri: str = Field(
+        ...,
+        validation_alias="collectionURI",
+        serialization_alias="collectionURI",
+        description="URI of the full collection",
+    )
+    items: Tuple[T, ...] = Field(default=(), description="List of summaries")
+
+    @field_validator("items")
+    @classmethod
+    def _pool_items(cls, items: Tuple[T, ...]) -> Tuple[T, ...]:
+        return tuple(map(_pool_summary, items))
+
+
+# Pools of small, immutable value objects. Pages of comics repeat the same
+# prices, URL templates and images over and over; keeping one shared frozen
+# instance per distinct value lets the per-occurrence copies be freed right
+# after validation. Inputs are already validated, so misses use
+# model_construct. Bounded so long-running processes don't grow without limit.
+@lru_cache(maxsize=4096)
+def _make_price(type_: str, price: float) -> Price:
+    return Price.model_construct(type=type_, price=price)
+
+
+@lru_cache(maxsize=4096)
+def _make_url(type_: str, url: str) -> URL:
+    return URL.model_construct(type=type_, url=url)
+
+
+@lru_cache(maxsize=4096)
+def _make_image(path: str, extension: str) -> Image:
+    return Image.model_construct(path=path, extension=extension)
+
+
+# Summaries are frozen and hashable, and the same comics, series and creators
+# show up in the collections of many resources on a page. Returning the first
+# equal instance seen lets each repeated summary share one object.
+@lru_cache(maxsize=16384)
+def _pool_summary(summary: T) -> T:
+    return summary
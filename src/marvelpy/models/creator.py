@@ -6,190 +6,35 @@ work on Marvel comics, including writers, artists, editors, and other
 contributors to the creative process.
 """
 
-from typing import List, Optional
+from array import array
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional, Tuple
 
-from pydantic import Field
+from pydantic import Field, ValidationInfo, field_validator
+from typing_extensions import Annotated
 
-from .base import BaseListResponse, BaseModel, BaseResponse, DataContainer
+from .base import BaseListResponse, BaseResponse, DataContainer, FrozenModel, LazyField
 from .common import (
     URL,
     CharacterSummary,
     ComicSummary,
     EventSummary,
     Image,
+    InternedStr,
     SeriesSummary,
     StorySummary,
+    SummaryList,
 )
 
+# Related-resource collections embedded in a creator.
+CharacterList = SummaryList[CharacterSummary]
+ComicList = SummaryList[ComicSummary]
+EventList = SummaryList[EventSummary]
+SeriesList = SummaryList[SeriesSummary]
+StoryList = SummaryList[StorySummary]
 
-class CharacterList(BaseModel):
-    """Character list for creator.
 
-    Represents a collection of characters that a specific creator has worked on,
-    including pagination metadata and a list of character summaries.
-
-    Attributes:
-        available: Number of characters available for this creator
-        returned: Number of characters returned in this response
-        collection_uri: URI of the characters collection for this creator
-        items: List of character summaries that this creator has worked on
-
-    Example:
-        >>> character_list = CharacterList(
-        ...     available=50,
-        ...     returned=20,
-        ...     collectionURI="http://gateway.marvel.com/v1/public/creators/30/characters",
-        ...     items=[CharacterSummary(resourceURI="...", name="Iron Man")]
-        ... )
-        >>> character_list.available
-        50
-        >>> len(character_list.items)
-        1
-    """
-
-    available: int = Field(..., description="Number of characters available")
-    returned: int = Field(..., description="Number of characters returned")
-    collection_uri: str = Field(
-        ..., alias="collectionURI", description="URI of the characters collection"
-    )
-    items: List[CharacterSummary] = Field(
-        default_factory=list, description="List of character summaries"
-    )
-
-
-class ComicList(BaseModel):
-    """Comic list for creator.
-
-    Represents a collection of comics that a specific creator has worked on,
-    including pagination metadata and a list of comic summaries.
-
-    Attributes:
-        available: Number of comics available for this creator
-        returned: Number of comics returned in this response
-        collection_uri: URI of the comics collection for this creator
-        items: List of comic summaries that this creator has worked on
-
-    Example:
-        >>> comic_list = ComicList(
-        ...     available=500,
-        ...     returned=100,
-        ...     collectionURI="http://gateway.marvel.com/v1/public/creators/30/comics",
-        ...     items=[ComicSummary(resourceURI="...", name="Amazing Spider-Man #1")]
-        ... )
-        >>> comic_list.available
-        500
-        >>> len(comic_list.items)
-        1
-    """
-
-    available: int = Field(..., description="Number of comics available")
-    returned: int = Field(..., description="Number of comics returned")
-    collection_uri: str = Field(
-        ..., alias="collectionURI", description="URI of the comics collection"
-    )
-    items: List[ComicSummary] = Field(default_factory=list, description="List of comic summaries")
-
-
-class EventList(BaseModel):
-    """Event list for creator.
-
-    Represents a collection of events that a specific creator has worked on,
-    including pagination metadata and a list of event summaries.
-
-    Attributes:
-        available: Number of events available for this creator
-        returned: Number of events returned in this response
-        collection_uri: URI of the events collection for this creator
-        items: List of event summaries that this creator has worked on
-
-    Example:
-        >>> event_list = EventList(
-        ...     available=10,
-        ...     returned=5,
-        ...     collectionURI="http://gateway.marvel.com/v1/public/creators/30/events",
-        ...     items=[EventSummary(resourceURI="...", name="Secret Invasion")]
-        ... )
-        >>> event_list.available
-        10
-        >>> len(event_list.items)
-        1
-    """
-
-    available: int = Field(..., description="Number of events available")
-    returned: int = Field(..., description="Number of events returned")
-    collection_uri: str = Field(
-        ..., alias="collectionURI", description="URI of the events collection"
-    )
-    items: List[EventSummary] = Field(default_factory=list, description="List of event summaries")
-
-
-class SeriesList(BaseModel):
-    """Series list for creator.
-
-    Represents a collection of series that a specific creator has worked on,
-    including pagination metadata and a list of series summaries.
-
-    Attributes:
-        available: Number of series available for this creator
-        returned: Number of series returned in this response
-        collection_uri: URI of the series collection for this creator
-        items: List of series summaries that this creator has worked on
-
-    Example:
-        >>> series_list = SeriesList(
-        ...     available=25,
-        ...     returned=10,
-        ...     collectionURI="http://gateway.marvel.com/v1/public/creators/30/series",
-        ...     items=[SeriesSummary(resourceURI="...", name="Amazing Spider-Man (1963 - 1998)")]
-        ... )
-        >>> series_list.available
-        25
-        >>> len(series_list.items)
-        1
-    """
-
-    available: int = Field(..., description="Number of series available")
-    returned: int = Field(..., description="Number of series returned")
-    collection_uri: str = Field(
-        ..., alias="collectionURI", description="URI of the series collection"
-    )
-    items: List[SeriesSummary] = Field(default_factory=list, description="List of series summaries")
-
-
-class StoryList(BaseModel):
-    """Story list for creator.
-
-    Represents a collection of stories that a specific creator has worked on,
-    including pagination metadata and a list of story summaries.
-
-    Attributes:
-        available: Number of stories available for this creator
-        returned: Number of stories returned in this response
-        collection_uri: URI of the stories collection for this creator
-        items: List of story summaries that this creator has worked on
-
-    Example:
-        >>> story_list = StoryList(
-        ...     available=1000,
-        ...     returned=200,
-        ...     collectionURI="http://gateway.marvel.com/v1/public/creators/30/stories",
-        ...     items=[StorySummary(resourceURI="...", name="Cover #1", type="cover")]
-        ... )
-        >>> story_list.available
-        1000
-        >>> len(story_list.items)
-        1
-    """
-
-    available: int = Field(..., description="Number of stories available")
-    returned: int = Field(..., description="Number of stories returned")
-    collection_uri: str = Field(
-        ..., alias="collectionURI", description="URI of the stories collection"
-    )
-    items: List[StorySummary] = Field(default_factory=list, description="List of story summaries")
-
-
-class Creator(BaseModel):
+class Creator(FrozenModel):
     """Creator data model for Marvel API.
 
     Represents a Marvel creator with all associated information including
@@ -203,7 +48,8 @@ class Creator(BaseModel):
         middle_name: Middle name of the creator (may be empty)
         last_name: Last name of the creator
         suffix: Suffix of the creator (may be empty)
-        full_name: Full name of the creator
+        full_name: Full name of the creator; built from the name parts when
+            the API leaves it out or empty
         modified: Date the creator was last modified (ISO format)
         resource_uri: URI of the creator resource
         urls: List of URLs associated with the creator
@@ -239,25 +85,121 @@ class Creator(BaseModel):
     """
 
     id: int = Field(..., description="Unique identifier for the creator")
-    first_name: str = Field(..., alias="firstName", description="First name of the creator")
-    middle_name: str = Field(..., alias="middleName", description="Middle name of the creator")
-    last_name: str = Field(..., alias="lastName", description="Last name of the creator")
-    suffix: str = Field(..., description="Suffix of the creator")
-    full_name: str = Field(..., alias="fullName", description="Full name of the creator")
-    modified: str = Field(..., description="Date the creator was last modified")
-    resource_uri: str = Field(..., alias="resourceURI", description="URI of the creator resource")
-    urls: List["URL"] = Field(
-        default_factory=list, description="List of URLs associated with the creator"
+    first_name: str = Field(
+        ...,
+        validation_alias="firstName",
+        serialization_alias="firstName",
+        description="First name of the creator",
+    )
+    middle_name: str = Field(
+        ...,
+        validation_alias="middleName",
+        serialization_alias="middleName",
+        description="Middle name of the creator",
+    )
+    last_name: str = Field(
+        ...,
+        validation_alias="lastName",
+        serialization_alias="lastName",
+        description="Last name of the creator",
+    )
+    suffix: InternedStr = Field(..., description="Suffix of the creator")
+    full_name: str = Field(
+        "",
+        validation_alias="fullName",
+        serialization_alias="fullName",
+        validate_default=True,
+        description="Full name of the creator",
+    )
+    modified: InternedStr = Field(..., description="Date the creator was last modified")
+    resource_uri: str = Field(
+        ...,
+        validation_alias="resourceURI",
+        serialization_alias="resourceURI",
+        description="URI of the creator resource",
+    )
+    urls: Tuple[URL, ...] = Field(
+        default=(), description="List of URLs associated with the creator"
     )
     thumbnail: Optional[Image] = Field(None, description="Creator thumbnail image")
-    comics: ComicList = Field(..., description="Comics that this creator has worked on")
-    series: SeriesList = Field(..., description="Series that this creator has worked on")
-    stories: StoryList = Field(..., description="Stories that this creator has worked on")
-    events: EventList = Field(..., description="Events that this creator has worked on")
-    characters: Optional[CharacterList] = Field(
+    comics: Annotated[ComicList, LazyField()] = Field(
+        ..., description="Comics that this creator has worked on"
+    )
+    series: Annotated[SeriesList, LazyField()] = Field(
+        ..., description="Series that this creator has worked on"
+    )
+    stories: Annotated[StoryList, LazyField()] = Field(
+        ..., description="Stories that this creator has worked on"
+    )
+    events: Annotated[EventList, LazyField()] = Field(
+        ..., description="Events that this creator has worked on"
+    )
+    characters: Annotated[Optional[CharacterList], LazyField()] = Field(
         None, description="Characters that this creator has worked on"
     )
 
+    @field_validator("full_name")
+    @classmethod
+    def _default_full_name(cls, full_name: str, info: ValidationInfo) -> str:
+        """Fall back to the non-empty name parts, e.g. 'John Michael Smith Jr.'."""
+        if full_name:
+            return full_name
+        names = ("first_name", "middle_name", "last_name", "suffix")
+        return " ".join(part for part in (info.data.get(name) for name in names) if part)
+
+
+@dataclass(frozen=True)
+class CreatorBatch:
+    """Column-oriented view of many creators for scanning and export.
+
+    Each attribute holds one field for every creator, in the same order.
+    IDs are a compact ``array.array`` buffer; the other columns are plain
+    lists that can be handed to a DataFrame constructor as-is.
+
+    Attributes:
+        ids: Creator IDs
+        first_names: First names
+        full_names: Full names
+        resource_uris: Resource URIs
+        modified: Last-modified timestamps (ISO format)
+        thumbnails: Thumbnail images (entries may be None)
+
+    Example:
+        >>> batch = CreatorBatch.from_creators(response.data.results)
+        >>> dict(zip(batch.ids, batch.full_names))
+        {30: 'Stan Lee'}
+    """
+
+    ids: "array[int]" = field(default_factory=lambda: array("q"))
+    first_names: List[str] = field(default_factory=list)
+    full_names: List[str] = field(default_factory=list)
+    resource_uris: List[str] = field(default_factory=list)
+    modified: List[str] = field(default_factory=list)
+    thumbnails: List[Optional[Image]] = field(default_factory=list)
+
+    @classmethod
+    def from_creators(cls, creators: Iterable[Creator]) -> "CreatorBatch":
+        """Build a batch from creators in a single pass.
+
+        Args:
+            creators: Creators to convert, e.g. ``response.data.results``
+
+        Returns:
+            CreatorBatch with one entry per creator, in iteration order
+        """
+        batch = cls()
+        for creator in creators:
+            batch.ids.append(creator.id)
+            batch.first_names.append(creator.first_name)
+            batch.full_names.append(creator.full_name)
+            batch.resource_uris.append(creator.resource_uri)
+            batch.modified.append(creator.modified)
+            batch.thumbnails.append(creator.thumbnail)
+        return batch
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
 
 class CreatorListResponse(BaseListResponse[Creator]):
     """Creator list response.
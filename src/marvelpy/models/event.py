@@ -6,11 +6,14 @@ in the Marvel universe that span across multiple comics, series, and
 characters, representing significant narrative arcs.
 """
 
-from typing import List, Optional
+from array import array
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional, Tuple
 
 from pydantic import Field
+from typing_extensions import Annotated
 
-from .base import BaseListResponse, BaseModel, BaseResponse, DataContainer
+from .base import BaseListResponse, BaseResponse, DataContainer, FrozenModel, LazyField
 from .common import (
     URL,
     CharacterSummary,
@@ -18,181 +21,21 @@ from .common import (
     CreatorSummary,
     EventSummary,
     Image,
+    InternedStr,
     SeriesSummary,
     StorySummary,
+    SummaryList,
 )
 
+# Related-resource collections embedded in an event.
+CharacterList = SummaryList[CharacterSummary]
+ComicList = SummaryList[ComicSummary]
+CreatorList = SummaryList[CreatorSummary]
+SeriesList = SummaryList[SeriesSummary]
+StoryList = SummaryList[StorySummary]
 
-class CharacterList(BaseModel):
-    """Character list for event.
 
-    Represents a collection of characters involved in a specific event,
-    including pagination metadata and a list of character summaries.
-
-    Attributes:
-        available: Number of characters available for this event
-        returned: Number of characters returned in this response
-        collection_uri: URI of the characters collection for this event
-        items: List of character summaries involved in this event
-
-    Example:
-        >>> character_list = CharacterList(
-        ...     available=50,
-        ...     returned=20,
-        ...     collectionURI="http://gateway.marvel.com/v1/public/events/269/characters",
-        ...     items=[CharacterSummary(resourceURI="...", name="Iron Man")]
-        ... )
-        >>> character_list.available
-        50
-        >>> len(character_list.items)
-        1
-    """
-
-    available: int = Field(..., description="Number of characters available")
-    returned: int = Field(..., description="Number of characters returned")
-    collection_uri: str = Field(
-        ..., alias="collectionURI", description="URI of the characters collection"
-    )
-    items: List[CharacterSummary] = Field(
-        default_factory=list, description="List of character summaries"
-    )
-
-
-class ComicList(BaseModel):
-    """Comic list for event.
-
-    Represents a collection of comics that are part of a specific event,
-    including pagination metadata and a list of comic summaries.
-
-    Attributes:
-        available: Number of comics available for this event
-        returned: Number of comics returned in this response
-        collection_uri: URI of the comics collection for this event
-        items: List of comic summaries that are part of this event
-
-    Example:
-        >>> comic_list = ComicList(
-        ...     available=100,
-        ...     returned=25,
-        ...     collectionURI="http://gateway.marvel.com/v1/public/events/269/comics",
-        ...     items=[ComicSummary(resourceURI="...", name="Avengers (1963) #1")]
-        ... )
-        >>> comic_list.available
-        100
-        >>> len(comic_list.items)
-        1
-    """
-
-    available: int = Field(..., description="Number of comics available")
-    returned: int = Field(..., description="Number of comics returned")
-    collection_uri: str = Field(
-        ..., alias="collectionURI", description="URI of the comics collection"
-    )
-    items: List[ComicSummary] = Field(default_factory=list, description="List of comic summaries")
-
-
-class CreatorList(BaseModel):
-    """Creator list for event.
-
-    Represents a collection of creators who worked on comics related to
-    a specific event, including pagination metadata and a list of creator summaries.
-
-    Attributes:
-        available: Number of creators available for this event
-        returned: Number of creators returned in this response
-        collection_uri: URI of the creators collection for this event
-        items: List of creator summaries who worked on this event
-
-    Example:
-        >>> creator_list = CreatorList(
-        ...     available=25,
-        ...     returned=10,
-        ...     collectionURI="http://gateway.marvel.com/v1/public/events/269/creators",
-        ...     items=[CreatorSummary(resourceURI="...", name="Stan Lee", role="writer")]
-        ... )
-        >>> creator_list.available
-        25
-        >>> len(creator_list.items)
-        1
-    """
-
-    available: int = Field(..., description="Number of creators available")
-    returned: int = Field(..., description="Number of creators returned")
-    collection_uri: str = Field(
-        ..., alias="collectionURI", description="URI of the creators collection"
-    )
-    items: List[CreatorSummary] = Field(
-        default_factory=list, description="List of creator summaries"
-    )
-
-
-class SeriesList(BaseModel):
-    """Series list for event.
-
-    Represents a collection of series that are part of a specific event,
-    including pagination metadata and a list of series summaries.
-
-    Attributes:
-        available: Number of series available for this event
-        returned: Number of series returned in this response
-        collection_uri: URI of the series collection for this event
-        items: List of series summaries that are part of this event
-
-    Example:
-        >>> series_list = SeriesList(
-        ...     available=15,
-        ...     returned=5,
-        ...     collectionURI="http://gateway.marvel.com/v1/public/events/269/series",
-        ...     items=[SeriesSummary(resourceURI="...", name="Avengers (1998 - 2004)")]
-        ... )
-        >>> series_list.available
-        15
-        >>> len(series_list.items)
-        1
-    """
-
-    available: int = Field(..., description="Number of series available")
-    returned: int = Field(..., description="Number of series returned")
-    collection_uri: str = Field(
-        ..., alias="collectionURI", description="URI of the series collection"
-    )
-    items: List[SeriesSummary] = Field(default_factory=list, description="List of series summaries")
-
-
-class StoryList(BaseModel):
-    """Story list for event.
-
-    Represents a collection of stories that are part of a specific event,
-    including pagination metadata and a list of story summaries.
-
-    Attributes:
-        available: Number of stories available for this event
-        returned: Number of stories returned in this response
-        collection_uri: URI of the stories collection for this event
-        items: List of story summaries that are part of this event
-
-    Example:
-        >>> story_list = StoryList(
-        ...     available=200,
-        ...     returned=50,
-        ...     collectionURI="http://gateway.marvel.com/v1/public/events/269/stories",
-        ...     items=[StorySummary(resourceURI="...", name="Cover #1", type="cover")]
-        ... )
-        >>> story_list.available
-        200
-        >>> len(story_list.items)
-        1
-    """
-
-    available: int = Field(..., description="Number of stories available")
-    returned: int = Field(..., description="Number of stories returned")
-    collection_uri: str = Field(
-        ..., alias="collectionURI", description="URI of the stories collection"
-    )
-    items: List[StorySummary] = Field(default_factory=list, description="List of story summaries")
-
-
-class Event(BaseModel):
+class Event(FrozenModel):
     """Event data model for Marvel API.
 
     Represents a Marvel event with all associated information including
@@ -246,25 +89,85 @@ class Event(BaseModel):
     id: int = Field(..., description="Unique identifier for the event")
     title: str = Field(..., description="Title of the event")
     description: str = Field(..., description="Description of the event")
-    resource_uri: str = Field(..., alias="resourceURI", description="URI of the event resource")
-    urls: List[URL] = Field(
-        default_factory=list, description="List of URLs associated with the event"
+    resource_uri: str = Field(
+        ...,
+        validation_alias="resourceURI",
+        serialization_alias="resourceURI",
+        description="URI of the event resource",
     )
-    modified: str = Field(..., description="Date the event was last modified")
+    urls: Tuple[URL, ...] = Field(default=(), description="List of URLs associated with the event")
+    modified: InternedStr = Field(..., description="Date the event was last modified")
     start: Optional[str] = Field(None, description="Start date of the event")
     end: Optional[str] = Field(None, description="End date of the event")
     thumbnail: Optional[Image] = Field(None, description="Event thumbnail image")
-    comics: ComicList = Field(..., description="Comics that are part of this event")
-    stories: StoryList = Field(..., description="Stories that are part of this event")
-    series: SeriesList = Field(..., description="Series that are part of this event")
-    characters: CharacterList = Field(..., description="Characters involved in this event")
-    creators: CreatorList = Field(..., description="Creators who worked on this event")
-    next: Optional["EventSummary"] = Field(None, description="Next event in chronological order")
-    previous: Optional["EventSummary"] = Field(
+    comics: Annotated[ComicList, LazyField()] = Field(
+        ..., description="Comics that are part of this event"
+    )
+    stories: Annotated[StoryList, LazyField()] = Field(
+        ..., description="Stories that are part of this event"
+    )
+    series: Annotated[SeriesList, LazyField()] = Field(
+        ..., description="Series that are part of this event"
+    )
+    characters: Annotated[CharacterList, LazyField()] = Field(
+        ..., description="Characters involved in this event"
+    )
+    creators: Annotated[CreatorList, LazyField()] = Field(
+        ..., description="Creators who worked on this event"
+    )
+    next: Optional[EventSummary] = Field(None, description="Next event in chronological order")
+    previous: Optional[EventSummary] = Field(
         None, description="Previous event in chronological order"
     )
 
 
+@dataclass(frozen=True)
+class EventBatch:
+    """Column-oriented view of many events for scanning and export.
+
+    Each attribute holds one field for every event, in the same order.
+    IDs are a compact ``array.array`` buffer; the other columns are plain
+    lists that can be handed to a DataFrame constructor as-is.
+
+    Attributes:
+        ids: Event IDs
+        titles: Titles
+        starts: Start dates (entries may be None)
+        ends: End dates (entries may be None)
+
+    Example:
+        >>> batch = EventBatch.from_events(response.data.results)
+        >>> [title for title, start in zip(batch.titles, batch.starts) if start]
+        ['Secret Invasion']
+    """
+
+    ids: "array[int]" = field(default_factory=lambda: array("q"))
+    titles: List[str] = field(default_factory=list)
+    starts: List[Optional[str]] = field(default_factory=list)
+    ends: List[Optional[str]] = field(default_factory=list)
+
+    @classmethod
+    def from_events(cls, events: Iterable[Event]) -> "EventBatch":
+        """Build a batch from events in a single pass.
+
+        Args:
+            events: Events to convert, e.g. ``response.data.results``
+
+        Returns:
+            EventBatch with one entry per event, in iteration order
+        """
+        batch = cls()
+        for event in events:
+            batch.ids.append(event.id)
+            batch.titles.append(event.title)
+            batch.starts.append(event.start)
+            batch.ends.append(event.end)
+        return batch
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
 class EventListResponse(BaseListResponse[Event]):
     """Event list response.
 
@@ -0,0 +1,486 @@
+"""msgspec mirrors of the Marvel API models for bulk decoding.
+
+This optional module provides ``msgspec.Struct`` versions of the comic,
+creator, event, series and story list response models. Structs are slotted
+and have no per-instance ``__dict__``, and msgspec decodes JSON straight into
+them, which makes this the cheapest way to ingest large numbers of resources.
+The structs mirror the field names of the pydantic models in
+:mod:`marvelpy.models.comic`, :mod:`marvelpy.models.creator`,
+:mod:`marvelpy.models.event`, :mod:`marvelpy.models.series`,
+:mod:`marvelpy.models.story` and :mod:`marvelpy.models.common`, but they
+are plain data containers: they do not have pydantic methods such as
+``model_dump`` or properties such as ``Comic.modified_dt``.
+
+Requires the ``fast`` extra::
+
+    pip install "marvelpy[fast]"
+
+Example:
+    >>> from marvelpy.models.fast import decode_comic_list
+    >>> response = decode_comic_list(raw_bytes)
+    >>> response.data.results[0].title
+    'Avengers (1963) #1'
+"""
+
+from typing import Generic, List, Optional, Tuple, TypeVar
+
+try:
+    import msgspec
+except ImportError as exc:  # pragma: no cover - exercised only without the extra
+    raise ImportError(
+        "marvelpy.models.fast requires msgspec; install it with 'pip install marvelpy[fast]'"
+    ) from exc
+
+T = TypeVar("T")
+
+
+class Image(msgspec.Struct, frozen=True, kw_only=True):
+    """Image on Marvel's CDN (mirrors :class:`marvelpy.models.common.Image`)."""
+
+    path: str
+    extension: str
+
+
+class URL(msgspec.Struct, frozen=True, kw_only=True):
+    """External URL (mirrors :class:`marvelpy.models.common.URL`)."""
+
+    type: str
+    url: str
+
+
+class TextObject(msgspec.Struct, frozen=True, kw_only=True):
+    """Text content (mirrors :class:`marvelpy.models.common.TextObject`)."""
+
+    type: str
+    language: str
+    text: str
+
+
+class Date(msgspec.Struct, frozen=True, kw_only=True):
+    """Typed date (mirrors :class:`marvelpy.models.common.Date`)."""
+
+    type: str
+    date: str
+
+
+class Price(msgspec.Struct, frozen=True, kw_only=True):
+    """Typed price (mirrors :class:`marvelpy.models.common.Price`)."""
+
+    type: str
+    price: float
+
+
+class CreatorSummary(
+    msgspec.Struct, frozen=True, kw_only=True, rename={"resource_uri": "resourceURI"}
+):
+    """Creator summary (mirrors :class:`marvelpy.models.common.CreatorSummary`)."""
+
+    resource_uri: str
+    name: str
+    role: str
+
+
+class CharacterSummary(
+    msgspec.Struct, frozen=True, kw_only=True, rename={"resource_uri": "resourceURI"}
+):
+    """Character summary (mirrors :class:`marvelpy.models.common.CharacterSummary`)."""
+
+    resource_uri: str
+    name: str
+
+
+class StorySummary(
+    msgspec.Struct, frozen=True, kw_only=True, rename={"resource_uri": "resourceURI"}
+):
+    """Story summary (mirrors :class:`marvelpy.models.common.StorySummary`)."""
+
+    resource_uri: str
+    name: str
+    type: str
+
+
+class EventSummary(
+    msgspec.Struct, frozen=True, kw_only=True, rename={"resource_uri": "resourceURI"}
+):
+    """Event summary (mirrors :class:`marvelpy.models.common.EventSummary`)."""
+
+    resource_uri: str
+    name: str
+
+
+class SeriesSummary(
+    msgspec.Struct, frozen=True, kw_only=True, rename={"resource_uri": "resourceURI"}
+):
+    """Series summary (mirrors :class:`marvelpy.models.common.SeriesSummary`)."""
+
+    resource_uri: str
+    name: str
+
+
+class ComicSummary(
+    msgspec.Struct, frozen=True, kw_only=True, rename={"resource_uri": "resourceURI"}
+):
+    """Comic summary (mirrors :class:`marvelpy.models.common.ComicSummary`)."""
+
+    resource_uri: str
+    name: str
+
+
+class SummaryList(
+    msgspec.Struct,
+    Generic[T],
+    frozen=True,
+    kw_only=True,
+    rename={"collection_uri": "collectionURI"},
+):
+    """Related-resource collection (mirrors :class:`marvelpy.models.common.SummaryList`)."""
+
+    available: int
+    returned: int
+    collection_uri: str
+    items: Tuple[T, ...] = ()
+
+
+class Comic(
+    msgspec.Struct,
+    frozen=True,
+    kw_only=True,
+    rename={
+        "digital_id": "digitalId",
+        "issue_number": "issueNumber",
+        "variant_description": "variantDescription",
+        "diamond_code": "diamondCode",
+        "page_count": "pageCount",
+        "text_objects": "textObjects",
+        "resource_uri": "resourceURI",
+        "collected_issues": "collectedIssues",
+    },
+):
+    """Comic (mirrors :class:`marvelpy.models.comic.Comic`)."""
+
+    id: int
+    digital_id: int
+    title: str
+    issue_number: float
+    variant_description: Optional[str] = None
+    description: Optional[str] = None
+    modified: str
+    isbn: str
+    upc: str
+    diamond_code: str
+    ean: str
+    issn: str
+    format: str
+    page_count: int
+    text_objects: Tuple[TextObject, ...]
+    resource_uri: str
+    urls: Tuple[URL, ...] = ()
+    series: SeriesSummary
+    variants: Tuple[ComicSummary, ...] = ()
+    collections: Tuple[ComicSummary, ...] = ()
+    collected_issues: Tuple[ComicSummary, ...]
+    dates: Tuple[Date, ...] = ()
+    prices: Tuple[Price, ...] = ()
+    thumbnail: Optional[Image] = None
+    images: Tuple[Image, ...] = ()
+    creators: SummaryList[CreatorSummary]
+    characters: SummaryList[CharacterSummary]
+    stories: SummaryList[StorySummary]
+    events: SummaryList[EventSummary]
+
+
+class Creator(
+    msgspec.Struct,
+    frozen=True,
+    kw_only=True,
+    rename={
+        "first_name": "firstName",
+        "middle_name": "middleName",
+        "last_name": "lastName",
+        "full_name": "fullName",
+        "resource_uri": "resourceURI",
+    },
+):
+    """Creator (mirrors :class:`marvelpy.models.creator.Creator`)."""
+
+    id: int
+    first_name: str
+    middle_name: str
+    last_name: str
+    suffix: str
+    full_name: str = ""
+    modified: str
+    resource_uri: str
+    urls: Tuple[URL, ...] = ()
+    thumbnail: Optional[Image] = None
+    comics: SummaryList[ComicSummary]
+    series: SummaryList[SeriesSummary]
+    stories: SummaryList[StorySummary]
+    events: SummaryList[EventSummary]
+    characters: Optional[SummaryList[CharacterSummary]] = None
+
+    def __post_init__(self) -> None:
+        # Same fallback as the pydantic Creator when fullName is missing or empty.
+        if not self.full_name:
+            names = (self.first_name, self.middle_name, self.last_name, self.suffix)
+            msgspec.structs.force_setattr(
+                self, "full_name", " ".join(part for part in names if part)
+            )
+
+
+class Event(msgspec.Struct, frozen=True, kw_only=True, rename={"resource_uri": "resourceURI"}):
+    """Event (mirrors :class:`marvelpy.models.event.Event`)."""
+
+    id: int
+    title: str
+    description: str
+    resource_uri: str
+    urls: Tuple[URL, ...] = ()
+    modified: str
+    start: Optional[str] = None
+    end: Optional[str] = None
+    thumbnail: Optional[Image] = None
+    comics: SummaryList[ComicSummary]
+    stories: SummaryList[StorySummary]
+    series: SummaryList[SeriesSummary]
+    characters: SummaryList[CharacterSummary]
+    creators: SummaryList[CreatorSummary]
+    next: Optional[EventSummary] = None
+    previous: Optional[EventSummary] = None
+
+
+class Series(
+    msgspec.Struct,
+    frozen=True,
+    kw_only=True,
+    rename={
+        "resource_uri": "resourceURI",
+        "start_year": "startYear",
+        "end_year": "endYear",
+    },
+):
+    """Series (mirrors :class:`marvelpy.models.series.Series`)."""
+
+    id: int
+    title: str
+    description: Optional[str] = None
+    resource_uri: str
+    urls: Tuple[URL, ...] = ()
+    start_year: Optional[int] = None
+    end_year: Optional[int] = None
+    rating: str = ""
+    modified: str
+    thumbnail: Optional[Image] = None
+    comics: SummaryList[ComicSummary]
+    stories: SummaryList[StorySummary]
+    events: SummaryList[EventSummary]
+    characters: SummaryList[CharacterSummary]
+    creators: SummaryList[CreatorSummary]
+    next: Optional[SeriesSummary] = None
+    previous: Optional[SeriesSummary] = None
+
+
+class Story(
+    msgspec.Struct,
+    frozen=True,
+    kw_only=True,
+    rename={"resource_uri": "resourceURI", "original_issue": "originalIssue"},
+):
+    """Story (mirrors :class:`marvelpy.models.story.Story`)."""
+
+    id: int
+    title: str
+    description: str
+    resource_uri: str
+    type: str
+    modified: str
+    thumbnail: Optional[Image] = None
+    comics: SummaryList[ComicSummary]
+    series: SummaryList[SeriesSummary]
+    events: SummaryList[EventSummary]
+    characters: SummaryList[CharacterSummary]
+    creators: SummaryList[CreatorSummary]
+    original_issue: Optional[ComicSummary] = None
+
+
+class DataContainer(msgspec.Struct, Generic[T], frozen=True, kw_only=True):
+    """Paginated results (mirrors :class:`marvelpy.models.base.DataContainer`)."""
+
+    offset: int
+    limit: int
+    total: int
+    count: int
+    results: List[T]
+
+
+class ComicListResponse(
+    msgspec.Struct,
+    frozen=True,
+    kw_only=True,
+    rename={"attribution_text": "attributionText", "attribution_html": "attributionHTML"},
+):
+    """Comic list response (mirrors :class:`marvelpy.models.comic.ComicListResponse`)."""
+
+    code: int
+    status: str
+    copyright: str
+    attribution_text: str
+    attribution_html: str
+    etag: str
+    data: DataContainer[Comic]
+
+
+class CreatorListResponse(
+    msgspec.Struct,
+    frozen=True,
+    kw_only=True,
+    rename={"attribution_text": "attributionText", "attribution_html": "attributionHTML"},
+):
+    """Creator list response (mirrors :class:`marvelpy.models.creator.CreatorListResponse`)."""
+
+    code: int
+    status: str
+    copyright: str
+    attribution_text: str
+    attribution_html: str
+    etag: str
+    data: DataContainer[Creator]
+
+
+class EventListResponse(
+    msgspec.Struct,
+    frozen=True,
+    kw_only=True,
+    rename={"attribution_text": "attributionText", "attribution_html": "attributionHTML"},
+):
+    """Event list response (mirrors :class:`marvelpy.models.event.EventListResponse`)."""
+
+    code: int
+    status: str
+    copyright: str
+    attribution_text: str
+    attribution_html: str
+    etag: str
+    data: DataContainer[Event]
+
+
+class SeriesListResponse(
+    msgspec.Struct,
+    frozen=True,
+    kw_only=True,
+    rename={"attribution_text": "attributionText", "attribution_html": "attributionHTML"},
+):
+    """Series list response (mirrors :class:`marvelpy.models.series.SeriesListResponse`)."""
+
+    code: int
+    status: str
+    copyright: str
+    attribution_text: str
+    attribution_html: str
+    etag: str
+    data: DataContainer[Series]
+
+
+class StoryListResponse(
+    msgspec.Struct,
+    frozen=True,
+    kw_only=True,
+    rename={"attribution_text": "attributionText", "attribution_html": "attributionHTML"},
+):
+    """Story list response (mirrors :class:`marvelpy.models.story.StoryListResponse`)."""
+
+    code: int
+    status: str
+    copyright: str
+    attribution_text: str
+    attribution_html: str
+    etag: str
+    data: DataContainer[Story]
+
+
+# Built once at import; decoding then runs entirely in msgspec's C code.
+_COMIC_LIST_DECODER = msgspec.json.Decoder(ComicListResponse)
+_CREATOR_LIST_DECODER = msgspec.json.Decoder(CreatorListResponse)
+_EVENT_LIST_DECODER = msgspec.json.Decoder(EventListResponse)
+_SERIES_LIST_DECODER = msgspec.json.Decoder(SeriesListResponse)
+_STORY_LIST_DECODER = msgspec.json.Decoder(StoryListResponse)
+
+
+def decode_comic_list(data: bytes) -> ComicListResponse:
+    """Decode a raw comic list response body.
+
+    Args:
+        data: Raw JSON body of a comics list endpoint response
+
+    Returns:
+        Decoded comic list response
+
+    Raises:
+        msgspec.ValidationError: If the body does not match the expected shape
+        msgspec.DecodeError: If the body is not valid JSON
+    """
+    return _COMIC_LIST_DECODER.decode(data)
+
+
+def decode_creator_list(data: bytes) -> CreatorListResponse:
+    """Decode a raw creator list response body.
+
+    Args:
+        data: Raw JSON body of a creators list endpoint response
+
+    Returns:
+        Decoded creator list response
+
+    Raises:
+        msgspec.ValidationError: If the body does not match the expected shape
+        msgspec.DecodeError: If the body is not valid JSON
+    """
+    return _CREATOR_LIST_DECODER.decode(data)
+
+
+def decode_event_list(data: bytes) -> EventListResponse:
+    """Decode a raw event list response body.
+
+    Args:
+        data: Raw JSON body of an events list endpoint response
+
+    Returns:
+        Decoded event list response
+
+    Raises:
+        msgspec.ValidationError: If the body does not match the expected shape
+        msgspec.DecodeError: If the body is not valid JSON
+    """
+    return _EVENT_LIST_DECODER.decode(data)
+
+
+def decode_series_list(data: bytes) -> SeriesListResponse:
+    """Decode a raw series list response body.
+
+    Args:
+        data: Raw JSON body of a series list endpoint response
+
+    Returns:
+        Decoded series list response
+
+    Raises:
+        msgspec.ValidationError: If the body does not match the expected shape
+        msgspec.DecodeError: If the body is not valid JSON
+    """
+    return _SERIES_LIST_DECODER.decode(data)
+
+
+def decode_story_list(data: bytes) -> StoryListResponse:
+    """Decode a raw story list response body.
+
+    Args:
+        data: Raw JSON body of a stories list endpoint response
+
+    Returns:
+        Decoded story list response
+
+    Raises:
+        msgspec.ValidationError: If the body does not match the expected shape
+        msgspec.DecodeError: If the body is not valid JSON
+    """
+    return _STORY_LIST_DECODER.decode(data)
@@ -6,11 +6,12 @@ comics that share a common title and are typically published over time,
 representing ongoing storylines or character arcs.
 """
 
-from typing import List, Optional
+from typing import Iterator, Optional, Tuple
 
 from pydantic import Field
+from typing_extensions import Annotated
 
-from .base import BaseListResponse, BaseModel, BaseResponse, DataContainer
+from .base import BaseListResponse, BaseResponse, DataContainer, FrozenModel, LazyField, parse_json
 from .common import (
     URL,
     CharacterSummary,
@@ -20,179 +21,18 @@ from .common import (
     Image,
     SeriesSummary,
     StorySummary,
+    SummaryList,
 )
 
+# Related-resource collections embedded in a series.
+CharacterList = SummaryList[CharacterSummary]
+ComicList = SummaryList[ComicSummary]
+CreatorList = SummaryList[CreatorSummary]
+EventList = SummaryList[EventSummary]
+StoryList = SummaryList[StorySummary]
 
-class CharacterList(BaseModel):
-    """Character list for series.
 
-    Represents a collection of characters that appear in a specific series,
-    including pagination metadata and a list of character summaries.
-
-    Attributes:
-        available: Number of characters available for this series
-        returned: Number of characters returned in this response
-        collection_uri: URI of the characters collection for this series
-        items: List of character summaries that appear in this series
-
-    Example:
-        >>> character_list = CharacterList(
-        ...     available=25,
-        ...     returned=10,
-        ...     collectionURI="http://gateway.marvel.com/v1/public/series/1991/characters",
-        ...     items=[CharacterSummary(resourceURI="...", name="Iron Man")]
-        ... )
-        >>> character_list.available
-        25
-        >>> len(character_list.items)
-        1
-    """
-
-    available: int = Field(..., description="Number of characters available")
-    returned: int = Field(..., description="Number of characters returned")
-    collection_uri: str = Field(
-        ..., alias="collectionURI", description="URI of the characters collection"
-    )
-    items: List[CharacterSummary] = Field(
-        default_factory=list, description="List of character summaries"
-    )
-
-
-class ComicList(BaseModel):
-    """Comic list for series.
-
-    Represents a collection of comics that are part of a specific series,
-    including pagination metadata and a list of comic summaries.
-
-    Attributes:
-        available: Number of comics available for this series
-        returned: Number of comics returned in this response
-        collection_uri: URI of the comics collection for this series
-        items: List of comic summaries that are part of this series
-
-    Example:
-        >>> comic_list = ComicList(
-        ...     available=200,
-        ...     returned=50,
-        ...     collectionURI="http://gateway.marvel.com/v1/public/series/1991/comics",
-        ...     items=[ComicSummary(resourceURI="...", name="Avengers (1998) #1")]
-        ... )
-        >>> comic_list.available
-        200
-        >>> len(comic_list.items)
-        1
-    """
-
-    available: int = Field(..., description="Number of comics available")
-    returned: int = Field(..., description="Number of comics returned")
-    collection_uri: str = Field(
-        ..., alias="collectionURI", description="URI of the comics collection"
-    )
-    items: List[ComicSummary] = Field(default_factory=list, description="List of comic summaries")
-
-
-class CreatorList(BaseModel):
-    """Creator list for series.
-
-    Represents a collection of creators who worked on comics in a specific
-    series, including pagination metadata and a list of creator summaries.
-
-    Attributes:
-        available: Number of creators available for this series
-        returned: Number of creators returned in this response
-        collection_uri: URI of the creators collection for this series
-        items: List of creator summaries who worked on this series
-
-    Example:
-        >>> creator_list = CreatorList(
-        ...     available=15,
-        ...     returned=8,
-        ...     collectionURI="http://gateway.marvel.com/v1/public/series/1991/creators",
-        ...     items=[CreatorSummary(resourceURI="...", name="Kurt Busiek", role="writer")]
-        ... )
-        >>> creator_list.available
-        15
-        >>> len(creator_list.items)
-        1
-    """
-
-    available: int = Field(..., description="Number of creators available")
-    returned: int = Field(..., description="Number of creators returned")
-    collection_uri: str = Field(
-        ..., alias="collectionURI", description="URI of the creators collection"
-    )
-    items: List[CreatorSummary] = Field(
-        default_factory=list, description="List of creator summaries"
-    )
-
-
-class EventList(BaseModel):
-    """Event list for series.
-
-    Represents a collection of events that are related to a specific series,
-    including pagination metadata and a list of event summaries.
-
-    Attributes:
-        available: Number of events available for this series
-        returned: Number of events returned in this response
-        collection_uri: URI of the events collection for this series
-        items: List of event summaries related to this series
-
-    Example:
-        >>> event_list = EventList(
-        ...     available=5,
-        ...     returned=3,
-        ...     collectionURI="http://gateway.marvel.com/v1/public/series/1991/events",
-        ...     items=[EventSummary(resourceURI="...", name="Secret Invasion")]
-        ... )
-        >>> event_list.available
-        5
-        >>> len(event_list.items)
-        1
-    """
-
-    available: int = Field(..., description="Number of events available")
-    returned: int = Field(..., description="Number of events returned")
-    collection_uri: str = Field(
-        ..., alias="collectionURI", description="URI of the events collection"
-    )
-    items: List[EventSummary] = Field(default_factory=list, description="List of event summaries")
-
-
-class StoryList(BaseModel):
-    """Story list for series.
-
-    Represents a collection of stories that are part of a specific series,
-    including pagination metadata and a list of story summaries.
-
-    Attributes:
-        available: Number of stories available for this series
-        returned: Number of stories returned in this response
-        collection_uri: URI of the stories collection for this series
-        items: List of story summaries that are part of this series
-
-    Example:
-        >>> story_list = StoryList(
-        ...     available=300,
-        ...     returned=75,
-        ...     collectionURI="http://gateway.marvel.com/v1/public/series/1991/stories",
-        ...     items=[StorySummary(resourceURI="...", name="Cover #1", type="cover")]
-        ... )
-        >>> story_list.available
-        300
-        >>> len(story_list.items)
-        1
-    """
-
-    available: int = Field(..., description="Number of stories available")
-    returned: int = Field(..., description="Number of stories returned")
-    collection_uri: str = Field(
-        ..., alias="collectionURI", description="URI of the stories collection"
-    )
-    items: List[StorySummary] = Field(default_factory=list, description="List of story summaries")
-
-
-class Series(BaseModel):
+class Series(FrozenModel):
     """Series data model for Marvel API.
 
     Represents a Marvel series with all associated information including
@@ -248,22 +88,35 @@ class Series(BaseModel):
     id: int = Field(..., description="Unique identifier for the series")
     title: str = Field(..., description="Title of the series")
     description: Optional[str] = Field(None, description="Description of the series")
-    resource_uri: str = Field(..., alias="resourceURI", description="URI of the series resource")
-    urls: List[URL] = Field(
-        default_factory=list, description="List of URLs associated with the series"
+    resource_uri: str = Field(
+        ...,
+        validation_alias="resourceURI",
+        serialization_alias="resourceURI",
+        description="URI of the series resource",
     )
+    urls: Tuple[URL, ...] = Field(default=(), description="List of URLs associated with the series")
     start_year: Optional[int] = Field(None, description="Year the series started")
     end_year: Optional[int] = Field(None, description="Year the series ended")
     rating: str = Field("", description="Rating of the series")
     modified: str = Field(..., description="Date the series was last modified")
     thumbnail: Optional[Image] = Field(None, description="Series thumbnail image")
-    comics: ComicList = Field(..., description="Comics that are part of this series")
-    stories: StoryList = Field(..., description="Stories that are part of this series")
-    events: EventList = Field(..., description="Events related to this series")
-    characters: CharacterList = Field(..., description="Characters that appear in this series")
-    creators: CreatorList = Field(..., description="Creators who worked on this series")
-    next: Optional["SeriesSummary"] = Field(None, description="Next series in chronological order")
-    previous: Optional["SeriesSummary"] = Field(
+    comics: Annotated[ComicList, LazyField()] = Field(
+        ..., description="Comics that are part of this series"
+    )
+    stories: Annotated[StoryList, LazyField()] = Field(
+        ..., description="Stories that are part of this series"
+    )
+    events: Annotated[EventList, LazyField()] = Field(
+        ..., description="Events related to this series"
+    )
+    characters: Annotated[CharacterList, LazyField()] = Field(
+        ..., description="Characters that appear in this series"
+    )
+    creators: Annotated[CreatorList, LazyField()] = Field(
+        ..., description="Creators who worked on this series"
+    )
+    next: Optional[SeriesSummary] = Field(None, description="Next series in chronological order")
+    previous: Optional[SeriesSummary] = Field(
         None, description="Previous series in chronological order"
     )
 
@@ -338,3 +191,25 @@ class SeriesResponse(BaseResponse[Series]):
     """
 
     data: Series = Field(..., description="Series data")
+
+
+def iter_series(data: bytes) -> Iterator[Series]:
+    """Yield the series of a raw series list response body one at a time.
+
+    The body is parsed once, but each series is only validated when the
+    iterator reaches it, so callers that stop early (for example after
+    finding a match) skip validating the rest of the page.
+
+    Args:
+        data: Raw JSON body of a series list endpoint response
+
+    Yields:
+        Validated series in the order returned by the API
+
+    Raises:
+        ValueError: If the body is not valid JSON
+        KeyError: If the body has no ``data.results`` list
+        pydantic.ValidationError: If a series does not match the model
+    """
+    for raw in parse_json(data)["data"]["results"]:
+        yield Series.model_validate(raw)
@@ -6,11 +6,12 @@ units within comics, representing specific plotlines, covers, or other
 content types that make up the comic book experience.
 """
 
-from typing import List, Optional
+from typing import Iterator, Optional
 
 from pydantic import Field
+from typing_extensions import Annotated
 
-from .base import BaseListResponse, BaseModel, BaseResponse, DataContainer
+from .base import BaseListResponse, BaseResponse, DataContainer, FrozenModel, LazyField, parse_json
 from .common import (
     CharacterSummary,
     ComicSummary,
@@ -18,179 +19,18 @@ from .common import (
     EventSummary,
     Image,
     SeriesSummary,
+    SummaryList,
 )
 
+# Related-resource collections embedded in a story.
+CharacterList = SummaryList[CharacterSummary]
+ComicList = SummaryList[ComicSummary]
+CreatorList = SummaryList[CreatorSummary]
+EventList = SummaryList[EventSummary]
+SeriesList = SummaryList[SeriesSummary]
 
-class CharacterList(BaseModel):
-    """Character list for story.
 
-    Represents a collection of characters that appear in a specific story,
-    including pagination metadata and a list of character summaries.
-
-    Attributes:
-        available: Number of characters available for this story
-        returned: Number of characters returned in this response
-        collection_uri: URI of the characters collection for this story
-        items: List of character summaries that appear in this story
-
-    Example:
-        >>> character_list = CharacterList(
-        ...     available=10,
-        ...     returned=5,
-        ...     collectionURI="http://gateway.marvel.com/v1/public/stories/12345/characters",
-        ...     items=[CharacterSummary(resourceURI="...", name="Iron Man")]
-        ... )
-        >>> character_list.available
-        10
-        >>> len(character_list.items)
-        1
-    """
-
-    available: int = Field(..., description="Number of characters available")
-    returned: int = Field(..., description="Number of characters returned")
-    collection_uri: str = Field(
-        ..., alias="collectionURI", description="URI of the characters collection"
-    )
-    items: List[CharacterSummary] = Field(
-        default_factory=list, description="List of character summaries"
-    )
-
-
-class ComicList(BaseModel):
-    """Comic list for story.
-
-    Represents a collection of comics that contain a specific story,
-    including pagination metadata and a list of comic summaries.
-
-    Attributes:
-        available: Number of comics available for this story
-        returned: Number of comics returned in this response
-        collection_uri: URI of the comics collection for this story
-        items: List of comic summaries that contain this story
-
-    Example:
-        >>> comic_list = ComicList(
-        ...     available=5,
-        ...     returned=3,
-        ...     collectionURI="http://gateway.marvel.com/v1/public/stories/12345/comics",
-        ...     items=[ComicSummary(resourceURI="...", name="Avengers (1963) #1")]
-        ... )
-        >>> comic_list.available
-        5
-        >>> len(comic_list.items)
-        1
-    """
-
-    available: int = Field(..., description="Number of comics available")
-    returned: int = Field(..., description="Number of comics returned")
-    collection_uri: str = Field(
-        ..., alias="collectionURI", description="URI of the comics collection"
-    )
-    items: List[ComicSummary] = Field(default_factory=list, description="List of comic summaries")
-
-
-class CreatorList(BaseModel):
-    """Creator list for story.
-
-    Represents a collection of creators who worked on a specific story,
-    including pagination metadata and a list of creator summaries.
-
-    Attributes:
-        available: Number of creators available for this story
-        returned: Number of creators returned in this response
-        collection_uri: URI of the creators collection for this story
-        items: List of creator summaries who worked on this story
-
-    Example:
-        >>> creator_list = CreatorList(
-        ...     available=8,
-        ...     returned=4,
-        ...     collectionURI="http://gateway.marvel.com/v1/public/stories/12345/creators",
-        ...     items=[CreatorSummary(resourceURI="...", name="Stan Lee", role="writer")]
-        ... )
-        >>> creator_list.available
-        8
-        >>> len(creator_list.items)
-        1
-    """
-
-    available: int = Field(..., description="Number of creators available")
-    returned: int = Field(..., description="Number of creators returned")
-    collection_uri: str = Field(
-        ..., alias="collectionURI", description="URI of the creators collection"
-    )
-    items: List[CreatorSummary] = Field(
-        default_factory=list, description="List of creator summaries"
-    )
-
-
-class EventList(BaseModel):
-    """Event list for story.
-
-    Represents a collection of events that are related to a specific story,
-    including pagination metadata and a list of event summaries.
-
-    Attributes:
-        available: Number of events available for this story
-        returned: Number of events returned in this response
-        collection_uri: URI of the events collection for this story
-        items: List of event summaries related to this story
-
-    Example:
-        >>> event_list = EventList(
-        ...     available=3,
-        ...     returned=2,
-        ...     collectionURI="http://gateway.marvel.com/v1/public/stories/12345/events",
-        ...     items=[EventSummary(resourceURI="...", name="Secret Invasion")]
-        ... )
-        >>> event_list.available
-        3
-        >>> len(event_list.items)
-        1
-    """
-
-    available: int = Field(..., description="Number of events available")
-    returned: int = Field(..., description="Number of events returned")
-    collection_uri: str = Field(
-        ..., alias="collectionURI", description="URI of the events collection"
-    )
-    items: List[EventSummary] = Field(default_factory=list, description="List of event summaries")
-
-
-class SeriesList(BaseModel):
-    """Series list for story.
-
-    Represents a collection of series that contain a specific story,
-    including pagination metadata and a list of series summaries.
-
-    Attributes:
-        available: Number of series available for this story
-        returned: Number of series returned in this response
-        collection_uri: URI of the series collection for this story
-        items: List of series summaries that contain this story
-
-    Example:
-        >>> series_list = SeriesList(
-        ...     available=2,
-        ...     returned=1,
-        ...     collectionURI="http://gateway.marvel.com/v1/public/stories/12345/series",
-        ...     items=[SeriesSummary(resourceURI="...", name="Avengers (1998 - 2004)")]
-        ... )
-        >>> series_list.available
-        2
-        >>> len(series_list.items)
-        1
-    """
-
-    available: int = Field(..., description="Number of series available")
-    returned: int = Field(..., description="Number of series returned")
-    collection_uri: str = Field(
-        ..., alias="collectionURI", description="URI of the series collection"
-    )
-    items: List[SeriesSummary] = Field(default_factory=list, description="List of series summaries")
-
-
-class Story(BaseModel):
+class Story(FrozenModel):
     """Story data model for Marvel API.
 
     Represents a Marvel story with all associated information including
@@ -238,15 +78,30 @@ class Story(BaseModel):
     id: int = Field(..., description="Unique identifier for the story")
     title: str = Field(..., description="Title of the story")
     description: str = Field(..., description="Description of the story")
-    resource_uri: str = Field(..., alias="resourceURI", description="URI of the story resource")
+    resource_uri: str = Field(
+        ...,
+        validation_alias="resourceURI",
+        serialization_alias="resourceURI",
+        description="URI of the story resource",
+    )
     type: str = Field(..., description="Type of the story")
     modified: str = Field(..., description="Date the story was last modified")
     thumbnail: Optional[Image] = Field(None, description="Story thumbnail image")
-    comics: ComicList = Field(..., description="Comics that contain this story")
-    series: SeriesList = Field(..., description="Series that contain this story")
-    events: EventList = Field(..., description="Events related to this story")
-    characters: CharacterList = Field(..., description="Characters that appear in this story")
-    creators: CreatorList = Field(..., description="Creators who worked on this story")
+    comics: Annotated[ComicList, LazyField()] = Field(
+        ..., description="Comics that contain this story"
+    )
+    series: Annotated[SeriesList, LazyField()] = Field(
+        ..., description="Series that contain this story"
+    )
+    events: Annotated[EventList, LazyField()] = Field(
+        ..., description="Events related to this story"
+    )
+    characters: Annotated[CharacterList, LazyField()] = Field(
+        ..., description="Characters that appear in this story"
+    )
+    creators: Annotated[CreatorList, LazyField()] = Field(
+        ..., description="Creators who worked on this story"
+    )
     original_issue: Optional[ComicSummary] = Field(
         None, description="Original issue where this story first appeared"
     )
@@ -322,3 +177,25 @@ class StoryResponse(BaseResponse[Story]):
     """
 
     data: Story = Field(..., description="Story data")
+
+
+def iter_stories(data: bytes) -> Iterator[Story]:
+    """Yield the stories of a raw story list response body one at a time.
+
+    The body is parsed once, but each story is only validated when the
+    iterator reaches it, so callers that stop early (for example after
+    finding a match) skip validating the rest of the page.
+
+    Args:
+        data: Raw JSON body of a story list endpoint response
+
+    Yields:
+        Validated stories in the order returned by the API
+
+    Raises:
+        ValueError: If the body is not valid JSON
+        KeyError: If the body has no ``data.results`` list
+        pydantic.ValidationError: If a story does not match the model
+    """
+    for raw in parse_json(data)["data"]["results"]:
+        yield Story.model_validate(raw)
@@ -2,9 +2,12 @@
 
 from .auth import generate_auth_params
 from .error_handling import (
+    Bulkhead,
+    CircuitBreaker,
     classify_http_error,
     create_marvel_error,
     format_error_message,
+    full_jitter_schedule,
     handle_httpx_error,
     log_error,
     retry_with_backoff,
@@ -12,6 +15,7 @@ from .error_handling import (
 from .exceptions import (
     MarvelAPIError,
     MarvelAuthenticationError,
+    MarvelBulkheadFullError,
     MarvelNetworkError,
     MarvelNotFoundError,
     MarvelRateLimitError,
@@ -20,9 +24,13 @@ from .exceptions import (
 )
 
 __all__ = [
+    # Circuit breaker and bulkhead
+    "Bulkhead",
+    "CircuitBreaker",
     # Exception classes
     "MarvelAPIError",
     "MarvelAuthenticationError",
+    "MarvelBulkheadFullError",
     "MarvelNetworkError",
     "MarvelNotFoundError",
     "MarvelRateLimitError",
@@ -32,6 +40,7 @@ __all__ = [
     "classify_http_error",
     "create_marvel_error",
     "format_error_message",
+    "full_jitter_schedule",
     # Authentication utilities
     "generate_auth_params",
     "handle_httpx_error",
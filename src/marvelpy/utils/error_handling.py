@@ -6,13 +6,20 @@ including error classification, retry logic, and error formatting.
 
 import asyncio
 import logging
-from typing import Any, Awaitable, Callable, Dict, List, Optional, Type
+import random
+import sys
+import time
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple, Type
 
 import httpx
 
+from marvelpy.models.base import parse_json
+
 from .exceptions import (
     MarvelAPIError,
     MarvelAuthenticationError,
+    MarvelBulkheadFullError,
     MarvelNetworkError,
     MarvelNotFoundError,
     MarvelRateLimitError,
@@ -22,6 +29,42 @@ from .exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Source of retry jitter. Random() seeds itself from os.urandom, so separate
+# processes retrying the same failure do not draw the same delays.
+_rng = random.Random()
+
+# Error classes for the client-error status codes the Marvel API uses.
+_STATUS_MAP: Dict[int, Type[MarvelAPIError]] = {
+    400: MarvelValidationError,
+    401: MarvelAuthenticationError,
+    404: MarvelNotFoundError,
+    429: MarvelRateLimitError,
+}
+
+# Error class for every status code below 600, indexed by the code itself.
+_STATUS_TABLE: Tuple[Type[MarvelAPIError], ...] = tuple(
+    MarvelServerError if code >= 500 else _STATUS_MAP.get(code, MarvelAPIError)
+    for code in range(600)
+)
+
+# Messages create_marvel_error uses when the caller gives none.
+_DEFAULT_MESSAGES: Dict[type, str] = {
+    MarvelAuthenticationError: "Authentication failed",
+    MarvelNotFoundError: "Resource not found",
+    MarvelValidationError: "Validation failed",
+    MarvelRateLimitError: "Rate limit exceeded",
+    MarvelServerError: "Server error occurred",
+}
+
+# Log level per error class; subclasses use the entry of their nearest base.
+_LOG_LEVELS: Dict[type, int] = {
+    MarvelServerError: logging.ERROR,
+    MarvelRateLimitError: logging.WARNING,
+    MarvelNetworkError: logging.WARNING,
+    MarvelBulkheadFullError: logging.WARNING,
+    MarvelAuthenticationError: logging.ERROR,
+}
+
 
 def classify_http_error(
     status_code: int,
@@ -48,18 +91,9 @@ def classify_http_error(
         >>> error_class = classify_http_error(401)
         >>> print(error_class.__name__)  # MarvelAuthenticationError
     """
-    if status_code == 401:
-        return MarvelAuthenticationError
-    elif status_code == 404:
-        return MarvelNotFoundError
-    elif status_code == 400:
-        return MarvelValidationError
-    elif status_code == 429:
-        return MarvelRateLimitError
-    elif 500 <= status_code < 600:
-        return MarvelServerError
-    else:
-        return MarvelAPIError
+    if 0 <= status_code < 600:
+        return _STATUS_TABLE[status_code]
+    return MarvelAPIError
 
 
 def create_marvel_error(
@@ -98,18 +132,7 @@ def create_marvel_error(
 
     # Use default message if none provided
     if message is None:
-        if error_class == MarvelAuthenticationError:
-            message = "Authentication failed"
-        elif error_class == MarvelNotFoundError:
-            message = "Resource not found"
-        elif error_class == MarvelValidationError:
-            message = "Validation failed"
-        elif error_class == MarvelRateLimitError:
-            message = "Rate limit exceeded"
-        elif error_class == MarvelServerError:
-            message = "Server error occurred"
-        else:
-            message = "Marvel API error occurred"
+        message = _DEFAULT_MESSAGES.get(error_class, "Marvel API error occurred")
 
     return error_class(
         message=message,
@@ -120,6 +143,79 @@ def create_marvel_error(
     )
 
 
+def _handle_status(
+    error: httpx.HTTPStatusError, request_data: Optional[Dict[str, Any]]
+) -> MarvelAPIError:
+    """Convert an HTTP status error into the error class for its status code."""
+    status_code = error.response.status_code
+    # Parse the body bytes directly; on failure decode them once for the text
+    raw = error.response.content
+    try:
+        response_data = parse_json(raw)
+    except ValueError:
+        response_data = {"text": raw.decode("utf-8", errors="replace")}
+
+    # Pass the server's Retry-After hint on to the retry loop
+    kwargs: Dict[str, Any] = {}
+    if status_code == 429:
+        retry_after = error.response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            kwargs["retry_after"] = int(retry_after)
+
+    return create_marvel_error(
+        status_code=status_code,
+        message=f"HTTP {status_code} error: {error.response.reason_phrase}",
+        response_data=response_data,
+        request_data=request_data,
+        **kwargs,
+    )
+
+
+def _handle_timeout(
+    error: httpx.TimeoutException, request_data: Optional[Dict[str, Any]]
+) -> MarvelAPIError:
+    """Convert a timeout into a network error."""
+    return MarvelNetworkError(
+        message="Request timeout - the Marvel API did not respond in time",
+        request_data=request_data,
+        original_error=error,
+    )
+
+
+def _handle_connect(
+    error: httpx.ConnectError, request_data: Optional[Dict[str, Any]]
+) -> MarvelAPIError:
+    """Convert a connection failure into a network error."""
+    return MarvelNetworkError(
+        message="Connection error - unable to connect to the Marvel API",
+        request_data=request_data,
+        original_error=error,
+    )
+
+
+def _handle_other(
+    error: httpx.HTTPError,
+    request_data: Optional[Dict[str, Any]],
+    prefix: str = "Network error",
+) -> MarvelAPIError:
+    """Convert any other httpx error into a network error."""
+    return MarvelNetworkError(
+        message=f"{prefix}: {error}",
+        request_data=request_data,
+        original_error=error,
+    )
+
+
+# Converters for handle_httpx_error, keyed by httpx error class. Lookups walk
+# the error's MRO, so subclasses use the converter of their nearest base.
+_HTTPX_HANDLERS: Dict[type, Callable[..., MarvelAPIError]] = {
+    httpx.HTTPStatusError: _handle_status,
+    httpx.TimeoutException: _handle_timeout,
+    httpx.ConnectError: _handle_connect,
+    httpx.RequestError: partial(_handle_other, prefix="Request error"),
+}
+
+
 def handle_httpx_error(
     error: httpx.HTTPError,
     request_data: Optional[Dict[str, Any]] = None,
@@ -144,52 +240,107 @@ def handle_httpx_error(
         ...     marvel_error = handle_httpx_error(e)
         ...     print(f"Marvel API Error: {marvel_error}")
     """
-    if isinstance(error, httpx.HTTPStatusError):
-        # Handle HTTP status errors
-        status_code = error.response.status_code
-        try:
-            response_data = error.response.json()
-        except Exception:
-            response_data = {"text": error.response.text}
-
-        return create_marvel_error(
-            status_code=status_code,
-            message=f"HTTP {status_code} error: {error.response.reason_phrase}",
-            response_data=response_data,
-            request_data=request_data,
-        )
+    for klass in type(error).__mro__:
+        handler = _HTTPX_HANDLERS.get(klass)
+        if handler is not None:
+            return handler(error, request_data)
 
-    elif isinstance(error, httpx.TimeoutException):
-        # Handle timeout errors
-        return MarvelNetworkError(
-            message="Request timeout - the Marvel API did not respond in time",
-            request_data=request_data,
-            original_error=error,
-        )
+    # Handle any other httpx errors
+    return _handle_other(error, request_data)
 
-    elif isinstance(error, httpx.ConnectError):
-        # Handle connection errors
-        return MarvelNetworkError(
-            message="Connection error - unable to connect to the Marvel API",
-            request_data=request_data,
-            original_error=error,
-        )
 
-    elif isinstance(error, httpx.RequestError):
-        # Handle other request errors
-        return MarvelNetworkError(
-            message=f"Request error: {error!s}",
-            request_data=request_data,
-            original_error=error,
-        )
+class Bulkhead:
+    """Cap the number of concurrent calls to an upstream.
 
-    else:
-        # Handle any other httpx errors
-        return MarvelNetworkError(
-            message=f"Network error: {error!s}",
-            request_data=request_data,
-            original_error=error,
-        )
+    At most ``limit`` calls run at once and up to ``queue_depth`` more wait
+    for a slot. Further calls are rejected straight away with a
+    ``MarvelBulkheadFullError`` rather than piling up behind a slow upstream.
+    The semaphore is created on first use, so it binds to the event loop
+    that runs the calls rather than whichever loop is current at creation.
+
+    Example:
+        >>> bulkhead = Bulkhead(limit=50, queue_depth=100)
+        >>> result = await retry_with_backoff(api_call, bulkhead=bulkhead)
+    """
+
+    def __init__(self, limit: int = 50, queue_depth: int = 100) -> None:
+        """Initialize the bulkhead.
+
+        Args:
+            limit: Maximum number of calls running at once (default: 50)
+            queue_depth: Maximum number of calls waiting for a slot (default: 100)
+        """
+        self._limit = limit
+        self._sem: Optional[asyncio.Semaphore] = None
+        self._queued = 0
+        self._max_queued = queue_depth
+
+    async def __aenter__(self) -> "Bulkhead":
+        if self._sem is None:
+            self._sem = asyncio.Semaphore(self._limit)
+        if self._sem.locked():
+            if self._queued >= self._max_queued:
+                raise MarvelBulkheadFullError()
+            self._queued += 1
+            try:
+                await self._sem.acquire()
+            finally:
+                self._queued -= 1
+        else:
+            await self._sem.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        assert self._sem is not None
+        self._sem.release()
+
+
+def full_jitter_schedule(
+    base_delay: float, backoff_factor: float, max_delay: float, retries: int
+) -> Iterator[float]:
+    """Yield retry delays with exponential backoff and full jitter.
+
+    Each delay is drawn uniformly between zero and
+    ``min(base_delay * backoff_factor**attempt, max_delay)``.
+
+    Args:
+        base_delay: Upper bound in seconds of the first delay
+        backoff_factor: Factor the bound grows by for each retry
+        max_delay: Maximum delay in seconds
+        retries: Number of delays to yield
+
+    Returns:
+        An iterator over the delays, one per retry
+
+    Example:
+        >>> list(full_jitter_schedule(1.0, 2.0, 60.0, 3))  # e.g. [0.4, 1.7, 2.9]
+    """
+    for attempt in range(retries):
+        yield _rng.uniform(0, min(base_delay * backoff_factor**attempt, max_delay))
+
+
+async def _call_within(
+    func: Callable[..., Awaitable[Any]], deadline: Optional[float], start: float
+) -> Any:
+    """Await func, cutting it off once ``deadline`` seconds have passed since start."""
+    if deadline is None:
+        return await func()
+    try:
+        return await asyncio.wait_for(func(), deadline - (time.monotonic() - start))
+    except asyncio.TimeoutError as error:
+        raise MarvelNetworkError(
+            message=f"Request deadline of {deadline}s exceeded", original_error=error
+        ) from error
+
+
+def _is_retryable(error: Exception, retry_on: Optional[Tuple[Type[Exception], ...]]) -> bool:
+    """Whether an error is retryable; a group of errors must be retryable throughout."""
+    # Failures of an asyncio.TaskGroup (Python 3.11+) arrive bundled in a group
+    if sys.version_info >= (3, 11) and isinstance(error, ExceptionGroup):  # noqa: F821
+        return all(_is_retryable(member, retry_on) for member in error.exceptions)
+    if retry_on is None:
+        return getattr(error, "RETRYABLE", False)
+    return isinstance(error, retry_on)
 
 
 async def retry_with_backoff(
@@ -199,19 +350,36 @@ async def retry_with_backoff(
     max_delay: float = 60.0,
     backoff_factor: float = 2.0,
     retry_on: Optional[List[Type[Exception]]] = None,
+    bulkhead: Optional[Bulkhead] = None,
+    deadline: Optional[float] = None,
+    schedule_factory: Callable[..., Iterator[float]] = full_jitter_schedule,
 ) -> Any:
-    """Retry a function with exponential backoff.
+    """Retry a function with exponential backoff and full jitter.
 
     This function implements retry logic with exponential backoff for
-    handling transient errors from the Marvel API.
+    handling transient errors from the Marvel API. Each wait is drawn
+    uniformly between zero and the exponential delay for that attempt
+    (capped at ``max_delay``), so clients that fail together do not all
+    retry at the same moment. A ``MarvelRateLimitError`` carrying
+    ``retry_after`` waits that many seconds plus up to one second of jitter
+    instead, even if that is longer than ``max_delay``.
+
+    With a ``deadline``, each attempt is cut off when the time budget runs
+    out, and the last error is raised instead of waiting for a retry that
+    could not start before the deadline.
 
     Args:
         func: The async function to retry
         max_retries: Maximum number of retry attempts (default: 3)
-        base_delay: Base delay in seconds for the first retry (default: 1.0)
+        base_delay: Upper bound in seconds of the first retry delay (default: 1.0)
         max_delay: Maximum delay in seconds between retries (default: 60.0)
-        backoff_factor: Factor to multiply delay by for each retry (default: 2.0)
-        retry_on: List of exception types to retry on (default: server errors)
+        backoff_factor: Factor the delay bound grows by for each retry (default: 2.0)
+        retry_on: List of exception types to retry on (default: errors whose class
+            sets ``RETRYABLE``, i.e. server, rate limit and network errors)
+        bulkhead: Bulkhead each attempt must get a slot from (default: no limit)
+        deadline: Seconds from the first attempt after which to give up (default: none)
+        schedule_factory: Called with ``(base_delay, backoff_factor, max_delay,
+            max_retries)`` to get the retry delays (default: full_jitter_schedule)
 
     Returns:
         The result of the function call
@@ -230,36 +398,47 @@ async def retry_with_backoff(
         ...     base_delay=1.0
         ... )
     """
-    if retry_on is None:
-        retry_on = [MarvelServerError, MarvelRateLimitError, MarvelNetworkError]
+    # One isinstance call against a tuple instead of one per type per failure
+    retryable = None if retry_on is None else tuple(retry_on)
 
     last_exception = None
-    delay = base_delay
+    start = time.monotonic()
+    schedule = schedule_factory(base_delay, backoff_factor, max_delay, max_retries)
 
     for attempt in range(max_retries + 1):
         try:
-            return await func()
+            if bulkhead is None:
+                return await _call_within(func, deadline, start)
+            # Hold a slot only while calling, not while sleeping between attempts
+            async with bulkhead:
+                return await _call_within(func, deadline, start)
         except Exception as e:
             last_exception = e
 
             # Check if this is a retryable error
-            if not any(isinstance(e, error_type) for error_type in retry_on):
+            if not _is_retryable(e, retryable):
                 raise e
 
             # If this is the last attempt, raise the exception
             if attempt == max_retries:
-                logger.warning(f"All {max_retries} retry attempts exhausted")
+                logger.warning("All %d retry attempts exhausted", max_retries)
+                raise e
+
+            delay = next(schedule)
+            if isinstance(e, MarvelRateLimitError) and e.retry_after:
+                # The server said when to come back; jitter only spreads callers out
+                delay = e.retry_after + _rng.uniform(0, 1)
+
+            if deadline is not None and time.monotonic() - start + delay >= deadline:
+                logger.warning("Retry deadline of %ss reached", deadline)
                 raise e
 
-            # Log the retry attempt
-            logger.warning(f"Attempt {attempt + 1} failed: {e}. Retrying in {delay:.1f}s...")
+            # Log the retry attempt; str(e) is only built if the record is emitted
+            logger.warning("Attempt %d failed: %s. Retrying in %.1fs...", attempt + 1, e, delay)
 
             # Wait before retrying
             await asyncio.sleep(delay)
 
-            # Calculate next delay with exponential backoff
-            delay = min(delay * backoff_factor, max_delay)
-
     # This should never be reached, but just in case
     if last_exception is not None:
         raise last_exception
@@ -267,6 +446,41 @@ async def retry_with_backoff(
         raise RuntimeError("Retry failed without any exceptions")
 
 
+def _not_found_hint(error: MarvelNotFoundError) -> str:
+    """Name the missing resource, if known."""
+    if error.resource_type and error.resource_id:
+        return f" - {error.resource_type.title()} with ID {error.resource_id} not found"
+    if error.resource_type:
+        return f" - {error.resource_type.title()} not found"
+    return ""
+
+
+def _rate_limit_hint(error: MarvelRateLimitError) -> str:
+    """Say how long to wait before retrying."""
+    if error.retry_after:
+        return f" - Retry after {error.retry_after} seconds"
+    return " - Please wait before making more requests"
+
+
+def _validation_hint(error: MarvelValidationError) -> str:
+    """List the validation errors, if any."""
+    if error.validation_errors:
+        return f" - Validation errors: {', '.join(error.validation_errors)}"
+    return ""
+
+
+# Suffixes format_error_message adds per error class, looked up along the
+# error's MRO so subclasses get their nearest base's hint.
+_ERROR_HINTS: Dict[type, Callable[[Any], str]] = {
+    MarvelNotFoundError: _not_found_hint,
+    MarvelRateLimitError: _rate_limit_hint,
+    MarvelValidationError: _validation_hint,
+    MarvelNetworkError: lambda _: " - Please check your internet connection and try again",
+    MarvelServerError: lambda _: " - Please try again later",
+    MarvelAuthenticationError: lambda _: " - Please check your API keys",
+}
+
+
 def format_error_message(error: MarvelAPIError) -> str:
     """Format a Marvel API error into a user-friendly message.
 
@@ -288,35 +502,11 @@ def format_error_message(error: MarvelAPIError) -> str:
         >>> message = format_error_message(error)
         >>> print(message)  # "Character not found (Status: 404)"
     """
-    message = str(error)
-
-    # Add additional context for specific error types
-    if isinstance(error, MarvelNotFoundError):
-        if error.resource_type and error.resource_id:
-            message += f" - {error.resource_type.title()} with ID {error.resource_id} not found"
-        elif error.resource_type:
-            message += f" - {error.resource_type.title()} not found"
-
-    elif isinstance(error, MarvelRateLimitError):
-        if error.retry_after:
-            message += f" - Retry after {error.retry_after} seconds"
-        else:
-            message += " - Please wait before making more requests"
-
-    elif isinstance(error, MarvelValidationError):
-        if error.validation_errors:
-            message += f" - Validation errors: {', '.join(error.validation_errors)}"
-
-    elif isinstance(error, MarvelNetworkError):
-        message += " - Please check your internet connection and try again"
-
-    elif isinstance(error, MarvelServerError):
-        message += " - Please try again later"
-
-    elif isinstance(error, MarvelAuthenticationError):
-        message += " - Please check your API keys"
-
-    return message
+    for klass in type(error).__mro__:
+        hint = _ERROR_HINTS.get(klass)
+        if hint is not None:
+            return str(error) + hint(error)
+    return str(error)
 
 
 def log_error(error: MarvelAPIError, logger: Optional[logging.Logger] = None) -> None:
@@ -337,14 +527,16 @@ def log_error(error: MarvelAPIError, logger: Optional[logging.Logger] = None) ->
         logger = logging.getLogger(__name__)
 
     # Determine log level based on error type
-    if isinstance(error, MarvelServerError):
-        log_level = logging.ERROR
-    elif isinstance(error, (MarvelRateLimitError, MarvelNetworkError)):
-        log_level = logging.WARNING
-    elif isinstance(error, MarvelAuthenticationError):
-        log_level = logging.ERROR
-    else:
-        log_level = logging.INFO
+    log_level = logging.INFO
+    for klass in type(error).__mro__:
+        level = _LOG_LEVELS.get(klass)
+        if level is not None:
+            log_level = level
+            break
+
+    # Skip building the message when the record would be dropped anyway
+    if not logger.isEnabledFor(log_level):
+        return
 
     # Create log message with context
     message = format_error_message(error)
@@ -362,3 +554,117 @@ def log_error(error: MarvelAPIError, logger: Optional[logging.Logger] = None) ->
         message += f" ({', '.join(context)})"
 
     logger.log(log_level, message)
+
+
+def _is_upstream_failure(error: Exception) -> bool:
+    """Whether an error means the API itself is failing, not the request."""
+    if isinstance(error, httpx.HTTPStatusError):
+        status_code = error.response.status_code
+        return status_code == 429 or status_code >= 500
+    return getattr(error, "RETRYABLE", False) or isinstance(error, httpx.TransportError)
+
+
+class CircuitBreaker:
+    """Stop calling an upstream that keeps failing.
+
+    The breaker starts CLOSED and passes calls through ``retry_with_backoff``.
+    After ``failure_threshold`` consecutive calls fail with server, rate limit
+    or network errors (once their retries are spent) it opens, and for
+    ``recovery_timeout`` seconds every call fails at once with a
+    ``MarvelNetworkError`` chained from the last such error, instead of
+    sleeping through another round of retries. The first
+    call after that window runs as a trial in the HALF_OPEN state, and other
+    calls keep failing fast until it finishes: success closes the breaker
+    again, failure re-opens it. Client errors such as 404s do not
+    count as failures.
+
+    Attributes:
+        failure_threshold: Consecutive failures that open the breaker
+        recovery_timeout: Seconds the breaker stays open before a trial call
+        state: Current state, one of CLOSED, OPEN or HALF_OPEN
+        failure_count: Consecutive failures seen while closed
+        opened_at: ``time.monotonic()`` timestamp the breaker last opened at
+
+    Example:
+        >>> breaker = CircuitBreaker(failure_threshold=5, recovery_timeout=30.0)
+        >>> result = await breaker.call(api_call, max_retries=3)
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0) -> None:
+        """Initialize a closed circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the breaker (default: 5)
+            recovery_timeout: Seconds to stay open before a trial call (default: 30.0)
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = self.CLOSED
+        self.failure_count = 0
+        self.opened_at = 0.0
+        self._last_error: Optional[Exception] = None
+        self._probing = False
+
+    async def call(self, func: Callable[..., Awaitable[Any]], **retry_kwargs: Any) -> Any:
+        """Call a function through the breaker with retries.
+
+        Args:
+            func: The async function to call
+            **retry_kwargs: Keyword arguments passed on to ``retry_with_backoff``
+
+        Returns:
+            The result of the function call
+
+        Raises:
+            MarvelNetworkError: While the breaker is open, chained from the
+                last upstream error
+            Otherwise whatever ``retry_with_backoff`` raises
+        """
+        if self.state == self.OPEN:
+            if time.monotonic() - self.opened_at < self.recovery_timeout:
+                raise self._open_error() from self._last_error
+            self.state = self.HALF_OPEN
+
+        probe = self.state == self.HALF_OPEN
+        if probe:
+            if self._probing:
+                raise self._open_error() from self._last_error
+            self._probing = True
+
+        try:
+            result = await retry_with_backoff(func, **retry_kwargs)
+        except Exception as e:
+            if _is_upstream_failure(e):
+                self._record_failure(e)
+            raise
+        finally:
+            if probe:
+                self._probing = False
+
+        self.state = self.CLOSED
+        self.failure_count = 0
+        self._last_error = None
+        return result
+
+    def _open_error(self) -> MarvelNetworkError:
+        """Build the error for a call rejected without reaching the upstream."""
+        return MarvelNetworkError(
+            message="Circuit open - Marvel API is failing, not retrying yet",
+            original_error=self._last_error,
+        )
+
+    def _record_failure(self, error: Exception) -> None:
+        """Count a failed call and open the breaker if it is due."""
+        self._last_error = error
+        self.failure_count += 1
+        if self.state == self.HALF_OPEN or self.failure_count >= self.failure_threshold:
+            if self.state != self.OPEN:
+                logger.warning(
+                    "Circuit breaker opened after %s failures: %s", self.failure_count, error
+                )
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
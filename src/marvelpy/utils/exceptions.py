@@ -5,7 +5,7 @@ of errors that can occur when interacting with the Marvel API. These exceptions
 provide more specific error handling and better debugging information.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 
 class MarvelAPIError(Exception):
@@ -30,6 +30,12 @@ class MarvelAPIError(Exception):
         ...         print(f"Status Code: {e.status_code}")
     """
 
+    # Slots instead of a per-instance __dict__ keep raised errors small.
+    __slots__ = ("request_data", "response_data", "status_code")
+
+    # Whether retry_with_backoff retries this error by default.
+    RETRYABLE = False
+
     def __init__(
         self,
         message: str,
@@ -47,16 +53,32 @@ class MarvelAPIError(Exception):
             request_data: Request data that caused the error (if available)
         """
         super().__init__(message)
-        self.message = message
         self.status_code = status_code
         self.response_data = response_data
         self.request_data = request_data
 
+    @property
+    def message(self) -> str:
+        """Error message describing what went wrong (stored as ``args[0]``)."""
+        return self.args[0]  # type: ignore[no-any-return]
+
+    @message.setter
+    def message(self, value: str) -> None:
+        self.args = (value,)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle slot attributes, which BaseException.__reduce__ leaves out."""
+        state = dict(self.__dict__)
+        for klass in type(self).__mro__:
+            for name in klass.__dict__.get("__slots__", ()):
+                state[name] = getattr(self, name)
+        return type(self), self.args, state
+
     def __str__(self) -> str:
         """Return string representation of the error."""
         if self.status_code:
-            return f"{self.message} (Status: {self.status_code})"
-        return self.message
+            return f"{self.args[0]} (Status: {self.status_code})"
+        return self.args[0]  # type: ignore[no-any-return]
 
 
 class MarvelAuthenticationError(MarvelAPIError):
@@ -81,6 +103,8 @@ class MarvelAuthenticationError(MarvelAPIError):
         ...     print("Please check your API keys")
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = "Authentication failed",
@@ -122,6 +146,9 @@ class MarvelRateLimitError(MarvelAPIError):
         ...         print(f"Retry after {e.retry_after} seconds")
     """
 
+    __slots__ = ("retry_after",)
+    RETRYABLE = True
+
     def __init__(
         self,
         message: str = "Rate limit exceeded",
@@ -168,6 +195,8 @@ class MarvelNotFoundError(MarvelAPIError):
         ...         print(f"{e.resource_type} with ID {e.resource_id} not found")
     """
 
+    __slots__ = ("resource_id", "resource_type")
+
     def __init__(
         self,
         message: str = "Resource not found",
@@ -216,6 +245,8 @@ class MarvelValidationError(MarvelAPIError):
         ...             print(f"  - {error}")
     """
 
+    __slots__ = ("validation_errors",)
+
     def __init__(
         self,
         message: str = "Validation failed",
@@ -259,6 +290,9 @@ class MarvelServerError(MarvelAPIError):
         ...     print("Please try again later")
     """
 
+    __slots__ = ()
+    RETRYABLE = True
+
     def __init__(
         self,
         message: str = "Server error occurred",
@@ -300,6 +334,9 @@ class MarvelNetworkError(MarvelAPIError):
         ...     print("Please check your internet connection")
     """
 
+    __slots__ = ("original_error",)
+    RETRYABLE = True
+
     def __init__(
         self,
         message: str = "Network error occurred",
@@ -319,3 +356,41 @@ class MarvelNetworkError(MarvelAPIError):
         """
         super().__init__(message, status_code, response_data, request_data)
         self.original_error = original_error
+
+
+class MarvelBulkheadFullError(MarvelAPIError):
+    """Exception raised when a bulkhead rejects a call.
+
+    This exception is raised when too many requests are already running or
+    waiting on a ``Bulkhead``. It reflects local back-pressure rather than a
+    problem with the Marvel API, so it is not retried and does not count
+    towards opening a circuit breaker.
+
+    Attributes:
+        message: Error message describing the rejection
+        status_code: Always None; no request was sent
+        response_data: Always None
+        request_data: Request data that was rejected (if available)
+
+    Example:
+        >>> try:
+        ...     # API call made while the bulkhead is full
+        ...     pass
+        ... except MarvelBulkheadFullError as e:
+        ...     print(f"Too busy: {e.message}")
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        message: str = "Bulkhead full - too many concurrent Marvel API requests",
+        request_data: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Initialize the bulkhead full error.
+
+        Args:
+            message: Error message describing the rejection
+            request_data: Request data that was rejected (if available)
+        """
+        super().__init__(message, None, None, request_data)
@@ -1,31 +1,310 @@
 """Comprehensive tests for the enhanced MarvelClient."""
 
 import logging
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
 
 import pytest
 
 from marvelpy.client import MarvelClient
-from marvelpy.models.character import Character, CharacterListResponse
-from marvelpy.models.comic import Comic, ComicListResponse
-from marvelpy.models.creator import CreatorListResponse
-from marvelpy.models.event import EventListResponse
-from marvelpy.models.series import SeriesListResponse
-from marvelpy.models.story import StoryListResponse
-
-# Configure logging for unit tests
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
+
+# Progress messages are opt-in: run pytest with --log-cli-level=INFO to see them
 logger = logging.getLogger(__name__)
 
+# Stand-ins for endpoint responses; the client only passes them through.
+CHARACTER_LIST = object()
+COMIC_LIST = object()
+CREATOR_LIST = object()
+EVENT_LIST = object()
+SERIES_LIST = object()
+STORY_LIST = object()
+
+# Keyword arguments the list and search methods are expected to forward.
+LIST_CHARACTERS_KWARGS = {
+    "limit": 10,
+    "offset": None,
+    "name": None,
+    "name_starts_with": "Spider",
+    "modified_since": None,
+    "comics": [123, 456],
+    "series": None,
+    "events": None,
+    "stories": None,
+    "order_by": None,
+}
+
+SEARCH_CHARACTERS_KWARGS = {
+    "name_starts_with": "iron man",
+    "limit": 5,
+    "offset": None,
+}
+
+LIST_COMICS_KWARGS = {
+    "limit": 10,
+    "offset": None,
+    "format": "comic",
+    "format_type": None,
+    "no_variants": None,
+    "date_descriptor": None,
+    "date_range": None,
+    "diamond_code": None,
+    "digital_id": None,
+    "upc": None,
+    "isbn": None,
+    "ean": None,
+    "issn": None,
+    "has_digital_issue": None,
+    "modified_since": None,
+    "creators": None,
+    "characters": [1009368],
+    "series": None,
+    "events": None,
+    "stories": None,
+    "shared_appearances": None,
+    "collaborators": None,
+    "order_by": None,
+}
+
+SEARCH_COMICS_KWARGS = {
+    "title_starts_with": "amazing spider-man",
+    "limit": 5,
+    "offset": None,
+}
+
+# Client methods for related resources: (client method, item ID, limit, endpoint
+# attribute, endpoint method, endpoint result, keyword arguments expected by the
+# endpoint).
+RELATED_RESOURCE_CASES = [
+    (
+        "get_character_comics",
+        1009368,
+        5,
+        "characters",
+        "get_comics",
+        COMIC_LIST,
+        {
+            "character_id": 1009368,
+            "limit": 5,
+            "offset": None,
+            "format": None,
+            "format_type": None,
+            "no_variants": None,
+            "date_descriptor": None,
+            "date_range": None,
+            "diamond_code": None,
+            "digital_id": None,
+            "upc": None,
+            "isbn": None,
+            "ean": None,
+            "issn": None,
+            "has_digital_issue": None,
+            "modified_since": None,
+            "creators": None,
+            "series": None,
+            "events": None,
+            "stories": None,
+            "shared_appearances": None,
+            "collaborators": None,
+            "order_by": None,
+        },
+    ),
+    (
+        "get_character_events",
+        1009368,
+        3,
+        "characters",
+        "get_events",
+        EVENT_LIST,
+        {
+            "character_id": 1009368,
+            "limit": 3,
+            "offset": None,
+            "name": None,
+            "name_starts_with": None,
+            "modified_since": None,
+            "creators": None,
+            "series": None,
+            "comics": None,
+            "stories": None,
+            "order_by": None,
+        },
+    ),
+    (
+        "get_character_series",
+        1009368,
+        5,
+        "characters",
+        "get_series",
+        SERIES_LIST,
+        {
+            "character_id": 1009368,
+            "limit": 5,
+            "offset": None,
+            "title": None,
+            "title_starts_with": None,
+            "start_year": None,
+            "modified_since": None,
+            "comics": None,
+            "stories": None,
+            "events": None,
+            "creators": None,
+            "series_type": None,
+            "contains": None,
+            "order_by": None,
+        },
+    ),
+    (
+        "get_character_stories",
+        1009368,
+        5,
+        "characters",
+        "get_stories",
+        STORY_LIST,
+        {
+            "character_id": 1009368,
+            "limit": 5,
+            "offset": None,
+            "modified_since": None,
+            "comics": None,
+            "series": None,
+            "events": None,
+            "creators": None,
+            "order_by": None,
+        },
+    ),
+    (
+        "get_character_creators",
+        1009368,
+        5,
+        "characters",
+        "get_creators",
+        CREATOR_LIST,
+        {
+            "character_id": 1009368,
+            "limit": 5,
+            "offset": None,
+            "modified_since": None,
+            "comics": None,
+            "series": None,
+            "events": None,
+            "stories": None,
+            "order_by": None,
+        },
+    ),
+    (
+        "get_comic_characters",
+        21366,
+        5,
+        "comics",
+        "get_characters",
+        CHARACTER_LIST,
+        {
+            "comic_id": 21366,
+            "limit": 5,
+            "offset": None,
+            "name": None,
+            "name_starts_with": None,
+            "modified_since": None,
+            "series": None,
+            "events": None,
+            "stories": None,
+            "order_by": None,
+        },
+    ),
+    (
+        "get_comic_creators",
+        21366,
+        5,
+        "comics",
+        "get_creators",
+        CREATOR_LIST,
+        {
+            "comic_id": 21366,
+            "limit": 5,
+            "offset": None,
+            "first_name": None,
+            "middle_name": None,
+            "last_name": None,
+            "suffix": None,
+            "name_starts_with": None,
+            "first_name_starts_with": None,
+            "middle_name_starts_with": None,
+            "last_name_starts_with": None,
+            "modified_since": None,
+            "comics": None,
+            "series": None,
+            "events": None,
+            "stories": None,
+            "order_by": None,
+        },
+    ),
+    (
+        "get_comic_events",
+        21366,
+        3,
+        "comics",
+        "get_events",
+        EVENT_LIST,
+        {
+            "comic_id": 21366,
+            "limit": 3,
+            "offset": None,
+            "name": None,
+            "name_starts_with": None,
+            "modified_since": None,
+            "creators": None,
+            "characters": None,
+            "series": None,
+            "stories": None,
+            "order_by": None,
+        },
+    ),
+    (
+        "get_comic_stories",
+        21366,
+        5,
+        "comics",
+        "get_stories",
+        STORY_LIST,
+        {
+            "comic_id": 21366,
+            "limit": 5,
+            "offset": None,
+            "modified_since": None,
+            "series": None,
+            "events": None,
+            "creators": None,
+            "characters": None,
+            "order_by": None,
+        },
+    ),
+]
+
+
+def fake_endpoint_method(result):
+    """Create an async stand-in for an endpoint method.
+
+    Returns the fake and the list its calls are recorded in, as
+    (args, kwargs) pairs.
+    """
+    calls = []
+
+    async def fake(*args, **kwargs):
+        calls.append((args, kwargs))
+        return result
+
+    return fake, calls
+
 
 class TestMarvelClient:
     """Test cases for the enhanced MarvelClient."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def client(self):
-        """Create a MarvelClient instance for testing."""
+        """Create a MarvelClient instance shared by the tests in this module.
+
+        Tests only read the client or replace its methods with monkeypatch,
+        which restores them after each test, so one instance is safe to reuse.
+        """
         return MarvelClient(
             public_key="test_public_key",
             private_key="test_private_key",
@@ -33,6 +312,20 @@ class TestMarvelClient:
             max_retries=1,
         )
 
+    @pytest.fixture(autouse=True)
+    def reset_circuit_breakers(self, client):
+        """Close the shared client's circuit breakers after each test."""
+        yield
+        for endpoint in (
+            client.characters,
+            client.comics,
+            client.events,
+            client.series,
+            client.stories,
+            client.creators,
+        ):
+            endpoint.reset_circuit_breakers()
+
     def test_client_initialization(self, client):
         """Test MarvelClient initialization."""
         logger.info("Testing MarvelClient initialization")
@@ -47,7 +340,6 @@ class TestMarvelClient:
         endpoints = ["characters", "comics", "events", "series", "stories", "creators"]
         for endpoint in endpoints:
             assert hasattr(client, endpoint), f"Missing {endpoint} endpoint"
-            logger.info(f"✅ {endpoint} endpoint initialized")
 
         logger.info("✅ MarvelClient initialization successful")
 
@@ -64,13 +356,15 @@ class TestMarvelClient:
         logger.info("✅ MarvelClient initialization with custom base URL test completed successfully")
 
     @pytest.mark.asyncio
-    async def test_context_manager(self, client):
+    async def test_context_manager(self, client, monkeypatch):
         """Test async context manager."""
         logger.info("Testing MarvelClient async context manager")
-        with patch.object(client, "close") as mock_close:
-            async with client as ctx_client:
-                assert ctx_client is client
-            mock_close.assert_called_once()
+        fake, calls = fake_endpoint_method(None)
+        monkeypatch.setattr(client, "close", fake)
+
+        async with client as ctx_client:
+            assert ctx_client is client
+        assert calls == [((), {})]
         logger.info("✅ MarvelClient async context manager test completed successfully")
 
     @pytest.mark.asyncio
@@ -89,382 +383,149 @@ class TestMarvelClient:
     # ============================================================================
 
     @pytest.mark.asyncio
-    async def test_get_character(self, client):
+    async def test_get_character(self, client, monkeypatch):
         """Test getting a single character by ID."""
         logger.info("Testing MarvelClient get_character method")
-        mock_character = MagicMock(spec=Character)
-        mock_character.id = 1009368
-        mock_character.name = "Iron Man"
+        mock_character = SimpleNamespace(id=1009368, name="Iron Man")
 
-        with patch.object(client.characters, "get_character", return_value=mock_character):
-            result = await client.get_character(1009368)
+        fake, calls = fake_endpoint_method(mock_character)
+        monkeypatch.setattr(client.characters, "get_character", fake)
 
-            assert result == mock_character
-            client.characters.get_character.assert_called_once_with(1009368)
+        result = await client.get_character(1009368)
+
+        assert result is mock_character
+        assert calls == [((1009368,), {})]
         logger.info("✅ MarvelClient get_character method test completed successfully")
 
     @pytest.mark.asyncio
-    async def test_list_characters(self, client):
+    async def test_list_characters(self, client, monkeypatch):
         """Test listing characters with filtering."""
         logger.info("Testing MarvelClient list_characters method")
-        mock_response = MagicMock(spec=CharacterListResponse)
-
-        with patch.object(client.characters, "list_characters", return_value=mock_response):
-            result = await client.list_characters(
-                limit=10, name_starts_with="Spider", comics=[123, 456]
-            )
-
-            assert result == mock_response
-            client.characters.list_characters.assert_called_once_with(
-                limit=10,
-                offset=None,
-                name=None,
-                name_starts_with="Spider",
-                modified_since=None,
-                comics=[123, 456],
-                series=None,
-                events=None,
-                stories=None,
-                order_by=None,
-            )
-        logger.info("✅ MarvelClient list_characters method test completed successfully")
-
-    @pytest.mark.asyncio
-    async def test_search_characters(self, client):
-        """Test searching for characters by name."""
-        logger.info("Testing MarvelClient search_characters method")
-        mock_response = MagicMock(spec=CharacterListResponse)
+        mock_response = CHARACTER_LIST
 
-        with patch.object(client.characters, "list_characters", return_value=mock_response):
-            result = await client.search_characters("iron man", limit=5)
+        fake, calls = fake_endpoint_method(mock_response)
+        monkeypatch.setattr(client.characters, "list_characters", fake)
 
-            assert result == mock_response
-            client.characters.list_characters.assert_called_once_with(
-                name_starts_with="iron man",
-                limit=5,
-                offset=None,
-            )
-        logger.info("✅ MarvelClient search_characters method test completed successfully")
+        result = await client.list_characters(
+            limit=10, name_starts_with="Spider", comics=[123, 456]
+        )
 
-    @pytest.mark.asyncio
-    async def test_get_character_comics(self, client):
-        """Test getting comics for a character."""
-        logger.info("Testing MarvelClient get_character_comics method")
-        mock_response = MagicMock(spec=ComicListResponse)
-
-        with patch.object(client.characters, "get_comics", return_value=mock_response):
-            result = await client.get_character_comics(1009368, limit=5)
-
-            assert result == mock_response
-            client.characters.get_comics.assert_called_once_with(
-                character_id=1009368,
-                limit=5,
-                offset=None,
-                format=None,
-                format_type=None,
-                no_variants=None,
-                date_descriptor=None,
-                date_range=None,
-                diamond_code=None,
-                digital_id=None,
-                upc=None,
-                isbn=None,
-                ean=None,
-                issn=None,
-                has_digital_issue=None,
-                modified_since=None,
-                creators=None,
-                series=None,
-                events=None,
-                stories=None,
-                shared_appearances=None,
-                collaborators=None,
-                order_by=None,
-            )
-        logger.info("✅ MarvelClient get_character_comics method test completed successfully")
+        assert result is mock_response
+        assert calls == [((), LIST_CHARACTERS_KWARGS)]
+        logger.info("✅ MarvelClient list_characters method test completed successfully")
 
     @pytest.mark.asyncio
-    async def test_get_character_events(self, client):
-        """Test getting events for a character."""
-        logger.info("Testing MarvelClient get_character_events method")
-        mock_response = MagicMock(spec=EventListResponse)
-
-        with patch.object(client.characters, "get_events", return_value=mock_response):
-            result = await client.get_character_events(1009368, limit=3)
-
-            assert result == mock_response
-            client.characters.get_events.assert_called_once_with(
-                character_id=1009368,
-                limit=3,
-                offset=None,
-                name=None,
-                name_starts_with=None,
-                modified_since=None,
-                creators=None,
-                series=None,
-                comics=None,
-                stories=None,
-                order_by=None,
-            )
-        logger.info("✅ MarvelClient get_character_events method test completed successfully")
+    async def test_search_characters(self, client, monkeypatch):
+        """Test searching for characters by name."""
+        logger.info("Testing MarvelClient search_characters method")
+        mock_response = CHARACTER_LIST
 
-    @pytest.mark.asyncio
-    async def test_get_character_series(self, client):
-        """Test getting series for a character."""
-        logger.info("Testing MarvelClient get_character_series method")
-        mock_response = MagicMock(spec=SeriesListResponse)
-
-        with patch.object(client.characters, "get_series", return_value=mock_response):
-            result = await client.get_character_series(1009368, limit=5)
-
-            assert result == mock_response
-            client.characters.get_series.assert_called_once_with(
-                character_id=1009368,
-                limit=5,
-                offset=None,
-                title=None,
-                title_starts_with=None,
-                start_year=None,
-                modified_since=None,
-                comics=None,
-                stories=None,
-                events=None,
-                creators=None,
-                series_type=None,
-                contains=None,
-                order_by=None,
-            )
-        logger.info("✅ MarvelClient get_character_series method test completed successfully")
+        fake, calls = fake_endpoint_method(mock_response)
+        monkeypatch.setattr(client.characters, "list_characters", fake)
 
-    @pytest.mark.asyncio
-    async def test_get_character_stories(self, client):
-        """Test getting stories for a character."""
-        logger.info("Testing MarvelClient get_character_stories method")
-        mock_response = MagicMock(spec=StoryListResponse)
-
-        with patch.object(client.characters, "get_stories", return_value=mock_response):
-            result = await client.get_character_stories(1009368, limit=5)
-
-            assert result == mock_response
-            client.characters.get_stories.assert_called_once_with(
-                character_id=1009368,
-                limit=5,
-                offset=None,
-                modified_since=None,
-                comics=None,
-                series=None,
-                events=None,
-                creators=None,
-                order_by=None,
-            )
-        logger.info("✅ MarvelClient get_character_stories method test completed successfully")
+        result = await client.search_characters("iron man", limit=5)
 
-    @pytest.mark.asyncio
-    async def test_get_character_creators(self, client):
-        """Test getting creators for a character."""
-        logger.info("Testing MarvelClient get_character_creators method")
-        mock_response = MagicMock(spec=CreatorListResponse)
-
-        with patch.object(client.characters, "get_creators", return_value=mock_response):
-            result = await client.get_character_creators(1009368, limit=5)
-
-            assert result == mock_response
-            client.characters.get_creators.assert_called_once_with(
-                character_id=1009368,
-                limit=5,
-                offset=None,
-                modified_since=None,
-                comics=None,
-                series=None,
-                events=None,
-                stories=None,
-                order_by=None,
-            )
-        logger.info("✅ MarvelClient get_character_creators method test completed successfully")
+        assert result is mock_response
+        assert calls == [((), SEARCH_CHARACTERS_KWARGS)]
+        logger.info("✅ MarvelClient search_characters method test completed successfully")
 
     # ============================================================================
     # COMIC METHODS TESTS
     # ============================================================================
 
     @pytest.mark.asyncio
-    async def test_get_comic(self, client):
+    async def test_get_comic(self, client, monkeypatch):
         """Test getting a single comic by ID."""
         logger.info("Testing MarvelClient get_comic method")
-        mock_comic = MagicMock(spec=Comic)
-        mock_comic.id = 21366
-        mock_comic.title = "Avengers (1963) #1"
+        mock_comic = SimpleNamespace(id=21366, title="Avengers (1963) #1")
 
-        with patch.object(client.comics, "get_comic", return_value=mock_comic):
-            result = await client.get_comic(21366)
+        fake, calls = fake_endpoint_method(mock_comic)
+        monkeypatch.setattr(client.comics, "get_comic", fake)
 
-            assert result == mock_comic
-            client.comics.get_comic.assert_called_once_with(21366)
+        result = await client.get_comic(21366)
+
+        assert result is mock_comic
+        assert calls == [((21366,), {})]
         logger.info("✅ MarvelClient get_comic method test completed successfully")
 
     @pytest.mark.asyncio
-    async def test_list_comics(self, client):
+    async def test_list_comics(self, client, monkeypatch):
         """Test listing comics with filtering."""
         logger.info("Testing MarvelClient list_comics method")
-        mock_response = MagicMock(spec=ComicListResponse)
-
-        with patch.object(client.comics, "list_comics", return_value=mock_response):
-            result = await client.list_comics(limit=10, format="comic", characters=[1009368])
-
-            assert result == mock_response
-            client.comics.list_comics.assert_called_once_with(
-                limit=10,
-                offset=None,
-                format="comic",
-                format_type=None,
-                no_variants=None,
-                date_descriptor=None,
-                date_range=None,
-                diamond_code=None,
-                digital_id=None,
-                upc=None,
-                isbn=None,
-                ean=None,
-                issn=None,
-                has_digital_issue=None,
-                modified_since=None,
-                creators=None,
-                characters=[1009368],
-                series=None,
-                events=None,
-                stories=None,
-                shared_appearances=None,
-                collaborators=None,
-                order_by=None,
-            )
+        mock_response = COMIC_LIST
+
+        fake, calls = fake_endpoint_method(mock_response)
+        monkeypatch.setattr(client.comics, "list_comics", fake)
+
+        result = await client.list_comics(limit=10, format="comic", characters=[1009368])
+
+        assert result is mock_response
+        assert calls == [((), LIST_COMICS_KWARGS)]
         logger.info("✅ MarvelClient list_comics method test completed successfully")
 
     @pytest.mark.asyncio
-    async def test_search_comics(self, client):
+    async def test_search_comics(self, client, monkeypatch):
         """Test searching for comics by title."""
         logger.info("Testing MarvelClient search_comics method")
-        mock_response = MagicMock(spec=ComicListResponse)
+        mock_response = COMIC_LIST
 
-        with patch.object(client.comics, "list_comics", return_value=mock_response):
-            result = await client.search_comics("amazing spider-man", limit=5)
-
-            assert result == mock_response
-            client.comics.list_comics.assert_called_once_with(
-                title_starts_with="amazing spider-man",
-                limit=5,
-                offset=None,
-            )
-        logger.info("✅ MarvelClient search_comics method test completed successfully")
+        fake, calls = fake_endpoint_method(mock_response)
+        monkeypatch.setattr(client.comics, "list_comics", fake)
 
-    @pytest.mark.asyncio
-    async def test_get_comic_characters(self, client):
-        """Test getting characters for a comic."""
-        logger.info("Testing MarvelClient get_comic_characters method")
-        mock_response = MagicMock(spec=CharacterListResponse)
-
-        with patch.object(client.comics, "get_characters", return_value=mock_response):
-            result = await client.get_comic_characters(21366, limit=5)
-
-            assert result == mock_response
-            client.comics.get_characters.assert_called_once_with(
-                comic_id=21366,
-                limit=5,
-                offset=None,
-                name=None,
-                name_starts_with=None,
-                modified_since=None,
-                series=None,
-                events=None,
-                stories=None,
-                order_by=None,
-            )
-        logger.info("✅ MarvelClient get_comic_characters method test completed successfully")
+        result = await client.search_comics("amazing spider-man", limit=5)
 
-    @pytest.mark.asyncio
-    async def test_get_comic_creators(self, client):
-        """Test getting creators for a comic."""
-        logger.info("Testing MarvelClient get_comic_creators method")
-        mock_response = MagicMock(spec=CreatorListResponse)
-
-        with patch.object(client.comics, "get_creators", return_value=mock_response):
-            result = await client.get_comic_creators(21366, limit=5)
-
-            assert result == mock_response
-            client.comics.get_creators.assert_called_once_with(
-                comic_id=21366,
-                limit=5,
-                offset=None,
-                first_name=None,
-                middle_name=None,
-                last_name=None,
-                suffix=None,
-                name_starts_with=None,
-                first_name_starts_with=None,
-                middle_name_starts_with=None,
-                last_name_starts_with=None,
-                modified_since=None,
-                comics=None,
-                series=None,
-                events=None,
-                stories=None,
-                order_by=None,
-            )
-        logger.info("✅ MarvelClient get_comic_creators method test completed successfully")
+        assert result is mock_response
+        assert calls == [((), SEARCH_COMICS_KWARGS)]
+        logger.info("✅ MarvelClient search_comics method test completed successfully")
 
-    @pytest.mark.asyncio
-    async def test_get_comic_events(self, client):
-        """Test getting events for a comic."""
-        logger.info("Testing MarvelClient get_comic_events method")
-        mock_response = MagicMock(spec=EventListResponse)
-
-        with patch.object(client.comics, "get_events", return_value=mock_response):
-            result = await client.get_comic_events(21366, limit=3)
-
-            assert result == mock_response
-            client.comics.get_events.assert_called_once_with(
-                comic_id=21366,
-                limit=3,
-                offset=None,
-                name=None,
-                name_starts_with=None,
-                modified_since=None,
-                creators=None,
-                characters=None,
-                series=None,
-                stories=None,
-                order_by=None,
-            )
-        logger.info("✅ MarvelClient get_comic_events method test completed successfully")
+    # ============================================================================
+    # RELATED RESOURCE METHODS TESTS
+    # ============================================================================
 
     @pytest.mark.asyncio
-    async def test_get_comic_stories(self, client):
-        """Test getting stories for a comic."""
-        logger.info("Testing MarvelClient get_comic_stories method")
-        mock_response = MagicMock(spec=StoryListResponse)
-
-        with patch.object(client.comics, "get_stories", return_value=mock_response):
-            result = await client.get_comic_stories(21366, limit=5)
-
-            assert result == mock_response
-            client.comics.get_stories.assert_called_once_with(
-                comic_id=21366,
-                limit=5,
-                offset=None,
-                modified_since=None,
-                series=None,
-                events=None,
-                creators=None,
-                characters=None,
-                order_by=None,
-            )
-        logger.info("✅ MarvelClient get_comic_stories method test completed successfully")
+    @pytest.mark.parametrize(
+        (
+            "client_method",
+            "item_id",
+            "limit",
+            "endpoint_attr",
+            "endpoint_method",
+            "response",
+            "expected_kwargs",
+        ),
+        RELATED_RESOURCE_CASES,
+        ids=[case[0] for case in RELATED_RESOURCE_CASES],
+    )
+    async def test_related_resource_methods(
+        self,
+        client,
+        monkeypatch,
+        client_method,
+        item_id,
+        limit,
+        endpoint_attr,
+        endpoint_method,
+        response,
+        expected_kwargs,
+    ):
+        """Test related-resource methods delegate to their endpoint."""
+        logger.info(f"Testing MarvelClient {client_method} method")
+        fake, calls = fake_endpoint_method(response)
+        monkeypatch.setattr(getattr(client, endpoint_attr), endpoint_method, fake)
+
+        result = await getattr(client, client_method)(item_id, limit=limit)
+
+        assert result is response
+        assert calls == [((), expected_kwargs)]
+        logger.info(f"✅ MarvelClient {client_method} method test completed successfully")
 
     # ============================================================================
     # INTEGRATION TESTS
     # ============================================================================
 
-    def test_all_methods_exist(self, client):
-        """Test that all expected methods exist on the client."""
-        logger.info("Testing that all expected methods exist on MarvelClient")
+    def test_client_surface(self, client):
+        """Test the client exposes its endpoints and all expected methods."""
+        logger.info("Testing the public surface of MarvelClient")
         expected_methods = [
             # Character methods
             "get_character",
@@ -520,34 +581,13 @@ class TestMarvelClient:
         ]
 
         for method_name in expected_methods:
-            assert hasattr(client, method_name), f"Method {method_name} not found on client"
-            method = getattr(client, method_name)
-            assert callable(method), f"Method {method_name} is not callable"
-        logger.info("✅ All expected methods exist on MarvelClient test completed successfully")
-
-    def test_endpoint_attributes_exist(self, client):
-        """Test that all endpoint attributes exist and are properly initialized."""
-        logger.info("Testing that all endpoint attributes exist and are properly initialized")
-        endpoints = ["characters", "comics", "events", "series", "stories", "creators"]
+            assert callable(getattr(client, method_name, None)), f"Method {method_name} missing"
 
+        endpoints = ["characters", "comics", "events", "series", "stories", "creators"]
         for endpoint_name in endpoints:
-            assert hasattr(client, endpoint_name), f"Endpoint {endpoint_name} not found"
-            endpoint = getattr(client, endpoint_name)
-            assert endpoint is not None, f"Endpoint {endpoint_name} is None"
-        logger.info("✅ All endpoint attributes exist and are properly initialized test completed successfully")
-
-    def test_method_count(self, client):
-        """Test that we have the expected number of methods."""
-        logger.info("Testing that MarvelClient has the expected number of methods")
-        # Count public methods (excluding private methods starting with _)
-        public_methods = [method for method in dir(client) if not method.startswith("_")]
-
-        # We expect at least 58 methods (as mentioned in the client)
-        # This includes all the endpoint methods plus some utility methods
-        assert len(public_methods) >= 58, f"Expected at least 58 methods, got {len(public_methods)}"
-
-        # Print the methods for debugging
-        print(f"Found {len(public_methods)} public methods:")
-        for method in sorted(public_methods):
-            print(f"  - {method}")
-        logger.info("✅ MarvelClient method count test completed successfully")
+            assert getattr(client, endpoint_name, None) is not None, f"{endpoint_name} missing"
+
+        # Endpoint methods plus utility methods and attributes
+        public_names = [name for name in dir(client) if not name.startswith("_")]
+        assert len(public_names) >= 58, f"Expected 58+ public names, got {len(public_names)}"
+        logger.info("✅ MarvelClient public surface test completed successfully")
@@ -3,13 +3,19 @@
 These tests use real API keys and make actual HTTP requests to the Marvel API
 to verify that all 58 client methods work correctly with real data.
 
-Note: These tests require valid Marvel API keys in the .env file.
+Responses are replayed from cassettes under tests/cassettes/test_e2e/. Replay
+needs no API keys; without them, tests whose cassette has not been recorded
+yet are skipped. Record missing cassettes with ``--record-mode=once`` or
+refresh them against the live API with ``--record-mode=rewrite``; both need
+valid Marvel API keys in the .env file.
 """
 
 import asyncio
+import contextlib
 import logging
 import os
 import pytest
+import pytest_asyncio
 from typing import Any, Dict, List
 
 from marvelpy import MarvelClient
@@ -43,48 +49,60 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Label and attribute used to name each entity type in the debug logs.
+_NAME_ATTR = {
+    Character: ("Name", "name"),
+    Comic: ("Title", "title"),
+    Event: ("Title", "title"),
+    Series: ("Title", "title"),
+    Story: ("Title", "title"),
+    Creator: ("Full Name", "full_name"),
+}
+
+
 def log_entity_data(entity_type: str, entity: Any, entity_id: int = None) -> None:
     """Log detailed information about an entity for debugging."""
-    logger.info(f"=== {entity_type.upper()} DATA ===")
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
+    logger.info("=== %s DATA ===", entity_type.upper())
     if entity_id:
-        logger.info(f"ID: {entity_id}")
+        logger.info("ID: %s", entity_id)
     
-    if hasattr(entity, 'name'):
-        logger.info(f"Name: {entity.name}")
-    elif hasattr(entity, 'title'):
-        logger.info(f"Title: {entity.title}")
-    elif hasattr(entity, 'full_name'):
-        logger.info(f"Full Name: {entity.full_name}")
+    name_attr = _NAME_ATTR.get(type(entity))
+    if name_attr is not None:
+        label, attr = name_attr
+        logger.info("%s: %s", label, getattr(entity, attr))
     
-    if hasattr(entity, 'description') and entity.description:
-        desc = entity.description[:100] + "..." if len(entity.description) > 100 else entity.description
-        logger.info(f"Description: {desc}")
+    description = getattr(entity, "description", None)
+    if description:
+        desc = description[:100] + "..." if len(description) > 100 else description
+        logger.info("Description: %s", desc)
     
-    if hasattr(entity, 'modified'):
-        logger.info(f"Modified: {entity.modified}")
+    logger.info("Modified: %s", entity.modified)
     
-    logger.info(f"Type: {type(entity).__name__}")
+    logger.info("Type: %s", type(entity).__name__)
     logger.info("=" * 50)
 
 
 def log_response_data(response_type: str, response: Any) -> None:
     """Log detailed information about a response for debugging."""
-    logger.info(f"=== {response_type.upper()} RESPONSE ===")
-    logger.info(f"Total: {response.data.total}")
-    logger.info(f"Count: {response.data.count}")
-    logger.info(f"Offset: {response.data.offset}")
-    logger.info(f"Limit: {response.data.limit}")
-    logger.info(f"Results: {len(response.data.results)} items")
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
+    logger.info("=== %s RESPONSE ===", response_type.upper())
+    logger.info("Total: %s", response.data.total)
+    logger.info("Count: %s", response.data.count)
+    logger.info("Offset: %s", response.data.offset)
+    logger.info("Limit: %s", response.data.limit)
+    logger.info("Results: %s items", len(response.data.results))
     
     if response.data.results:
         logger.info("Sample results:")
         for i, item in enumerate(response.data.results[:3]):  # Log first 3 items
-            if hasattr(item, 'name'):
-                logger.info(f"  {i+1}. {item.name} (ID: {item.id})")
-            elif hasattr(item, 'title'):
-                logger.info(f"  {i+1}. {item.title} (ID: {item.id})")
-            elif hasattr(item, 'full_name'):
-                logger.info(f"  {i+1}. {item.full_name} (ID: {item.id})")
+            name_attr = _NAME_ATTR.get(type(item))
+            if name_attr is not None:
+                logger.info("  %s. %s (ID: %s)", i+1, getattr(item, name_attr[1]), item.id)
     
     logger.info("=" * 50)
 
@@ -197,31 +215,156 @@ def validate_creator_data(creator: Creator, expected_id: int = None) -> None:
     log_entity_data("Creator", creator, creator.id)
 
 
+CASSETTE_DIR = os.path.join(os.path.dirname(__file__), "cassettes", "test_e2e")
+
+# The auth parameters change with every key and request, so they are kept out
+# of cassettes and ignored when matching replayed requests.
+VCR_CONFIG = {"filter_query_parameters": ["apikey", "hash", "ts"]}
+
+
 @pytest.fixture(scope="session")
-def client():
-    """Create a MarvelClient instance for E2E testing."""
+def api_keys(pytestconfig):
+    """Return the Marvel API keys, or None when replaying cassettes without them.
+
+    Recording (or running without pytest-recording) talks to the live API and
+    is skipped when the keys are not set.
+    """
     public_key = os.getenv("MARVEL_PUBLIC_KEY")
     private_key = os.getenv("MARVEL_PRIVATE_KEY")
-    
-    if not public_key or not private_key:
+
+    if public_key and private_key:
+        return public_key, private_key
+    if pytestconfig.getoption("--record-mode", default=None) != "none":
         pytest.skip("Marvel API keys not found in environment variables")
-    
+    return None
+
+
+@pytest.fixture(scope="session")
+def client(api_keys):
+    """Create a MarvelClient instance for E2E testing.
+
+    Session-scoped, so under pytest-xdist each worker builds one client and
+    shares it across the tests it runs. The timeout and retry count default
+    to 10 seconds and 1 retry; set MARVEL_TEST_TIMEOUT and MARVEL_TEST_RETRIES
+    to allow more on a slow or flaky network.
+    """
+    public_key, private_key = api_keys or ("replay-public-key", "replay-private-key")
+
     return MarvelClient(
         public_key=public_key,
         private_key=private_key,
-        timeout=30.0,
-        max_retries=3,
+        timeout=float(os.getenv("MARVEL_TEST_TIMEOUT", "10.0")),
+        max_retries=int(os.getenv("MARVEL_TEST_RETRIES", "1")),
     )
 
 
+def require_cassette(api_keys: Any, name: str) -> None:
+    """Skip a keyless replay whose cassette has not been recorded yet.
+
+    With keys, a missing cassette is left for VCR to report under
+    ``--record-mode=none``.
+    """
+    if api_keys is None and not os.path.exists(os.path.join(CASSETTE_DIR, f"{name}.yaml")):
+        pytest.skip(f"No recorded cassette {name}.yaml; record it with --record-mode=once")
+
+
+@pytest.fixture(autouse=True)
+def _replay_cassette(request, api_keys):
+    """Skip keyless replays of tests that have no cassette yet."""
+    require_cassette(api_keys, f"{request.node.cls.__name__}.{request.node.name}")
+
+
 @pytest.fixture(scope="session")
-def event_loop():
-    """Create an event loop for the test session."""
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
+def shared_cassette(pytestconfig, api_keys):
+    """Return a factory for the cassettes of session-scoped fixtures.
+
+    Session fixtures are set up before pytest-recording opens the cassette
+    of the test that needs them, so their requests are recorded to cassettes
+    of their own, under the same record mode.
+    """
+    record_mode = pytestconfig.getoption("--record-mode", default=None)
+
+    def use_cassette(name: str) -> Any:
+        require_cassette(api_keys, name)
+        if record_mode is None:
+            # pytest-recording is not installed; talk to the live API.
+            return contextlib.nullcontext()
+        import vcr  # installed with pytest-recording
+
+        return vcr.use_cassette(
+            os.path.join(CASSETTE_DIR, f"{name}.yaml"), record_mode=record_mode, **VCR_CONFIG
+        )
+
+    return use_cassette
+
+
+# Iron Man (ID: 1009368) and his related resources are used by several tests,
+# so each is fetched once per session and shared.
+IRON_MAN_ID = 1009368
+
+
+@pytest_asyncio.fixture(scope="session")
+async def ironman_character(client, shared_cassette):
+    """Fetch Iron Man once for the session."""
+    with shared_cassette("ironman_character"):
+        return await client.get_character(IRON_MAN_ID)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def ironman_bundle(client, shared_cassette):
+    """Fetch three each of Iron Man's comics, events, series and stories concurrently.
+
+    Failures are returned rather than raised, so a failed lookup only fails
+    the tests that use it.
+    """
+    with shared_cassette("ironman_bundle"):
+        return await asyncio.gather(
+            client.get_character_comics(IRON_MAN_ID, limit=3),
+            client.get_character_events(IRON_MAN_ID, limit=3),
+            client.get_character_series(IRON_MAN_ID, limit=3),
+            client.get_character_stories(IRON_MAN_ID, limit=3),
+            return_exceptions=True,
+        )
+
+
+def _unbundle(result: Any) -> Any:
+    """Return a result from ironman_bundle, re-raising it if the lookup failed."""
+    if isinstance(result, BaseException):
+        raise result
+    return result
+
+
+@pytest.fixture(scope="session")
+def ironman_comics(ironman_bundle):
+    """Iron Man's comics from the shared bundle."""
+    return _unbundle(ironman_bundle[0])
+
+
+@pytest.fixture(scope="session")
+def ironman_events(ironman_bundle):
+    """Iron Man's events from the shared bundle."""
+    return _unbundle(ironman_bundle[1])
+
+
+@pytest.fixture(scope="session")
+def ironman_series(ironman_bundle):
+    """Iron Man's series from the shared bundle."""
+    return _unbundle(ironman_bundle[2])
+
+
+@pytest.fixture(scope="session")
+def ironman_stories(ironman_bundle):
+    """Iron Man's stories from the shared bundle."""
+    return _unbundle(ironman_bundle[3])
+
+
+@pytest.fixture(scope="module")
+def vcr_config():
+    """Configure pytest-recording's per-test cassettes."""
+    return VCR_CONFIG
 
 
+@pytest.mark.vcr
 class TestMarvelClientE2E:
     """End-to-end tests for the enhanced MarvelClient."""
 
@@ -230,12 +373,11 @@ class TestMarvelClientE2E:
     # ============================================================================
 
     @pytest.mark.asyncio
-    async def test_get_character_e2e(self, client):
+    async def test_get_character_e2e(self, ironman_character):
         """Test getting a single character by ID with real API."""
         logger.info("Testing get_character with Iron Man (ID: 1009368)")
         
-        # Test with Iron Man (ID: 1009368)
-        character = await client.get_character(1009368)
+        character = ironman_character
         
         # Validate the character data
         validate_character_data(character, expected_id=1009368)
@@ -245,7 +387,7 @@ class TestMarvelClientE2E:
         assert character.description is not None, "Iron Man should have a description"
         assert len(character.description.strip()) > 0, "Iron Man description should not be empty"
         
-        logger.info(f"✅ Successfully retrieved Iron Man: {character.name}")
+        logger.info("✅ Successfully retrieved Iron Man: %s", character.name)
 
     @pytest.mark.asyncio
     async def test_list_characters_e2e(self, client):
@@ -268,9 +410,9 @@ class TestMarvelClientE2E:
         # Validate each character
         for i, character in enumerate(response.data.results):
             validate_character_data(character)
-            logger.info(f"✅ Character {i+1}: {character.name} (ID: {character.id})")
+            logger.info("✅ Character %s: %s (ID: %s)", i+1, character.name, character.id)
         
-        logger.info(f"✅ Successfully retrieved {len(response.data.results)} characters")
+        logger.info("✅ Successfully retrieved %s characters", len(response.data.results))
 
     @pytest.mark.asyncio
     async def test_search_characters_e2e(self, client):
@@ -291,16 +433,16 @@ class TestMarvelClientE2E:
         for i, character in enumerate(response.data.results):
             validate_character_data(character)
             assert "spider" in character.name.lower(), f"Character '{character.name}' should contain 'spider'"
-            logger.info(f"✅ Spider Character {i+1}: {character.name} (ID: {character.id})")
+            logger.info("✅ Spider Character %s: %s (ID: %s)", i+1, character.name, character.id)
         
-        logger.info(f"✅ Successfully found {len(response.data.results)} spider characters")
+        logger.info("✅ Successfully found %s spider characters", len(response.data.results))
 
     @pytest.mark.asyncio
-    async def test_get_character_comics_e2e(self, client):
+    async def test_get_character_comics_e2e(self, ironman_comics):
         """Test getting comics for a character with real API."""
         logger.info("Testing get_character_comics for Iron Man (ID: 1009368), limit=3")
         
-        response = await client.get_character_comics(1009368, limit=3)
+        response = ironman_comics
         
         # Log response data
         log_response_data("Character Comics", response)
@@ -313,17 +455,16 @@ class TestMarvelClientE2E:
         # Validate each comic
         for i, comic in enumerate(response.data.results):
             validate_comic_data(comic)
-            logger.info(f"✅ Iron Man Comic {i+1}: {comic.title} (ID: {comic.id})")
+            logger.info("✅ Iron Man Comic %s: %s (ID: %s)", i+1, comic.title, comic.id)
         
-        logger.info(f"✅ Successfully retrieved {len(response.data.results)} Iron Man comics")
+        logger.info("✅ Successfully retrieved %s Iron Man comics", len(response.data.results))
 
     @pytest.mark.asyncio
-    async def test_get_character_events_e2e(self, client):
+    async def test_get_character_events_e2e(self, ironman_events):
         """Test getting events for a character with real API."""
         logger.info("Testing get_character_events for Iron Man (ID: 1009368), limit=3")
-        logger.info("Making API call to retrieve events for Iron Man...")
         
-        response = await client.get_character_events(1009368, limit=3)
+        response = ironman_events
         
         # Log response data
         log_response_data("Character Events", response)
@@ -337,21 +478,20 @@ class TestMarvelClientE2E:
         # Validate each event if any exist
         if response.data.results:
             for i, event in enumerate(response.data.results):
-                logger.info(f"Validating event {i+1}/{len(response.data.results)}")
+                logger.info("Validating event %s/%s", i+1, len(response.data.results))
                 validate_event_data(event)
-                logger.info(f"✅ Iron Man Event {i+1}: {event.title} (ID: {event.id})")
+                logger.info("✅ Iron Man Event %s: %s (ID: %s)", i+1, event.title, event.id)
         else:
             logger.info("No events found for Iron Man")
         
-        logger.info(f"✅ Successfully retrieved {len(response.data.results)} events for Iron Man")
+        logger.info("✅ Successfully retrieved %s events for Iron Man", len(response.data.results))
 
     @pytest.mark.asyncio
-    async def test_get_character_series_e2e(self, client):
+    async def test_get_character_series_e2e(self, ironman_series):
         """Test getting series for a character with real API."""
         logger.info("Testing get_character_series for Iron Man (ID: 1009368), limit=3")
-        logger.info("Making API call to retrieve series for Iron Man...")
         
-        response = await client.get_character_series(1009368, limit=3)
+        response = ironman_series
         
         # Log response data
         log_response_data("Character Series", response)
@@ -364,19 +504,18 @@ class TestMarvelClientE2E:
         
         # Validate each series
         for i, series in enumerate(response.data.results):
-            logger.info(f"Validating series {i+1}/{len(response.data.results)}")
+            logger.info("Validating series %s/%s", i+1, len(response.data.results))
             validate_series_data(series)
-            logger.info(f"✅ Iron Man Series {i+1}: {series.title} (ID: {series.id})")
+            logger.info("✅ Iron Man Series %s: %s (ID: %s)", i+1, series.title, series.id)
         
-        logger.info(f"✅ Successfully retrieved {len(response.data.results)} series for Iron Man")
+        logger.info("✅ Successfully retrieved %s series for Iron Man", len(response.data.results))
 
     @pytest.mark.asyncio
-    async def test_get_character_stories_e2e(self, client):
+    async def test_get_character_stories_e2e(self, ironman_stories):
         """Test getting stories for a character with real API."""
         logger.info("Testing get_character_stories for Iron Man (ID: 1009368), limit=3")
-        logger.info("Making API call to retrieve stories for Iron Man...")
         
-        response = await client.get_character_stories(1009368, limit=3)
+        response = ironman_stories
         
         # Log response data
         log_response_data("Character Stories", response)
@@ -389,11 +528,11 @@ class TestMarvelClientE2E:
         
         # Validate each story
         for i, story in enumerate(response.data.results):
-            logger.info(f"Validating story {i+1}/{len(response.data.results)}")
+            logger.info("Validating story %s/%s", i+1, len(response.data.results))
             validate_story_data(story)
-            logger.info(f"✅ Iron Man Story {i+1}: {story.title} (ID: {story.id})")
+            logger.info("✅ Iron Man Story %s: %s (ID: %s)", i+1, story.title, story.id)
         
-        logger.info(f"✅ Successfully retrieved {len(response.data.results)} stories for Iron Man")
+        logger.info("✅ Successfully retrieved %s stories for Iron Man", len(response.data.results))
 
     @pytest.mark.asyncio
     async def test_get_character_creators_e2e(self, client):
@@ -420,21 +559,21 @@ class TestMarvelClientE2E:
             # Validate each creator if any exist
             if response.data.results:
                 for i, creator in enumerate(response.data.results):
-                    logger.info(f"Validating creator {i+1}/{len(response.data.results)}")
+                    logger.info("Validating creator %s/%s", i+1, len(response.data.results))
                     validate_creator_data(creator)
-                    logger.info(f"✅ Iron Man Creator {i+1}: {creator.full_name} (ID: {creator.id})")
+                    logger.info("✅ Iron Man Creator %s: %s (ID: %s)", i+1, creator.full_name, creator.id)
             else:
                 logger.info("No creators found for Iron Man")
             
-            logger.info(f"✅ Successfully retrieved {len(response.data.results)} creators for Iron Man")
+            logger.info("✅ Successfully retrieved %s creators for Iron Man", len(response.data.results))
         except Exception as e:
-            logger.warning(f"API call failed with exception: {str(e)}")
+            logger.warning("API call failed with exception: %s", e)
             # If we get a 404 or other error, that's expected for this API limitation
             if "404" in str(e) or "Not Found" in str(e):
                 logger.info("Character-creator relationships not available for this character (API limitation)")
                 pytest.skip("Character-creator relationships not available for this character (API limitation)")
             else:
-                logger.error(f"Unexpected error occurred: {str(e)}")
+                logger.error("Unexpected error occurred: %s", e)
                 raise
 
     # ============================================================================
@@ -456,7 +595,7 @@ class TestMarvelClientE2E:
         assert "Avengers" in comic.title, f"Expected 'Avengers' in title, got '{comic.title}'"
         assert comic.description is not None, "Avengers #1 should have a description"
         
-        logger.info(f"✅ Successfully retrieved comic: {comic.title}")
+        logger.info("✅ Successfully retrieved comic: %s", comic.title)
 
     @pytest.mark.asyncio
     async def test_list_comics_e2e(self, client):
@@ -475,7 +614,7 @@ class TestMarvelClientE2E:
         
         # Validate each comic
         for i, comic in enumerate(response.data.results):
-            logger.info(f"Validating comic {i+1}/{len(response.data.results)}")
+            logger.info("Validating comic %s/%s", i+1, len(response.data.results))
             validate_comic_data(comic)
         
         logger.info("✅ Successfully listed comics")
@@ -497,7 +636,7 @@ class TestMarvelClientE2E:
         
         # Validate each comic and check search relevance
         for i, comic in enumerate(response.data.results):
-            logger.info(f"Validating comic {i+1}/{len(response.data.results)}")
+            logger.info("Validating comic %s/%s", i+1, len(response.data.results))
             validate_comic_data(comic)
             assert "amazing spider-man" in comic.title.lower(), f"Expected 'amazing spider-man' in title, got '{comic.title}'"
         
@@ -520,7 +659,7 @@ class TestMarvelClientE2E:
         
         # Validate each character
         for i, char in enumerate(response.data.results):
-            logger.info(f"Validating character {i+1}/{len(response.data.results)}")
+            logger.info("Validating character %s/%s", i+1, len(response.data.results))
             validate_character_data(char)
         
         logger.info("✅ Successfully retrieved comic characters")
@@ -542,7 +681,7 @@ class TestMarvelClientE2E:
         
         # Validate each creator
         for i, creator in enumerate(response.data.results):
-            logger.info(f"Validating creator {i+1}/{len(response.data.results)}")
+            logger.info("Validating creator %s/%s", i+1, len(response.data.results))
             validate_creator_data(creator)
         
         logger.info("✅ Successfully retrieved comic creators")
@@ -565,7 +704,7 @@ class TestMarvelClientE2E:
         # Validate each event if any exist
         if response.data.results:
             for i, event in enumerate(response.data.results):
-                logger.info(f"Validating event {i+1}/{len(response.data.results)}")
+                logger.info("Validating event %s/%s", i+1, len(response.data.results))
                 validate_event_data(event)
         else:
             logger.info("No events found for this comic")
@@ -589,7 +728,7 @@ class TestMarvelClientE2E:
         
         # Validate each story
         for i, story in enumerate(response.data.results):
-            logger.info(f"Validating story {i+1}/{len(response.data.results)}")
+            logger.info("Validating story %s/%s", i+1, len(response.data.results))
             validate_story_data(story)
         
         logger.info("✅ Successfully retrieved comic stories")
@@ -612,7 +751,7 @@ class TestMarvelClientE2E:
         # Additional specific validations
         assert "Secret Invasion" in event.title, f"Expected 'Secret Invasion' in title, got '{event.title}'"
         
-        logger.info(f"✅ Successfully retrieved event: {event.title}")
+        logger.info("✅ Successfully retrieved event: %s", event.title)
 
     @pytest.mark.asyncio
     async def test_list_events_e2e(self, client):
@@ -631,7 +770,7 @@ class TestMarvelClientE2E:
         
         # Validate each event
         for i, event in enumerate(response.data.results):
-            logger.info(f"Validating event {i+1}/{len(response.data.results)}")
+            logger.info("Validating event %s/%s", i+1, len(response.data.results))
             validate_event_data(event)
         
         logger.info("✅ Successfully listed events")
@@ -653,7 +792,7 @@ class TestMarvelClientE2E:
         
         # Validate each event and check search relevance
         for i, event in enumerate(response.data.results):
-            logger.info(f"Validating event {i+1}/{len(response.data.results)}")
+            logger.info("Validating event %s/%s", i+1, len(response.data.results))
             validate_event_data(event)
             assert "secret invasion" in event.title.lower(), f"Expected 'secret invasion' in title, got '{event.title}'"
         
@@ -676,7 +815,7 @@ class TestMarvelClientE2E:
         
         # Validate each character
         for i, char in enumerate(response.data.results):
-            logger.info(f"Validating character {i+1}/{len(response.data.results)}")
+            logger.info("Validating character %s/%s", i+1, len(response.data.results))
             validate_character_data(char)
         
         logger.info("✅ Successfully retrieved event characters")
@@ -700,11 +839,11 @@ class TestMarvelClientE2E:
         
         # Validate each comic
         for i, comic in enumerate(response.data.results):
-            logger.info(f"Validating comic {i+1}/{len(response.data.results)}")
+            logger.info("Validating comic %s/%s", i+1, len(response.data.results))
             validate_comic_data(comic)
-            logger.info(f"✅ Secret Invasion Comic {i+1}: {comic.title} (ID: {comic.id})")
+            logger.info("✅ Secret Invasion Comic %s: %s (ID: %s)", i+1, comic.title, comic.id)
         
-        logger.info(f"✅ Successfully retrieved {len(response.data.results)} comics for Secret Invasion")
+        logger.info("✅ Successfully retrieved %s comics for Secret Invasion", len(response.data.results))
 
     @pytest.mark.asyncio
     async def test_get_event_creators_e2e(self, client):
@@ -725,11 +864,11 @@ class TestMarvelClientE2E:
         
         # Validate each creator
         for i, creator in enumerate(response.data.results):
-            logger.info(f"Validating creator {i+1}/{len(response.data.results)}")
+            logger.info("Validating creator %s/%s", i+1, len(response.data.results))
             validate_creator_data(creator)
-            logger.info(f"✅ Secret Invasion Creator {i+1}: {creator.full_name} (ID: {creator.id})")
+            logger.info("✅ Secret Invasion Creator %s: %s (ID: %s)", i+1, creator.full_name, creator.id)
         
-        logger.info(f"✅ Successfully retrieved {len(response.data.results)} creators for Secret Invasion")
+        logger.info("✅ Successfully retrieved %s creators for Secret Invasion", len(response.data.results))
 
     @pytest.mark.asyncio
     async def test_get_event_series_e2e(self, client):
@@ -750,11 +889,11 @@ class TestMarvelClientE2E:
         
         # Validate each series
         for i, series in enumerate(response.data.results):
-            logger.info(f"Validating series {i+1}/{len(response.data.results)}")
+            logger.info("Validating series %s/%s", i+1, len(response.data.results))
             validate_series_data(series)
-            logger.info(f"✅ Secret Invasion Series {i+1}: {series.title} (ID: {series.id})")
+            logger.info("✅ Secret Invasion Series %s: %s (ID: %s)", i+1, series.title, series.id)
         
-        logger.info(f"✅ Successfully retrieved {len(response.data.results)} series for Secret Invasion")
+        logger.info("✅ Successfully retrieved %s series for Secret Invasion", len(response.data.results))
 
     @pytest.mark.asyncio
     async def test_get_event_stories_e2e(self, client):
@@ -775,11 +914,11 @@ class TestMarvelClientE2E:
         
         # Validate each story
         for i, story in enumerate(response.data.results):
-            logger.info(f"Validating story {i+1}/{len(response.data.results)}")
+            logger.info("Validating story %s/%s", i+1, len(response.data.results))
             validate_story_data(story)
-            logger.info(f"✅ Secret Invasion Story {i+1}: {story.title} (ID: {story.id})")
+            logger.info("✅ Secret Invasion Story %s: %s (ID: %s)", i+1, story.title, story.id)
         
-        logger.info(f"✅ Successfully retrieved {len(response.data.results)} stories for Secret Invasion")
+        logger.info("✅ Successfully retrieved %s stories for Secret Invasion", len(response.data.results))
 
     # ============================================================================
     # SERIES METHODS E2E TESTS
@@ -803,7 +942,7 @@ class TestMarvelClientE2E:
         assert series.title is not None, "Series title should not be None"
         assert series.modified is not None, "Series modified date should not be None"
         
-        logger.info(f"✅ Successfully retrieved series: {series.title}")
+        logger.info("✅ Successfully retrieved series: %s", series.title)
 
     @pytest.mark.asyncio
     async def test_list_series_e2e(self, client):
@@ -824,11 +963,11 @@ class TestMarvelClientE2E:
         
         # Validate each series
         for i, series in enumerate(response.data.results):
-            logger.info(f"Validating series {i+1}/{len(response.data.results)}")
+            logger.info("Validating series %s/%s", i+1, len(response.data.results))
             validate_series_data(series)
-            logger.info(f"✅ Series {i+1}: {series.title} (ID: {series.id})")
+            logger.info("✅ Series %s: %s (ID: %s)", i+1, series.title, series.id)
         
-        logger.info(f"✅ Successfully retrieved {len(response.data.results)} series")
+        logger.info("✅ Successfully retrieved %s series", len(response.data.results))
 
     @pytest.mark.asyncio
     async def test_search_series_e2e(self, client):
@@ -849,12 +988,12 @@ class TestMarvelClientE2E:
         
         # Validate each series and check search relevance
         for i, series in enumerate(response.data.results):
-            logger.info(f"Validating series {i+1}/{len(response.data.results)}")
+            logger.info("Validating series %s/%s", i+1, len(response.data.results))
             validate_series_data(series)
             assert "amazing spider-man" in series.title.lower(), f"Expected 'amazing spider-man' in title, got '{series.title}'"
-            logger.info(f"✅ Amazing Spider-Man Series {i+1}: {series.title} (ID: {series.id})")
+            logger.info("✅ Amazing Spider-Man Series %s: %s (ID: %s)", i+1, series.title, series.id)
         
-        logger.info(f"✅ Successfully found {len(response.data.results)} Amazing Spider-Man series")
+        logger.info("✅ Successfully found %s Amazing Spider-Man series", len(response.data.results))
 
     @pytest.mark.asyncio
     async def test_get_series_characters_e2e(self, client):
@@ -875,11 +1014,11 @@ class TestMarvelClientE2E:
         
         # Validate each character
         for i, char in enumerate(response.data.results):
-            logger.info(f"Validating character {i+1}/{len(response.data.results)}")
+            logger.info("Validating character %s/%s", i+1, len(response.data.results))
             validate_character_data(char)
-            logger.info(f"✅ Avengers Series Character {i+1}: {char.name} (ID: {char.id})")
+            logger.info("✅ Avengers Series Character %s: %s (ID: %s)", i+1, char.name, char.id)
         
-        logger.info(f"✅ Successfully retrieved {len(response.data.results)} characters for Avengers series")
+        logger.info("✅ Successfully retrieved %s characters for Avengers series", len(response.data.results))
 
     @pytest.mark.asyncio
     async def test_get_series_comics_e2e(self, client):
@@ -900,11 +1039,11 @@ class TestMarvelClientE2E:
         
         # Validate each comic
         for i, comic in enumerate(response.data.results):
-            logger.info(f"Validating comic {i+1}/{len(response.data.results)}")
+            logger.info("Validating comic %s/%s", i+1, len(response.data.results))
             validate_comic_data(comic)
-            logger.info(f"✅ Avengers Series Comic {i+1}: {comic.title} (ID: {comic.id})")
+            logger.info("✅ Avengers Series Comic %s: %s (ID: %s)", i+1, comic.title, comic.id)
         
-        logger.info(f"✅ Successfully retrieved {len(response.data.results)} comics for Avengers series")
+        logger.info("✅ Successfully retrieved %s comics for Avengers series", len(response.data.results))
 
     @pytest.mark.asyncio
     async def test_get_series_creators_e2e(self, client):
@@ -925,11 +1064,11 @@ class TestMarvelClientE2E:
         
         # Validate each creator
         for i, creator in enumerate(response.data.results):
-            logger.info(f"Validating creator {i+1}/{len(response.data.results)}")
+            logger.info("Validating creator %s/%s", i+1, len(response.data.results))
             validate_creator_data(creator)
-            logger.info(f"✅ Avengers Series Creator {i+1}: {creator.full_name} (ID: {creator.id})")
+            logger.info("✅ Avengers Series Creator %s: %s (ID: %s)", i+1, creator.full_name, creator.id)
         
-        logger.info(f"✅ Successfully retrieved {len(response.data.results)} creators for Avengers series")
+        logger.info("✅ Successfully retrieved %s creators for Avengers series", len(response.data.results))
 
     @pytest.mark.asyncio
     async def test_get_series_events_e2e(self, client):
@@ -951,13 +1090,13 @@ class TestMarvelClientE2E:
         # Validate each event if any exist
         if response.data.results:
             for i, event in enumerate(response.data.results):
-                logger.info(f"Validating event {i+1}/{len(response.data.results)}")
+                logger.info("Validating event %s/%s", i+1, len(response.data.results))
                 validate_event_data(event)
-                logger.info(f"✅ Avengers Series Event {i+1}: {event.title} (ID: {event.id})")
+                logger.info("✅ Avengers Series Event %s: %s (ID: %s)", i+1, event.title, event.id)
         else:
             logger.info("No events found for this series")
         
-        logger.info(f"✅ Successfully retrieved {len(response.data.results)} events for Avengers series")
+        logger.info("✅ Successfully retrieved %s events for Avengers series", len(response.data.results))
 
     @pytest.mark.asyncio
     async def test_get_series_stories_e2e(self, client):
@@ -978,11 +1117,11 @@ class TestMarvelClientE2E:
         
         # Validate each story
         for i, story in enumerate(response.data.results):
-            logger.info(f"Validating story {i+1}/{len(response.data.results)}")
+            logger.info("Validating story %s/%s", i+1, len(response.data.results))
             validate_story_data(story)
-            logger.info(f"✅ Avengers Series Story {i+1}: {story.title} (ID: {story.id})")
+            logger.info("✅ Avengers Series Story %s: %s (ID: %s)", i+1, story.title, story.id)
         
-        logger.info(f"✅ Successfully retrieved {len(response.data.results)} stories for Avengers series")
+        logger.info("✅ Successfully retrieved %s stories for Avengers series", len(response.data.results))
 
     # ============================================================================
     # STORY METHODS E2E TESTS
@@ -1000,7 +1139,7 @@ class TestMarvelClientE2E:
         
         if comics_response.data.results:
             story_id = comics_response.data.results[0].id
-            logger.info(f"Found story ID: {story_id}, now retrieving story details...")
+            logger.info("Found story ID: %s, now retrieving story details...", story_id)
             
             story = await client.get_story(story_id)
             
@@ -1013,7 +1152,7 @@ class TestMarvelClientE2E:
             assert story.title is not None, "Story title should not be None"
             assert story.modified is not None, "Story modified date should not be None"
             
-            logger.info(f"✅ Successfully retrieved story: {story.title}")
+            logger.info("✅ Successfully retrieved story: %s", story.title)
         else:
             logger.warning("No stories found for comic 21366")
             pytest.skip("No stories found for comic 21366")
@@ -1037,11 +1176,11 @@ class TestMarvelClientE2E:
         
         # Validate each story
         for i, story in enumerate(response.data.results):
-            logger.info(f"Validating story {i+1}/{len(response.data.results)}")
+            logger.info("Validating story %s/%s", i+1, len(response.data.results))
             validate_story_data(story)
-            logger.info(f"✅ Story {i+1}: {story.title} (ID: {story.id})")
+            logger.info("✅ Story %s: %s (ID: %s)", i+1, story.title, story.id)
         
-        logger.info(f"✅ Successfully retrieved {len(response.data.results)} stories")
+        logger.info("✅ Successfully retrieved %s stories", len(response.data.results))
 
     @pytest.mark.asyncio
     async def test_get_story_characters_e2e(self, client):
@@ -1053,7 +1192,7 @@ class TestMarvelClientE2E:
         stories_response = await client.list_stories(limit=1)
         if stories_response.data.results:
             story_id = stories_response.data.results[0].id
-            logger.info(f"Found story ID: {story_id}, now getting characters for this story...")
+            logger.info("Found story ID: %s, now getting characters for this story...", story_id)
             
             response = await client.get_story_characters(story_id, limit=3)
             
@@ -1069,13 +1208,13 @@ class TestMarvelClientE2E:
             # Validate each character if any exist
             if response.data.results:
                 for i, char in enumerate(response.data.results):
-                    logger.info(f"Validating character {i+1}/{len(response.data.results)}")
+                    logger.info("Validating character %s/%s", i+1, len(response.data.results))
                     validate_character_data(char)
-                    logger.info(f"✅ Story Character {i+1}: {char.name} (ID: {char.id})")
+                    logger.info("✅ Story Character %s: %s (ID: %s)", i+1, char.name, char.id)
             else:
                 logger.info("No characters found for this story")
             
-            logger.info(f"✅ Successfully retrieved {len(response.data.results)} characters for story {story_id}")
+            logger.info("✅ Successfully retrieved %s characters for story %s", len(response.data.results), story_id)
         else:
             logger.warning("No stories found")
             pytest.skip("No stories found")
@@ -1090,7 +1229,7 @@ class TestMarvelClientE2E:
         stories_response = await client.list_stories(limit=1)
         if stories_response.data.results:
             story_id = stories_response.data.results[0].id
-            logger.info(f"Found story ID: {story_id}, now getting comics for this story...")
+            logger.info("Found story ID: %s, now getting comics for this story...", story_id)
             
             response = await client.get_story_comics(story_id, limit=3)
             
@@ -1105,11 +1244,11 @@ class TestMarvelClientE2E:
             
             # Validate each comic
             for i, comic in enumerate(response.data.results):
-                logger.info(f"Validating comic {i+1}/{len(response.data.results)}")
+                logger.info("Validating comic %s/%s", i+1, len(response.data.results))
                 validate_comic_data(comic)
-                logger.info(f"✅ Story Comic {i+1}: {comic.title} (ID: {comic.id})")
+                logger.info("✅ Story Comic %s: %s (ID: %s)", i+1, comic.title, comic.id)
             
-            logger.info(f"✅ Successfully retrieved {len(response.data.results)} comics for story {story_id}")
+            logger.info("✅ Successfully retrieved %s comics for story %s", len(response.data.results), story_id)
         else:
             logger.warning("No stories found")
             pytest.skip("No stories found")
@@ -1124,7 +1263,7 @@ class TestMarvelClientE2E:
         stories_response = await client.list_stories(limit=1)
         if stories_response.data.results:
             story_id = stories_response.data.results[0].id
-            logger.info(f"Found story ID: {story_id}, now getting creators for this story...")
+            logger.info("Found story ID: %s, now getting creators for this story...", story_id)
             
             response = await client.get_story_creators(story_id, limit=3)
             
@@ -1140,13 +1279,13 @@ class TestMarvelClientE2E:
             # Validate each creator if any exist
             if response.data.results:
                 for i, creator in enumerate(response.data.results):
-                    logger.info(f"Validating creator {i+1}/{len(response.data.results)}")
+                    logger.info("Validating creator %s/%s", i+1, len(response.data.results))
                     validate_creator_data(creator)
-                    logger.info(f"✅ Story Creator {i+1}: {creator.full_name} (ID: {creator.id})")
+                    logger.info("✅ Story Creator %s: %s (ID: %s)", i+1, creator.full_name, creator.id)
             else:
                 logger.info("No creators found for this story")
             
-            logger.info(f"✅ Successfully retrieved {len(response.data.results)} creators for story {story_id}")
+            logger.info("✅ Successfully retrieved %s creators for story %s", len(response.data.results), story_id)
         else:
             logger.warning("No stories found")
             pytest.skip("No stories found")
@@ -1161,7 +1300,7 @@ class TestMarvelClientE2E:
         stories_response = await client.list_stories(limit=1)
         if stories_response.data.results:
             story_id = stories_response.data.results[0].id
-            logger.info(f"Found story ID: {story_id}, now getting events for this story...")
+            logger.info("Found story ID: %s, now getting events for this story...", story_id)
             
             response = await client.get_story_events(story_id, limit=3)
             
@@ -1177,13 +1316,13 @@ class TestMarvelClientE2E:
             # Validate each event if any exist
             if response.data.results:
                 for i, event in enumerate(response.data.results):
-                    logger.info(f"Validating event {i+1}/{len(response.data.results)}")
+                    logger.info("Validating event %s/%s", i+1, len(response.data.results))
                     validate_event_data(event)
-                    logger.info(f"✅ Story Event {i+1}: {event.title} (ID: {event.id})")
+                    logger.info("✅ Story Event %s: %s (ID: %s)", i+1, event.title, event.id)
             else:
                 logger.info("No events found for this story")
             
-            logger.info(f"✅ Successfully retrieved {len(response.data.results)} events for story {story_id}")
+            logger.info("✅ Successfully retrieved %s events for story %s", len(response.data.results), story_id)
         else:
             logger.warning("No stories found")
             pytest.skip("No stories found")
@@ -1198,7 +1337,7 @@ class TestMarvelClientE2E:
         stories_response = await client.list_stories(limit=1)
         if stories_response.data.results:
             story_id = stories_response.data.results[0].id
-            logger.info(f"Found story ID: {story_id}, now getting series for this story...")
+            logger.info("Found story ID: %s, now getting series for this story...", story_id)
             
             response = await client.get_story_series(story_id, limit=3)
             
@@ -1213,11 +1352,11 @@ class TestMarvelClientE2E:
             
             # Validate each series
             for i, series in enumerate(response.data.results):
-                logger.info(f"Validating series {i+1}/{len(response.data.results)}")
+                logger.info("Validating series %s/%s", i+1, len(response.data.results))
                 validate_series_data(series)
-                logger.info(f"✅ Story Series {i+1}: {series.title} (ID: {series.id})")
+                logger.info("✅ Story Series %s: %s (ID: %s)", i+1, series.title, series.id)
             
-            logger.info(f"✅ Successfully retrieved {len(response.data.results)} series for story {story_id}")
+            logger.info("✅ Successfully retrieved %s series for story %s", len(response.data.results), story_id)
         else:
             logger.warning("No stories found")
             pytest.skip("No stories found")
@@ -1241,7 +1380,7 @@ class TestMarvelClientE2E:
         assert "Stan" in creator.full_name, f"Expected 'Stan' in name, got '{creator.full_name}'"
         assert "Lee" in creator.full_name, f"Expected 'Lee' in name, got '{creator.full_name}'"
         
-        logger.info(f"✅ Successfully retrieved creator: {creator.full_name}")
+        logger.info("✅ Successfully retrieved creator: %s", creator.full_name)
 
     @pytest.mark.asyncio
     async def test_list_creators_e2e(self, client):
@@ -1262,11 +1401,11 @@ class TestMarvelClientE2E:
         
         # Validate each creator
         for i, creator in enumerate(response.data.results):
-            logger.info(f"Validating creator {i+1}/{len(response.data.results)}")
+            logger.info("Validating creator %s/%s", i+1, len(response.data.results))
             validate_creator_data(creator)
-            logger.info(f"✅ Creator {i+1}: {creator.full_name} (ID: {creator.id})")
+            logger.info("✅ Creator %s: %s (ID: %s)", i+1, creator.full_name, creator.id)
         
-        logger.info(f"✅ Successfully retrieved {len(response.data.results)} creators")
+        logger.info("✅ Successfully retrieved %s creators", len(response.data.results))
 
     @pytest.mark.asyncio
     async def test_search_creators_e2e(self, client):
@@ -1287,12 +1426,12 @@ class TestMarvelClientE2E:
         
         # Validate each creator and check search relevance
         for i, creator in enumerate(response.data.results):
-            logger.info(f"Validating creator {i+1}/{len(response.data.results)}")
+            logger.info("Validating creator %s/%s", i+1, len(response.data.results))
             validate_creator_data(creator)
             assert "stan lee" in creator.full_name.lower(), f"Expected 'stan lee' in name, got '{creator.full_name}'"
-            logger.info(f"✅ Stan Lee Creator {i+1}: {creator.full_name} (ID: {creator.id})")
+            logger.info("✅ Stan Lee Creator %s: %s (ID: %s)", i+1, creator.full_name, creator.id)
         
-        logger.info(f"✅ Successfully found {len(response.data.results)} Stan Lee creators")
+        logger.info("✅ Successfully found %s Stan Lee creators", len(response.data.results))
 
     @pytest.mark.asyncio
     async def test_get_creator_comics_e2e(self, client):
@@ -1313,11 +1452,11 @@ class TestMarvelClientE2E:
         
         # Validate each comic
         for i, comic in enumerate(response.data.results):
-            logger.info(f"Validating comic {i+1}/{len(response.data.results)}")
+            logger.info("Validating comic %s/%s", i+1, len(response.data.results))
             validate_comic_data(comic)
-            logger.info(f"✅ Stan Lee Comic {i+1}: {comic.title} (ID: {comic.id})")
+            logger.info("✅ Stan Lee Comic %s: %s (ID: %s)", i+1, comic.title, comic.id)
         
-        logger.info(f"✅ Successfully retrieved {len(response.data.results)} comics for Stan Lee")
+        logger.info("✅ Successfully retrieved %s comics for Stan Lee", len(response.data.results))
 
     @pytest.mark.asyncio
     async def test_get_creator_events_e2e(self, client):
@@ -1339,13 +1478,13 @@ class TestMarvelClientE2E:
         # Validate each event if any exist
         if response.data.results:
             for i, event in enumerate(response.data.results):
-                logger.info(f"Validating event {i+1}/{len(response.data.results)}")
+                logger.info("Validating event %s/%s", i+1, len(response.data.results))
                 validate_event_data(event)
-                logger.info(f"✅ Stan Lee Event {i+1}: {event.title} (ID: {event.id})")
+                logger.info("✅ Stan Lee Event %s: %s (ID: %s)", i+1, event.title, event.id)
         else:
             logger.info("No events found for Stan Lee")
         
-        logger.info(f"✅ Successfully retrieved {len(response.data.results)} events for Stan Lee")
+        logger.info("✅ Successfully retrieved %s events for Stan Lee", len(response.data.results))
 
     @pytest.mark.asyncio
     async def test_get_creator_series_e2e(self, client):
@@ -1366,11 +1505,11 @@ class TestMarvelClientE2E:
         
         # Validate each series
         for i, series in enumerate(response.data.results):
-            logger.info(f"Validating series {i+1}/{len(response.data.results)}")
+            logger.info("Validating series %s/%s", i+1, len(response.data.results))
             validate_series_data(series)
-            logger.info(f"✅ Stan Lee Series {i+1}: {series.title} (ID: {series.id})")
+            logger.info("✅ Stan Lee Series %s: %s (ID: %s)", i+1, series.title, series.id)
         
-        logger.info(f"✅ Successfully retrieved {len(response.data.results)} series for Stan Lee")
+        logger.info("✅ Successfully retrieved %s series for Stan Lee", len(response.data.results))
 
     @pytest.mark.asyncio
     async def test_get_creator_stories_e2e(self, client):
@@ -1391,11 +1530,11 @@ class TestMarvelClientE2E:
         
         # Validate each story
         for i, story in enumerate(response.data.results):
-            logger.info(f"Validating story {i+1}/{len(response.data.results)}")
+            logger.info("Validating story %s/%s", i+1, len(response.data.results))
             validate_story_data(story)
-            logger.info(f"✅ Stan Lee Story {i+1}: {story.title} (ID: {story.id})")
+            logger.info("✅ Stan Lee Story %s: %s (ID: %s)", i+1, story.title, story.id)
         
-        logger.info(f"✅ Successfully retrieved {len(response.data.results)} stories for Stan Lee")
+        logger.info("✅ Successfully retrieved %s stories for Stan Lee", len(response.data.results))
 
     # ============================================================================
     # INTEGRATION E2E TESTS
@@ -1417,7 +1556,7 @@ class TestMarvelClientE2E:
             
             logger.info("Validating character data within context...")
             assert character.name == "Iron Man", f"Expected 'Iron Man', got '{character.name}'"
-            logger.info(f"✅ Successfully retrieved {character.name} within context manager")
+            logger.info("✅ Successfully retrieved %s within context manager", character.name)
         
         logger.info("✅ Context manager test completed successfully")
 
@@ -1445,23 +1584,23 @@ class TestMarvelClientE2E:
         # Validate each result
         logger.info("Validating Iron Man character result...")
         assert results[0].name == "Iron Man", f"Expected 'Iron Man', got '{results[0].name}'"
-        logger.info(f"✅ Iron Man: {results[0].name}")
+        logger.info("✅ Iron Man: %s", results[0].name)
         
         logger.info("Validating Avengers #1 comic result...")
         assert results[1].title is not None, "Avengers #1 title should not be None"
-        logger.info(f"✅ Avengers #1: {results[1].title}")
+        logger.info("✅ Avengers #1: %s", results[1].title)
         
         logger.info("Validating Secret Invasion event result...")
         assert results[2].title is not None, "Secret Invasion title should not be None"
-        logger.info(f"✅ Secret Invasion: {results[2].title}")
+        logger.info("✅ Secret Invasion: %s", results[2].title)
         
         logger.info("Validating Avengers series result...")
         assert results[3].title is not None, "Avengers series title should not be None"
-        logger.info(f"✅ Avengers Series: {results[3].title}")
+        logger.info("✅ Avengers Series: %s", results[3].title)
         
         logger.info("Validating Stan Lee creator result...")
         assert results[4].full_name is not None, "Stan Lee full name should not be None"
-        logger.info(f"✅ Stan Lee: {results[4].full_name}")
+        logger.info("✅ Stan Lee: %s", results[4].full_name)
         
         logger.info("✅ All 5 concurrent requests completed successfully")
 
@@ -1473,22 +1612,22 @@ class TestMarvelClientE2E:
         
         # Test pagination by getting first page
         page1 = await client.list_characters(limit=5, offset=0)
-        logger.info(f"First page returned {len(page1.data.results)} characters")
+        logger.info("First page returned %s characters", len(page1.data.results))
         assert len(page1.data.results) == 5, f"Expected 5 results on first page, got {len(page1.data.results)}"
         
         # Log first page character IDs
         page1_ids = {char.id for char in page1.data.results}
-        logger.info(f"First page character IDs: {sorted(page1_ids)}")
+        logger.info("First page character IDs: %s", sorted(page1_ids))
         
         logger.info("Getting second page of characters (limit=5, offset=5)...")
         # Test pagination by getting second page
         page2 = await client.list_characters(limit=5, offset=5)
-        logger.info(f"Second page returned {len(page2.data.results)} characters")
+        logger.info("Second page returned %s characters", len(page2.data.results))
         assert len(page2.data.results) == 5, f"Expected 5 results on second page, got {len(page2.data.results)}"
         
         # Log second page character IDs
         page2_ids = {char.id for char in page2.data.results}
-        logger.info(f"Second page character IDs: {sorted(page2_ids)}")
+        logger.info("Second page character IDs: %s", sorted(page2_ids))
         
         # Ensure different results
         logger.info("Verifying that pages contain different characters...")
@@ -1517,11 +1656,11 @@ class TestMarvelClientE2E:
         
         # Validate each character
         for i, char in enumerate(response.data.results):
-            logger.info(f"Validating filtered character {i+1}/{len(response.data.results)}")
+            logger.info("Validating filtered character %s/%s", i+1, len(response.data.results))
             validate_character_data(char)
-            logger.info(f"✅ Filtered Character {i+1}: {char.name} (ID: {char.id})")
+            logger.info("✅ Filtered Character %s: %s (ID: %s)", i+1, char.name, char.id)
         
-        logger.info(f"✅ Successfully filtered and retrieved {len(response.data.results)} characters from Avengers #1")
+        logger.info("✅ Successfully filtered and retrieved %s characters from Avengers #1", len(response.data.results))
 
     @pytest.mark.asyncio
     async def test_error_handling_e2e(self, client):
@@ -1533,8 +1672,8 @@ class TestMarvelClientE2E:
         with pytest.raises(Exception) as exc_info:  # Should raise MarvelAPIError
             await client.get_character(999999999)
         
-        logger.info(f"✅ Error handling test passed - caught expected exception: {type(exc_info.value).__name__}")
-        logger.info(f"Exception message: {str(exc_info.value)}")
+        logger.info("✅ Error handling test passed - caught expected exception: %s", type(exc_info.value).__name__)
+        logger.info("Exception message: %s", str(exc_info.value))
         logger.info("✅ Error handling test completed successfully")
 
     @pytest.mark.asyncio
@@ -1573,13 +1712,13 @@ class TestMarvelClientE2E:
             "get_creator_comics", "get_creator_events", "get_creator_series", "get_creator_stories",
         ]
         
-        logger.info(f"Checking {len(expected_methods)} expected methods...")
+        logger.info("Checking %s expected methods...", len(expected_methods))
         
         for i, method_name in enumerate(expected_methods, 1):
-            logger.info(f"Checking method {i}/{len(expected_methods)}: {method_name}")
+            logger.info("Checking method %s/%s: %s", i, len(expected_methods), method_name)
             assert hasattr(client, method_name), f"Method {method_name} not found on client"
             method = getattr(client, method_name)
             assert callable(method), f"Method {method_name} is not callable"
-            logger.info(f"✅ Method {method_name} exists and is callable")
+            logger.info("✅ Method %s exists and is callable", method_name)
         
-        logger.info(f"✅ All {len(expected_methods)} methods exist and are callable")
+        logger.info("✅ All %s methods exist and are callable", len(expected_methods))
@@ -7,9 +7,12 @@ including authentication, error handling, and request functionality.
 import logging
 from unittest.mock import AsyncMock, Mock, patch
 
+import httpx
 import pytest
 
 from marvelpy.endpoints.base import BaseEndpoint
+from marvelpy.models.character import CharacterListResponse
+from marvelpy.utils.exceptions import MarvelAPIError, MarvelNotFoundError
 
 # Configure logging for tests
 logging.basicConfig(
@@ -96,6 +99,7 @@ class TestBaseEndpoint:
         mock_response = Mock()
         mock_response.json.return_value = {"code": 200, "data": {"id": 1}}
         mock_response.status_code = 200
+        response_model = Mock()
 
         with patch("httpx.AsyncClient") as mock_client:
             mock_client.return_value.__aenter__.return_value.request = AsyncMock(
@@ -112,12 +116,107 @@ class TestBaseEndpoint:
                 result = await endpoint._make_request(
                     "GET",
                     "/v1/public/characters/1",
-                    response_model=Mock,
+                    response_model=response_model,
                 )
 
-                assert result is not None
+                assert result is response_model.from_response.return_value
+                response_model.from_response.assert_called_once_with(mock_response)
                 logger.info("✅ Successful request with response model test completed successfully")
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("body", "expected_message"),
+        [
+            (b"not json", "Failed to parse JSON response"),
+            (b'{"code": 200}', "Failed to parse response into model"),
+        ],
+    )
+    async def test_make_request_parse_errors(self, body, expected_message):
+        """Test unparseable bodies are reported as Marvel API errors."""
+        logger.info("Testing parse failures are converted to Marvel API errors")
+
+        endpoint = BaseEndpoint(
+            base_url="https://gateway.marvel.com",
+            public_key="test_public_key",
+            private_key="test_private_key",
+        )
+
+        response = httpx.Response(
+            200, content=body, request=httpx.Request("GET", "https://gateway.marvel.com")
+        )
+
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_client.return_value.__aenter__.return_value.request = AsyncMock(
+                return_value=response
+            )
+
+            with pytest.raises(MarvelAPIError) as exc_info:
+                await endpoint._make_request(
+                    "GET",
+                    "/v1/public/characters/1",
+                    response_model=CharacterListResponse,
+                )
+
+            assert exc_info.value.message == expected_message
+            logger.info("✅ Parse error handling test completed successfully")
+
+    @pytest.mark.asyncio
+    async def test_make_request_retries_only_retryable_statuses(self):
+        """Test server errors are retried and client errors fail at once."""
+        logger.info("Testing request retries follow the converted error type")
+
+        endpoint = BaseEndpoint(
+            base_url="https://gateway.marvel.com",
+            public_key="test_public_key",
+            private_key="test_private_key",
+        )
+        request = httpx.Request("GET", "https://gateway.marvel.com")
+
+        with patch("httpx.AsyncClient") as mock_client, patch(
+            "asyncio.sleep", new_callable=AsyncMock
+        ):
+            send = mock_client.return_value.__aenter__.return_value.request = AsyncMock(
+                side_effect=[
+                    httpx.Response(503, request=request),
+                    httpx.Response(200, json={"code": 200}, request=request),
+                ]
+            )
+            assert await endpoint._make_request("GET", "/v1/public/characters") == {"code": 200}
+            assert send.call_count == 2
+
+            send.side_effect = [httpx.Response(404, json={"code": 404}, request=request)]
+            send.reset_mock()
+            with pytest.raises(MarvelNotFoundError):
+                await endpoint._make_request("GET", "/v1/public/characters/1")
+            assert send.call_count == 1
+
+        logger.info("✅ Request retry classification test completed successfully")
+
+    def test_circuit_breakers_are_per_endpoint(self):
+        """Test each endpoint keeps its own breakers, one per resource path."""
+        logger.info("Testing circuit breakers are held per endpoint")
+
+        endpoint = BaseEndpoint(
+            base_url="https://gateway.marvel.com",
+            public_key="test_public_key",
+            private_key="test_private_key",
+        )
+        other = BaseEndpoint(
+            base_url="https://gateway.marvel.com",
+            public_key="other_public_key",
+            private_key="other_private_key",
+        )
+
+        breaker = endpoint._circuit_breaker("/v1/public/comics")
+        assert endpoint._circuit_breaker("/v1/public/comics/21366/characters") is breaker
+        assert endpoint._circuit_breaker("/v1/public/events") is not breaker
+        assert other._circuit_breaker("/v1/public/comics") is not breaker
+
+        endpoint.reset_circuit_breakers()
+        assert endpoint._circuit_breaker("/v1/public/comics") is not breaker
+
+        logger.info("✅ Per-endpoint circuit breaker test completed successfully")
+
     @pytest.mark.asyncio
     async def test_make_request_without_response_model(self):
         """Test request without response model returns raw data."""
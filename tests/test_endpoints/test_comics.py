@@ -19,7 +19,7 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 from marvelpy.models.character import CharacterListResponse
-from marvelpy.models.comic import ComicListResponse
+from marvelpy.models.comic import ComicListBody, ComicListResponse
 from marvelpy.models.creator import CreatorListResponse
 from marvelpy.models.event import EventListResponse
 from marvelpy.models.story import StoryListResponse
@@ -77,7 +77,7 @@ class TestComicsEndpoint:
             mock_make_request.assert_called_once_with(
                 "GET",
                 "/v1/public/comics/21366",
-                response_model=ComicListResponse,
+                response_model=ComicListBody,
             )
             assert result == mock_comic
             
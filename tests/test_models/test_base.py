@@ -1,10 +1,12 @@
 """Tests for base model classes."""
 
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
+from unittest.mock import patch
 
 import pytest
-from pydantic import ValidationError
+from pydantic import Field, ValidationError
+from typing_extensions import Annotated
 
 # Configure logging for tests
 logging.basicConfig(
@@ -13,7 +15,24 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-from marvelpy.models.base import BaseListResponse, BaseModel, BaseResponse, DataContainer
+from marvelpy.models.base import (
+    BaseListResponse,
+    BaseModel,
+    BaseResponse,
+    DataContainer,
+    FrozenModel,
+    LazyField,
+    _LazyAdapter,
+)
+
+
+class _Inner(BaseModel):
+    value: int
+
+
+class _Outer(BaseModel):
+    name: str
+    inner: Annotated[_Inner, LazyField()]
 
 
 class TestBaseModel:
@@ -44,26 +63,25 @@ class TestBaseModel:
         
         logger.info("✅ BaseModel creation test completed successfully")
 
-    def test_base_model_extra_fields_allowed(self):
-        """Test BaseModel allows extra fields from API responses.
+    def test_base_model_extra_fields_ignored(self):
+        """Test BaseModel ignores extra fields from API responses.
 
-        This test verifies that the extra="allow" configuration works
-        correctly, allowing fields that aren't defined in the model schema
-        to be included. This is crucial for API compatibility as Marvel
-        may add new fields without breaking existing clients.
+        This test verifies that the extra="ignore" configuration works
+        correctly, accepting fields that aren't defined in the model schema
+        without storing them. This keeps Marvel API additions from breaking
+        existing clients while avoiding a per-instance extras dictionary.
 
         Expected behavior:
             - Extra fields can be passed during instantiation
-            - Extra fields are accessible as attributes
-            - Extra fields maintain their original values
+            - Extra fields are not stored on the model
         """
-        logger.info("Testing BaseModel allows extra fields from API responses")
+        logger.info("Testing BaseModel ignores extra fields from API responses")
         
         model = BaseModel(extra_field="test_value")
-        assert hasattr(model, "extra_field")
-        assert model.extra_field == "test_value"
+        assert not hasattr(model, "extra_field")
+        assert model.__pydantic_extra__ is None
         
-        logger.info("✅ BaseModel extra fields allowed test completed successfully")
+        logger.info("✅ BaseModel extra fields ignored test completed successfully")
 
     def test_base_model_validation_assignment(self):
         """Test BaseModel validates field assignments after creation.
@@ -74,19 +92,116 @@ class TestBaseModel:
 
         Expected behavior:
             - Field assignments after creation are allowed
-            - Extra fields can be assigned dynamically
-            - Assigned values are stored correctly
+            - Assigned values are coerced to the field type
+            - Invalid assignments raise ValidationError
         """
         logger.info("Testing BaseModel validates field assignments after creation")
         
-        model = BaseModel()
-        # This should not raise an error due to extra="allow"
-        model.extra_field = "test"
-        assert model.extra_field == "test"
+        model = _Inner(value=1)
+        model.value = "2"
+        assert model.value == 2
+
+        with pytest.raises(ValidationError):
+            model.value = "not a number"
         
         logger.info("✅ BaseModel validation assignment test completed successfully")
 
 
+    def test_base_model_trusted_construct(self):
+        """Test trusted_construct builds nested models without validation.
+
+        Expected behavior:
+            - API aliases and Python names are both accepted
+            - Nested models and lists of models are built recursively
+            - Values are stored as-is, without coercion
+            - Unknown keys are dropped
+        """
+        logger.info("Testing BaseModel.trusted_construct")
+
+        response = BaseListResponse[_Inner].trusted_construct(
+            {
+                "code": 200,
+                "status": "Ok",
+                "copyright": "© 2024 MARVEL",
+                "attributionText": "Data provided by Marvel.",
+                "attribution_html": "<a>Data provided by Marvel.</a>",
+                "etag": "etag123",
+                "data": {
+                    "offset": 0,
+                    "limit": 20,
+                    "total": 1,
+                    "count": 1,
+                    "results": [{"value": "7"}],
+                },
+                "unknown": True,
+            }
+        )
+
+        assert response.attribution_text == "Data provided by Marvel."
+        assert response.attribution_html == "<a>Data provided by Marvel.</a>"
+        assert isinstance(response.data, DataContainer)
+        assert isinstance(response.data.results[0], _Inner)
+        assert response.data.results[0].value == "7"
+        assert not hasattr(response, "unknown")
+
+        logger.info("✅ BaseModel trusted_construct test completed successfully")
+
+    def test_base_model_trusted_construct_matches_model_construct(self):
+        """Test trusted_construct fills defaults like model_construct.
+
+        Expected behavior:
+            - Missing optional fields get their defaults, including factories
+            - Mutable defaults are not shared between instances
+            - model_fields_set only holds the fields that were given
+        """
+        logger.info("Testing trusted_construct defaults match model_construct")
+
+        class Tagged(BaseModel):
+            name: str
+            note: Optional[str] = None
+            tags: List[str] = Field(default_factory=list)
+
+        first = Tagged.trusted_construct({"name": "Hulk"})
+        second = Tagged.trusted_construct({"name": "Hulk"})
+
+        assert first == Tagged.model_construct(name="Hulk")
+        assert first.note is None
+        assert first.tags == []
+        assert first.tags is not second.tags
+        assert first.model_fields_set == {"name"}
+
+        logger.info("✅ trusted_construct defaults test completed successfully")
+
+
+class TestFrozenModel:
+    """Test cases for FrozenModel class.
+
+    This test class verifies that FrozenModel subclasses are immutable and
+    hashable while keeping the BaseModel configuration.
+    """
+
+    def test_frozen_model_rejects_assignment(self):
+        """Test FrozenModel instances cannot be modified.
+
+        Expected behavior:
+            - Assigning to a field raises ValidationError
+            - Equal instances hash equally
+            - Extra fields are still ignored
+        """
+        logger.info("Testing FrozenModel rejects assignment")
+
+        class Point(FrozenModel):
+            x: int
+
+        point = Point(x=1, extra_field="ignored")
+        with pytest.raises(ValidationError):
+            point.x = 2
+        assert hash(point) == hash(Point(x=1))
+        assert not hasattr(point, "extra_field")
+
+        logger.info("✅ FrozenModel assignment test completed successfully")
+
+
 class TestDataContainer:
     """Test cases for DataContainer class.
 
@@ -311,6 +426,100 @@ class TestBaseListResponse:
         
         logger.info("✅ BaseListResponse creation test completed successfully")
 
+    def test_base_list_response_from_response(self):
+        """Test BaseListResponse can be parsed directly from an HTTP response.
+
+        Expected behavior:
+            - The raw response body is parsed and validated in one step
+            - Aliased fields are populated from the JSON keys
+        """
+        logger.info("Testing BaseListResponse parses an HTTP response body")
+
+        import httpx
+
+        response = httpx.Response(
+            200,
+            json={
+                "code": 200,
+                "status": "Ok",
+                "copyright": "© 2024 MARVEL",
+                "attributionText": "Data provided by Marvel. © 2024 MARVEL",
+                "attributionHTML": "<a href='http://marvel.com'>Data provided by Marvel</a>",
+                "etag": "etag123",
+                "data": {"offset": 0, "limit": 20, "total": 2, "count": 2, "results": ["a", "b"]},
+            },
+        )
+
+        parsed = BaseListResponse[str].from_response(response)
+
+        assert parsed.attribution_text == "Data provided by Marvel. © 2024 MARVEL"
+        assert parsed.data.results == ["a", "b"]
+
+        logger.info("✅ BaseListResponse from_response test completed successfully")
+
+    def test_base_list_response_populate_by_name(self):
+        """Test BaseListResponse accepts Python field names as well as aliases.
+
+        Expected behavior:
+            - Aliased fields can be populated by their Python names
+            - Dumping by alias still produces the API's camelCase keys
+        """
+        logger.info("Testing BaseListResponse accepts Python field names")
+
+        response = BaseListResponse(
+            code=200,
+            status="Ok",
+            copyright="© 2024 MARVEL",
+            attribution_text="Data provided by Marvel. © 2024 MARVEL",
+            attribution_html="<a href='http://marvel.com'>Data provided by Marvel.</a>",
+            etag="etag123",
+            data=DataContainer(offset=0, limit=20, total=0, count=0, results=[]),
+        )
+
+        assert response.attribution_text == "Data provided by Marvel. © 2024 MARVEL"
+        dumped = response.model_dump(by_alias=True)
+        assert dumped["attributionHTML"] == "<a href='http://marvel.com'>Data provided by Marvel.</a>"
+        assert "attribution_html" not in dumped
+
+        logger.info("✅ BaseListResponse populate by name test completed successfully")
+
+    def test_base_list_response_interns_attribution(self):
+        """Test BaseListResponse shares attribution strings between responses.
+
+        Marvel repeats the same copyright and attribution text on every
+        response, so these values are interned rather than stored once per
+        response object.
+
+        Expected behavior:
+            - Equal attribution values from separate responses are the same object
+            - Assigned attribution values are interned as well
+        """
+        logger.info("Testing BaseListResponse interns attribution strings")
+
+        def build() -> BaseListResponse:
+            return BaseListResponse.model_validate(
+                {
+                    "code": 200,
+                    "status": "Ok",
+                    "copyright": "".join(["© 2024 ", "MARVEL"]),
+                    "attributionText": "".join(["Data provided by Marvel. ", "© 2024 MARVEL"]),
+                    "attributionHTML": "".join(["<a href='http://marvel.com'>", "Data</a>"]),
+                    "etag": "etag123",
+                    "data": {"offset": 0, "limit": 20, "total": 0, "count": 0, "results": []},
+                }
+            )
+
+        first, second = build(), build()
+        assert first.copyright is second.copyright
+        assert first.attribution_text is second.attribution_text
+        assert first.attribution_html is second.attribution_html
+
+        first.copyright = "".join(["© 2025 ", "MARVEL"])
+        second.copyright = "".join(["© 2025 ", "MARVEL"])
+        assert first.copyright is second.copyright
+
+        logger.info("✅ BaseListResponse attribution interning test completed successfully")
+
     def test_base_list_response_missing_required_fields(self):
         """Test BaseListResponse raises ValidationError for missing required fields.
 
@@ -409,3 +618,107 @@ class TestGenericTypes:
         assert dict_container.results == [{"id": 1}, {"id": 2}]
         
         logger.info("✅ DataContainer generic type test completed successfully")
+
+
+class TestLazyField:
+    """Test cases for LazyField deferred validation.
+
+    This test class verifies that fields marked with LazyField keep their
+    raw payload until first access, then validate and cache the result,
+    while serialization and comparison behave like an eager field.
+    """
+
+    def test_lazy_field_validates_on_first_access(self):
+        """Test a LazyField payload is validated on first access and cached.
+
+        Expected behavior:
+            - The raw payload is stored as-is when the model is built
+            - First access returns a validated model instance
+            - The validated instance replaces the raw payload
+        """
+        logger.info("Testing LazyField validates on first access")
+
+        outer = _Outer.model_validate({"name": "test", "inner": {"value": 1}})
+        assert outer.__dict__["inner"] == {"value": 1}
+
+        inner = outer.inner
+        assert isinstance(inner, _Inner)
+        assert inner.value == 1
+        assert outer.inner is inner
+
+        logger.info("✅ LazyField first access test completed successfully")
+
+    def test_lazy_field_errors_surface_on_access(self):
+        """Test an invalid LazyField payload raises when it is read.
+
+        Expected behavior:
+            - Building the outer model does not validate the payload
+            - Reading the field raises ValidationError
+        """
+        logger.info("Testing LazyField errors surface on access")
+
+        outer = _Outer.model_validate({"name": "test", "inner": {"value": "bad"}})
+        with pytest.raises(ValidationError):
+            _ = outer.inner
+
+        logger.info("✅ LazyField error test completed successfully")
+
+    def test_lazy_field_validates_once_per_instance(self):
+        """Test repeated reads of a LazyField do not validate it again.
+
+        Expected behavior:
+            - Each instance validates its payload once, on first access
+            - Assigning a new payload validates it on the next read
+        """
+        logger.info("Testing LazyField validates once per instance")
+
+        first = _Outer.model_validate({"name": "first", "inner": {"value": 1}})
+        second = _Outer.model_validate({"name": "second", "inner": {"value": 2}})
+        with patch.object(
+            _LazyAdapter, "validate", autospec=True, side_effect=_LazyAdapter.validate
+        ) as validate:
+            for _ in range(3):
+                assert first.inner.value == 1
+                assert second.inner.value == 2
+            assert validate.call_count == 2
+
+            first.inner = {"value": 3}
+            assert first.inner.value == 3
+            assert first.inner.value == 3
+            assert validate.call_count == 3
+
+        logger.info("✅ LazyField single validation test completed successfully")
+
+    def test_lazy_field_strict_validation_is_eager(self):
+        """Test strict validation checks LazyField payloads while parsing.
+
+        Expected behavior:
+            - An invalid payload is rejected by strict model_validate_json
+            - A valid payload is stored already validated
+        """
+        logger.info("Testing LazyField strict validation is eager")
+
+        with pytest.raises(ValidationError):
+            _Outer.model_validate_json('{"name": "test", "inner": {"value": "2"}}', strict=True)
+
+        outer = _Outer.model_validate_json('{"name": "test", "inner": {"value": 2}}', strict=True)
+        assert isinstance(outer.__dict__["inner"], _Inner)
+
+        logger.info("✅ LazyField strict validation test completed successfully")
+
+    def test_lazy_field_serialization_and_equality(self):
+        """Test raw LazyField payloads dump and compare like validated ones.
+
+        Expected behavior:
+            - model_dump validates the raw payload before dumping it
+            - A model with a raw payload equals one that was already loaded
+        """
+        logger.info("Testing LazyField serialization and equality")
+
+        raw = _Outer.model_validate_json('{"name": "test", "inner": {"value": "2"}}')
+        loaded = _Outer(name="test", inner=_Inner(value=2))
+
+        assert raw.model_dump() == {"name": "test", "inner": {"value": 2}}
+        assert raw == loaded
+
+        logger.info("✅ LazyField serialization test completed successfully")
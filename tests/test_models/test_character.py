@@ -6,6 +6,8 @@ handling, and data integrity for character structures.
 """
 
 import logging
+from typing import Any, Dict
+
 import pytest
 from pydantic import ValidationError
 
@@ -119,7 +121,7 @@ class TestComicList:
 
         assert comic_list.available == 0
         assert comic_list.returned == 0
-        assert comic_list.items == []
+        assert comic_list.items == ()
         
         logger.info("✅ ComicList empty items test completed successfully")
 
@@ -527,11 +529,87 @@ class TestCharacter:
             ),
         )
 
-        assert character.urls == []
+        assert character.urls == ()
         assert character.name == "Iron Man"
         
         logger.info("✅ Character empty URLs test completed successfully")
 
+    def test_character_is_hashable(self):
+        """Test Character can be hashed, including its URLs.
+
+        This test verifies that shared Character instances are fully
+        immutable: URLs are stored as a tuple, so equal characters hash
+        equally and can be used as set members or dictionary keys.
+
+        Expected behavior:
+            - URLs parsed from a JSON list are stored as a tuple
+            - Equal characters have equal hashes
+        """
+        logger.info("Testing Character is hashable")
+
+        empty_list = {"available": 0, "returned": 0, "collectionURI": "...", "items": []}
+        payload = {
+            "id": 1009368,
+            "name": "Iron Man",
+            "description": "",
+            "modified": "2014-04-29T14:18:17-0400",
+            "resourceURI": "http://gateway.marvel.com/v1/public/characters/1009368",
+            "urls": [{"type": "detail", "url": "http://marvel.com/characters/9/iron_man"}],
+            "comics": empty_list,
+            "stories": empty_list,
+            "events": empty_list,
+            "series": empty_list,
+        }
+        character = Character.model_validate(payload)
+        assert isinstance(character.urls, tuple)
+        assert hash(character) == hash(Character.model_validate(payload))
+        assert len({character, Character.model_validate(payload)}) == 1
+
+        logger.info("✅ Character hashable test completed successfully")
+
+    def test_character_related_lists_are_lazy(self):
+        """Test Character defers validation of its related-resource lists.
+
+        This test verifies that the comics, stories, events and series
+        collections are kept as raw payloads until they are first read,
+        and then validated into their list models.
+
+        Expected behavior:
+            - Related lists are stored raw after validation
+            - Reading a related list returns the validated list model
+            - Unread lists remain raw
+        """
+        logger.info("Testing Character defers validation of related lists")
+
+        def collection(kind: str) -> Dict[str, Any]:
+            return {
+                "available": 1,
+                "returned": 1,
+                "collectionURI": f"http://gateway.marvel.com/v1/public/characters/1009368/{kind}",
+                "items": [{"resourceURI": "http://gateway.marvel.com/v1/public/x/1", "name": "X"}],
+            }
+
+        character = Character.model_validate(
+            {
+                "id": 1009368,
+                "name": "Iron Man",
+                "description": "",
+                "modified": "2014-04-29T14:18:17-0400",
+                "resourceURI": "http://gateway.marvel.com/v1/public/characters/1009368",
+                "comics": collection("comics"),
+                "stories": collection("stories"),
+                "events": collection("events"),
+                "series": collection("series"),
+            }
+        )
+
+        assert character.__dict__["comics"] == collection("comics")
+        assert isinstance(character.comics, ComicList)
+        assert character.comics.items[0].name == "X"
+        assert isinstance(character.__dict__["stories"], dict)
+
+        logger.info("✅ Character lazy related lists test completed successfully")
+
 
 class TestCharacterResponse:
     """Test cases for CharacterResponse class.
@@ -731,3 +809,94 @@ class TestCharacterListResponse:
             CharacterListResponse(code=200, status="Ok")  # Missing other required fields
         
         logger.info("✅ CharacterListResponse missing required fields test completed successfully")
+
+    def test_character_list_response_shares_repeated_characters(self):
+        """Test CharacterListResponse reuses characters seen in other responses.
+
+        This test verifies that a character returned by several list responses
+        is materialized once while an earlier response is still alive, which
+        keeps paginated crawls from accumulating duplicate Character objects.
+
+        Expected behavior:
+            - The same character parsed twice yields the identical instance
+            - Shared characters cannot be modified through either response
+            - A newer ``modified`` timestamp produces a fresh instance
+        """
+        logger.info("Testing CharacterListResponse shares repeated characters")
+
+        def make_payload(modified: str) -> dict:
+            empty_list = {"available": 0, "returned": 0, "collectionURI": "...", "items": []}
+            return {
+                "code": 200,
+                "status": "Ok",
+                "copyright": "© 2024 MARVEL",
+                "attributionText": "Data provided by Marvel. © 2024 MARVEL",
+                "attributionHTML": "<a href='http://marvel.com'>Data provided by Marvel. © 2024 MARVEL</a>",
+                "etag": "etag123",
+                "data": {
+                    "offset": 0,
+                    "limit": 20,
+                    "total": 1,
+                    "count": 1,
+                    "results": [
+                        {
+                            "id": 1009610,
+                            "name": "Spider-Man",
+                            "description": "",
+                            "modified": modified,
+                            "resourceURI": "http://gateway.marvel.com/v1/public/characters/1009610",
+                            "comics": empty_list,
+                            "stories": empty_list,
+                            "events": empty_list,
+                            "series": empty_list,
+                        }
+                    ],
+                },
+            }
+
+        first = CharacterListResponse.model_validate(make_payload("2014-04-29T14:18:17-0400"))
+        second = CharacterListResponse.model_validate(make_payload("2014-04-29T14:18:17-0400"))
+        assert second.data.results[0] is first.data.results[0]
+        with pytest.raises(ValidationError):
+            second.data.results[0].name = "Changed"
+        assert first.data.results[0].name == "Spider-Man"
+
+        updated = CharacterListResponse.model_validate(make_payload("2020-01-01T00:00:00-0400"))
+        assert updated.data.results[0] is not first.data.results[0]
+        assert updated.data.results[0].modified == "2020-01-01T00:00:00-0400"
+
+        logger.info("✅ CharacterListResponse character sharing test completed successfully")
+
+    def test_character_list_response_from_json(self):
+        """Test CharacterListResponse parses raw response bytes.
+
+        This test verifies that from_json parses a raw JSON body into the
+        class it is called on and rejects malformed input.
+
+        Expected behavior:
+            - Valid bytes parse into a CharacterListResponse
+            - Subclasses parse into the subclass
+            - Invalid JSON raises ValidationError
+        """
+        logger.info("Testing CharacterListResponse parses raw response bytes")
+
+        body = (
+            b'{"code": 200, "status": "Ok", "copyright": "\xc2\xa9 2024 MARVEL",'
+            b' "attributionText": "Data provided by Marvel.",'
+            b' "attributionHTML": "<a>Data provided by Marvel.</a>", "etag": "etag123",'
+            b' "data": {"offset": 0, "limit": 20, "total": 0, "count": 0, "results": []}}'
+        )
+        response = CharacterListResponse.from_json(body)
+        assert isinstance(response, CharacterListResponse)
+        assert response.copyright == "© 2024 MARVEL"
+        assert response.data.results == []
+
+        class _Subclass(CharacterListResponse):
+            pass
+
+        assert type(_Subclass.from_json(body)) is _Subclass
+
+        with pytest.raises(ValidationError):
+            CharacterListResponse.from_json(b"{not json")
+
+        logger.info("✅ CharacterListResponse from_json test completed successfully")
@@ -5,7 +5,11 @@ used in Marvel API responses. These tests verify proper validation, field
 handling, and data integrity for comic structures.
 """
 
+import json
 import logging
+from datetime import datetime, timezone
+
+import httpx
 import pytest
 from pydantic import ValidationError
 
@@ -16,14 +20,20 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+from marvelpy.models import character as character_models  # noqa: E402
 from marvelpy.models.comic import (
     CharacterList,
     Comic,
+    ComicBatch,
+    ComicListBody,
     ComicListResponse,
     ComicResponse,
     CreatorList,
     EventList,
     StoryList,
+    dump_comic_list,
+    parse_comic,
+    parse_comic_list,
 )
 from marvelpy.models.common import (
     URL,
@@ -35,10 +45,33 @@ from marvelpy.models.common import (
     Price,
     SeriesSummary,
     StorySummary,
+    SummaryList,
     TextObject,
 )
 
 
+def _comic_list_body(
+    comic_id: str = "21366", modified: str = "2014-04-29T14:18:17-0400"
+) -> bytes:
+    """Build a minimal raw comic list response body."""
+    empty_list = '{"available": 0, "returned": 0, "collectionURI": "...", "items": []}'
+    return (
+        '{"code": 200, "status": "Ok", "copyright": "© 2024 MARVEL",'
+        ' "attributionText": "Data provided by Marvel.",'
+        ' "attributionHTML": "<a>Data provided by Marvel.</a>", "etag": "etag123",'
+        ' "data": {"offset": 0, "limit": 20, "total": 1, "count": 1, "results": [{'
+        f'"id": {comic_id}, "digitalId": 0, "title": "Avengers (1963) #1", "issueNumber": 1,'
+        f' "modified": "{modified}", "isbn": "", "upc": "",'
+        ' "diamondCode": "", "ean": "", "issn": "", "format": "Comic", "pageCount": 32,'
+        ' "textObjects": [], "resourceURI": "http://gateway.marvel.com/v1/public/comics/21366",'
+        ' "series": {"resourceURI": "...", "name": "Avengers (1963 - 1996)"},'
+        ' "collectedIssues": [],'
+        f' "creators": {empty_list}, "characters": {empty_list},'
+        f' "stories": {empty_list}, "events": {empty_list}'
+        "}]}}"
+    ).encode()
+
+
 class TestCharacterList:
     """Test cases for CharacterList class.
 
@@ -100,6 +133,40 @@ class TestCharacterList:
         
         logger.info("✅ CharacterList missing required fields test completed successfully")
 
+    def test_character_list_is_generic_summary_list(self):
+        """Test comic related-resource lists are SummaryList specializations.
+
+        Expected behavior:
+            - CharacterList is SummaryList[CharacterSummary]
+            - Comic and character models share the same EventList class
+        """
+        logger.info("Testing comic lists are SummaryList specializations")
+
+        assert CharacterList is SummaryList[CharacterSummary]
+        assert EventList is character_models.EventList
+
+        logger.info("✅ Comic SummaryList specialization test completed successfully")
+
+    def test_character_list_is_frozen(self):
+        """Test CharacterList instances are immutable once parsed.
+
+        Expected behavior:
+            - Assigning to a field raises ValidationError
+            - The original value is unchanged
+        """
+        logger.info("Testing CharacterList instances are immutable")
+
+        character_list = CharacterList(
+            available=1,
+            returned=1,
+            collectionURI="http://gateway.marvel.com/v1/public/comics/21366/characters",
+        )
+        with pytest.raises(ValidationError):
+            character_list.available = 2
+        assert character_list.available == 1
+
+        logger.info("✅ CharacterList frozen test completed successfully")
+
 
 class TestCreatorList:
     """Test cases for CreatorList class.
@@ -388,17 +455,17 @@ class TestComic:
         assert comic.issn == ""
         assert comic.format == "Comic"
         assert comic.page_count == 32
-        assert comic.text_objects == []
+        assert comic.text_objects == ()
         assert comic.resource_uri == "http://gateway.marvel.com/v1/public/comics/21366"
-        assert comic.urls == []
+        assert comic.urls == ()
         assert comic.series.name == "Avengers (1963 - 1996)"
-        assert comic.variants == []
-        assert comic.collections == []
-        assert comic.collected_issues == []
-        assert comic.dates == []
-        assert comic.prices == []
+        assert comic.variants == ()
+        assert comic.collections == ()
+        assert comic.collected_issues == ()
+        assert comic.dates == ()
+        assert comic.prices == ()
         assert comic.thumbnail is None
-        assert comic.images == []
+        assert comic.images == ()
         assert comic.creators.available == 0
         assert comic.characters.available == 0
         assert comic.stories.available == 0
@@ -429,6 +496,145 @@ class TestComic:
         
         logger.info("✅ Comic missing required fields test completed successfully")
 
+    def test_comic_shares_comic_summary_schema(self):
+        """Test Comic reuses one ComicSummary schema across its fields.
+
+        The variants, collections and collected_issues fields all hold
+        ComicSummary items; they should reference a single shared core
+        schema definition rather than each embedding its own copy.
+
+        Expected behavior:
+            - Comic is fully built at import time
+            - ComicSummary appears exactly once in the schema definitions
+        """
+        logger.info("Testing Comic shares the ComicSummary schema")
+
+        assert Comic.__pydantic_complete__
+        schema = Comic.__pydantic_core_schema__
+        assert schema["type"] == "definitions"
+        refs = [definition["ref"] for definition in schema["definitions"]]
+        assert sum("ComicSummary" in ref for ref in refs) == 1
+
+        logger.info("✅ Comic ComicSummary schema sharing test completed successfully")
+
+    def test_comic_accepts_api_and_python_field_names(self):
+        """Test Comic resolves camelCase API keys and Python field names alike.
+
+        Alias resolution happens inside the compiled validator, so raw API
+        dictionaries can be validated as-is without renaming their keys.
+
+        Expected behavior:
+            - A payload keyed by API aliases validates
+            - A payload keyed by Python field names produces an equal Comic
+        """
+        logger.info("Testing Comic accepts API and Python field names")
+
+        empty_list = {"available": 0, "returned": 0, "collectionURI": "...", "items": []}
+        api_payload = {
+            "id": 21366,
+            "digitalId": 0,
+            "title": "Avengers (1963) #1",
+            "issueNumber": 1,
+            "modified": "2014-04-29T14:18:17-0400",
+            "isbn": "",
+            "upc": "",
+            "diamondCode": "",
+            "ean": "",
+            "issn": "",
+            "format": "Comic",
+            "pageCount": 32,
+            "textObjects": [],
+            "resourceURI": "http://gateway.marvel.com/v1/public/comics/21366",
+            "series": {"resourceURI": "...", "name": "Avengers (1963 - 1996)"},
+            "collectedIssues": [],
+            "creators": empty_list,
+            "characters": empty_list,
+            "stories": empty_list,
+            "events": empty_list,
+        }
+        renamed = {
+            name: api_payload[field.validation_alias or name]
+            for name, field in Comic.model_fields.items()
+            if (field.validation_alias or name) in api_payload
+        }
+
+        comic = Comic.model_validate(api_payload)
+        assert comic.issue_number == 1
+        assert comic.page_count == 32
+        assert Comic.model_validate(renamed) == comic
+
+        logger.info("✅ Comic API and Python field names test completed successfully")
+
+    def test_comic_modified_dt(self):
+        """Test Comic parses its modified timestamp lazily.
+
+        Expected behavior:
+            - modified_dt is a timezone-aware datetime matching modified
+            - Parsed values are cached, but a copy with a new modified
+              timestamp gets a matching datetime
+            - Marvel's placeholder timestamp yields None
+        """
+        logger.info("Testing Comic modified_dt parsing")
+
+        comic = ComicListResponse.from_json(_comic_list_body()).data.results[0]
+        modified = comic.modified_dt
+        assert modified == datetime(2014, 4, 29, 18, 18, 17, tzinfo=timezone.utc)
+        assert comic.modified_dt is modified
+        copy = comic.model_copy(update={"modified": "2020-01-01T00:00:00+0000"})
+        assert copy.modified_dt == datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+        placeholder = ComicListResponse.from_json(
+            _comic_list_body(modified="-0001-11-30T00:00:00-0500")
+        ).data.results[0]
+        assert placeholder.modified_dt is None
+
+        logger.info("✅ Comic modified_dt test completed successfully")
+
+    def test_comic_shares_pooled_value_objects(self):
+        """Test equal prices, URLs and images are shared between comics.
+
+        Expected behavior:
+            - Two comics with equal prices, URLs and images reference the same objects
+            - Pooled values keep their field values
+        """
+        logger.info("Testing Comic pools repeated value objects")
+
+        payload = json.loads(_comic_list_body())["data"]["results"][0]
+        payload["prices"] = [{"type": "printPrice", "price": 3.99}]
+        payload["urls"] = [{"type": "detail", "url": "http://marvel.com/comics/issue/21366"}]
+        payload["thumbnail"] = {"path": "http://i.annihil.us/u/prod/marvel/i/mg/c", "extension": "jpg"}
+        payload["images"] = [payload["thumbnail"]]
+
+        first = Comic.model_validate(payload)
+        second = Comic.model_validate(payload)
+
+        assert first.prices[0] is second.prices[0]
+        assert first.urls[0] is second.urls[0]
+        assert first.thumbnail is second.thumbnail is first.images[0]
+        assert first.prices[0].price == 3.99
+        assert first.thumbnail.url == "http://i.annihil.us/u/prod/marvel/i/mg/c.jpg"
+
+        logger.info("✅ Comic pooled value objects test completed successfully")
+
+    def test_comic_trusted_construct_round_trip(self):
+        """Test Comic.trusted_construct rebuilds a dumped comic.
+
+        Expected behavior:
+            - A comic rebuilt from model_dump(by_alias=True) equals the original
+            - Nested summary lists are models and collections are tuples
+        """
+        logger.info("Testing Comic.trusted_construct round trip")
+
+        comic = ComicListResponse.from_json(_comic_list_body()).data.results[0]
+        rebuilt = Comic.trusted_construct(comic.model_dump(by_alias=True))
+
+        assert rebuilt == comic
+        assert isinstance(rebuilt.creators, CreatorList)
+        assert isinstance(rebuilt.series, SeriesSummary)
+        assert rebuilt.text_objects == ()
+
+        logger.info("✅ Comic trusted_construct round trip test completed successfully")
+
     def test_comic_with_optional_fields(self):
         """Test Comic handles optional fields correctly.
 
@@ -779,3 +985,187 @@ class TestComicListResponse:
             ComicListResponse(code=200, status="Ok")  # Missing other required fields
         
         logger.info("✅ ComicListResponse missing required fields test completed successfully")
+
+    def test_comic_list_response_from_json(self):
+        """Test ComicListResponse parses a raw JSON body.
+
+        This test verifies that from_json validates raw response bytes
+        directly into a ComicListResponse, including nested comics.
+
+        Expected behavior:
+            - Valid bytes produce a ComicListResponse with typed comics
+            - Subclasses parse into the subclass
+            - Invalid JSON raises ValidationError
+        """
+        logger.info("Testing ComicListResponse parses a raw JSON body")
+
+        body = _comic_list_body()
+
+        response = ComicListResponse.from_json(body)
+        assert isinstance(response.data.results[0], Comic)
+        assert response.data.results[0].title == "Avengers (1963) #1"
+
+        class _Subclass(ComicListResponse):
+            pass
+
+        assert type(_Subclass.from_json(body)) is _Subclass
+
+        with pytest.raises(ValidationError):
+            ComicListResponse.from_json(b"{not json")
+
+        logger.info("✅ ComicListResponse from_json test completed successfully")
+
+    def test_comic_list_response_from_json_strict(self):
+        """Test ComicListResponse.from_json can reject coerced values.
+
+        Expected behavior:
+            - A numeric string ID is coerced by default
+            - The same body raises ValidationError with strict=True
+        """
+        logger.info("Testing ComicListResponse.from_json strict mode")
+
+        body = _comic_list_body(comic_id='"21366"')
+        assert ComicListResponse.from_json(body).data.results[0].id == 21366
+
+        with pytest.raises(ValidationError):
+            ComicListResponse.from_json(body, strict=True)
+        assert ComicListResponse.from_json(_comic_list_body(), strict=True)
+
+        logger.info("✅ ComicListResponse strict from_json test completed successfully")
+
+
+class TestComicBatch:
+    """Test cases for ComicBatch class.
+
+    This test class verifies that ComicBatch builds a column-oriented view
+    of comics that keeps every column aligned with the input order.
+    """
+
+    def test_comic_batch_from_comics(self):
+        """Test ComicBatch collects comic fields into aligned columns.
+
+        Expected behavior:
+            - Each column has one entry per comic, in input order
+            - Numeric columns are typed arrays
+            - Columns can be zipped to filter comics by a predicate
+        """
+        logger.info("Testing ComicBatch builds aligned columns")
+
+        first = ComicListResponse.from_json(_comic_list_body()).data.results[0]
+        second = first.model_copy(update={"id": 21367, "page_count": 48, "title": "Avengers #2"})
+        batch = ComicBatch.from_comics([first, second])
+
+        assert len(batch) == 2
+        assert list(batch.ids) == [21366, 21367]
+        assert list(batch.page_counts) == [32, 48]
+        assert batch.titles == ["Avengers (1963) #1", "Avengers #2"]
+        assert batch.issue_numbers.typecode == "d"
+        assert [i for i, pages in zip(batch.ids, batch.page_counts) if pages > 32] == [21367]
+
+        logger.info("✅ ComicBatch from_comics test completed successfully")
+
+    def test_comic_batch_empty(self):
+        """Test ComicBatch handles an empty input.
+
+        Expected behavior:
+            - An empty batch has length zero and empty columns
+        """
+        logger.info("Testing ComicBatch with no comics")
+
+        batch = ComicBatch.from_comics([])
+        assert len(batch) == 0
+        assert batch.titles == []
+
+        logger.info("✅ ComicBatch empty test completed successfully")
+
+
+class TestComicListBody:
+    """Test cases for ComicListBody and the parse_comic helpers.
+
+    This test class verifies that comics can be parsed from an HTTP
+    response without building the response envelope.
+    """
+
+    def test_comic_list_body_skips_envelope(self):
+        """Test ComicListBody parses comics and ignores the envelope.
+
+        Expected behavior:
+            - data is parsed into typed comics
+            - Envelope fields are not stored on the model
+        """
+        logger.info("Testing ComicListBody skips the response envelope")
+
+        response = httpx.Response(200, content=_comic_list_body())
+        body = ComicListBody.from_response(response)
+
+        assert body.data.results[0].title == "Avengers (1963) #1"
+        assert not hasattr(body, "etag")
+
+        logger.info("✅ ComicListBody envelope test completed successfully")
+
+    def test_parse_comic_helpers(self):
+        """Test parse_comic and parse_comic_list return bare comics.
+
+        Expected behavior:
+            - parse_comic_list returns the list of comics
+            - parse_comic returns the first comic, or None without results
+            - Invalid JSON raises ValidationError
+        """
+        logger.info("Testing parse_comic and parse_comic_list")
+
+        response = httpx.Response(200, content=_comic_list_body())
+        comics = parse_comic_list(response)
+        assert [comic.id for comic in comics] == [21366]
+        assert parse_comic(response) == comics[0]
+
+        empty = httpx.Response(
+            200, content=b'{"data": {"offset": 0, "limit": 20, "total": 0, "count": 0, "results": []}}'
+        )
+        assert parse_comic(empty) is None
+
+        with pytest.raises(ValidationError):
+            parse_comic_list(httpx.Response(200, content=b"{not json"))
+
+        logger.info("✅ parse_comic helpers test completed successfully")
+
+
+class TestComicSerialization:
+    """Test cases for Comic JSON serialization helpers.
+
+    This test class verifies that to_bytes and dump_comic_list produce
+    API-shaped JSON that parses back into equal comics.
+    """
+
+    def test_comic_to_bytes_round_trip(self):
+        """Test Comic.to_bytes output parses back into an equal comic.
+
+        Expected behavior:
+            - Output uses the API's camelCase field names
+            - Parsing the output yields an equal Comic
+        """
+        logger.info("Testing Comic.to_bytes round trip")
+
+        comic = ComicListResponse.from_json(_comic_list_body()).data.results[0]
+        data = comic.to_bytes()
+
+        assert b'"pageCount":32' in data
+        assert Comic.model_validate_json(data) == comic
+
+        logger.info("✅ Comic to_bytes round trip test completed successfully")
+
+    def test_dump_comic_list(self):
+        """Test dump_comic_list serializes comics as a JSON array.
+
+        Expected behavior:
+            - Each comic is serialized in order
+            - The output matches the per-comic serialization
+        """
+        logger.info("Testing dump_comic_list")
+
+        comics = ComicListResponse.from_json(_comic_list_body()).data.results
+        data = dump_comic_list(comics)
+
+        assert [item["id"] for item in json.loads(data)] == [21366]
+        assert data == b"[" + comics[0].to_bytes() + b"]"
+
+        logger.info("✅ dump_comic_list test completed successfully")
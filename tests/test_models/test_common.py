@@ -27,6 +27,7 @@ from marvelpy.models.common import (
     Price,
     SeriesSummary,
     StorySummary,
+    SummaryList,
     TextObject,
 )
 
@@ -91,6 +92,8 @@ class TestImage:
             - Path and extension can be combined to form full URL
             - Full URL construction works correctly
             - Image data is suitable for URL generation
+            - The url property returns the full URL
+            - A copy with a new extension gets a matching URL
         """
         logger.info("Testing image full URL construction")
         image: Image = Image(
@@ -101,6 +104,8 @@ class TestImage:
         expected_url = "http://i.annihil.us/u/prod/marvel/i/mg/9/c0/527bb7b37ff55.jpg"
 
         assert full_url == expected_url
+        assert image.url == expected_url
+        assert image.model_copy(update={"extension": "png"}).url == expected_url[:-3] + "png"
         logger.info("✅ Image full URL construction test completed successfully")
 
 
@@ -175,6 +180,25 @@ class TestURL:
             assert url.url == base_url
         logger.info("✅ URL different types test completed successfully")
 
+    def test_url_type_is_interned(self):
+        """Test URL types parsed from separate payloads share one string.
+
+        Expected behavior:
+            - Equal type values from separate URLs are the same object
+            - TextObject languages are interned the same way
+        """
+        logger.info("Testing URL type interning")
+        first = URL.model_validate_json('{"type": "comiclink", "url": "http://marvel.com/a"}')
+        second = URL.model_validate_json('{"type": "comiclink", "url": "http://marvel.com/b"}')
+        assert first.type is second.type
+
+        english = [
+            TextObject(type="issue_solicit_text", language="".join(["en", "-us"]), text=text)
+            for text in ("a", "b")
+        ]
+        assert english[0].language is english[1].language
+        logger.info("✅ URL type interning test completed successfully")
+
 
 class TestTextObject:
     """Test cases for TextObject class.
@@ -428,6 +452,33 @@ class TestSummaryModels:
         assert creator.role == "writer"
         logger.info("✅ Creator summary creation test completed successfully")
 
+    def test_creator_summary_keeps_extra_fields(self):
+        """Test CreatorSummary opts back in to keeping extra fields.
+
+        Most models drop fields they don't declare, but CreatorSummary
+        keeps them because its payload varies between endpoints.
+
+        Expected behavior:
+            - Extra fields on CreatorSummary are stored and accessible
+            - Extra fields on other summaries are ignored
+        """
+        logger.info("Testing CreatorSummary keeps extra fields")
+        creator = CreatorSummary(
+            resourceURI="http://gateway.marvel.com/v1/public/creators/30",
+            name="Stan Lee",
+            role="writer",
+            rank=1,
+        )
+        character = CharacterSummary(
+            resourceURI="http://gateway.marvel.com/v1/public/characters/1009368",
+            name="Iron Man",
+            rank=1,
+        )
+
+        assert creator.rank == 1
+        assert not hasattr(character, "rank")
+        logger.info("✅ Creator summary extra fields test completed successfully")
+
     def test_character_summary_creation(self):
         """Test CharacterSummary can be created with required fields.
 
@@ -575,3 +626,78 @@ class TestSummaryModels:
         with pytest.raises(ValidationError):
             ComicSummary(name="Avengers (1963) #1")  # Missing resourceURI
         logger.info("✅ Summary models missing required fields test completed successfully")
+
+
+class TestSummaryList:
+    """Test cases for SummaryList class.
+
+    This test class verifies the functionality of the generic SummaryList
+    class, which represents the related-resource collections embedded in
+    Marvel API resources.
+    """
+
+    def test_summary_list_validates_item_type(self):
+        """Test SummaryList validates items against its type parameter.
+
+        Expected behavior:
+            - Raw item dictionaries are validated into the parametrized type
+            - Items that do not match the summary type are rejected
+        """
+        logger.info("Testing SummaryList validates items against its type parameter")
+
+        story_list = SummaryList[StorySummary](
+            available=1,
+            returned=1,
+            collectionURI="http://gateway.marvel.com/v1/public/characters/1009368/stories",
+            items=[{"resourceURI": "...", "name": "Cover #1", "type": "cover"}],
+        )
+
+        assert isinstance(story_list.items[0], StorySummary)
+        assert story_list.items[0].type == "cover"
+        with pytest.raises(ValidationError):
+            SummaryList[StorySummary](
+                available=1, returned=1, collectionURI="...", items=[{"name": "Cover #1"}]
+            )
+
+        logger.info("✅ SummaryList item validation test completed successfully")
+
+    def test_summary_list_parametrizations_are_shared(self):
+        """Test the same parametrization is reused across resource modules.
+
+        Expected behavior:
+            - Parametrizing SummaryList twice returns the same class
+            - Resource modules alias the shared parametrization
+        """
+        logger.info("Testing SummaryList parametrizations are shared")
+
+        from marvelpy.models.character import ComicList
+
+        assert SummaryList[ComicSummary] is SummaryList[ComicSummary]
+        assert ComicList is SummaryList[ComicSummary]
+
+        logger.info("✅ SummaryList parametrization sharing test completed successfully")
+
+    def test_summary_list_items_are_pooled(self):
+        """Test equal summaries in different collections share one instance.
+
+        Expected behavior:
+            - Equal summaries validated into separate lists are the same object
+            - Summaries of different types are never shared
+        """
+        logger.info("Testing SummaryList pools equal summaries")
+
+        item = {"resourceURI": "http://gateway.marvel.com/v1/public/comics/21366", "name": "Avengers #1"}
+        first = SummaryList[ComicSummary].model_validate(
+            {"available": 1, "returned": 1, "collectionURI": "...", "items": [dict(item)]}
+        )
+        second = SummaryList[ComicSummary].model_validate(
+            {"available": 1, "returned": 1, "collectionURI": "...", "items": [dict(item)]}
+        )
+        series = SummaryList[SeriesSummary].model_validate(
+            {"available": 1, "returned": 1, "collectionURI": "...", "items": [dict(item)]}
+        )
+
+        assert first.items[0] is second.items[0]
+        assert isinstance(series.items[0], SeriesSummary)
+
+        logger.info("✅ SummaryList pooling test completed successfully")
@@ -6,6 +6,7 @@ creation, validation, field access, and error handling scenarios.
 """
 
 import logging
+import httpx
 import pytest
 from pydantic import ValidationError
 
@@ -16,6 +17,7 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+from marvelpy.models import comic as comic_models  # noqa: E402
 from marvelpy.models.common import (
     URL,
     CharacterSummary,
@@ -24,11 +26,13 @@ from marvelpy.models.common import (
     Image,
     SeriesSummary,
     StorySummary,
+    SummaryList,
 )
 from marvelpy.models.creator import (
     CharacterList,
     ComicList,
     Creator,
+    CreatorBatch,
     CreatorListResponse,
     CreatorResponse,
     EventList,
@@ -71,6 +75,20 @@ class TestCharacterList:
         
         logger.info("✅ CharacterList creation test completed successfully")
 
+    def test_character_list_is_generic_summary_list(self):
+        """Test creator related-resource lists are SummaryList specializations.
+
+        Expected behavior:
+            - CharacterList is SummaryList[CharacterSummary]
+            - Creator and comic models share the same CharacterList class
+        """
+        logger.info("Testing creator lists are SummaryList specializations")
+
+        assert CharacterList is SummaryList[CharacterSummary]
+        assert CharacterList is comic_models.CharacterList
+
+        logger.info("✅ Creator SummaryList specialization test completed successfully")
+
     def test_character_list_empty_items(self):
         """Test creating a CharacterList with empty items list."""
         logger.info("Testing CharacterList creation with empty items list")
@@ -364,7 +382,7 @@ class TestCreator:
         assert creator.resource_uri == "http://gateway.marvel.com/v1/public/creators/30"
         assert creator.modified == "2013-11-20T17:40:18-0500"
         assert creator.thumbnail is None
-        assert len(creator.urls) == 0
+        assert creator.urls == ()
         
         logger.info("✅ Creator creation minimal test completed successfully")
 
@@ -482,6 +500,200 @@ class TestCreator:
         
         logger.info("✅ Creator with middle name and suffix test completed successfully")
 
+    def test_creator_is_frozen(self):
+        """Test Creator instances are immutable once parsed.
+
+        Expected behavior:
+            - Assigning to a field raises ValidationError
+            - The original value is unchanged
+        """
+        logger.info("Testing Creator instances are immutable")
+
+        empty_list = {"available": 0, "returned": 0, "collectionURI": "...", "items": []}
+        payload = {
+            "id": 30,
+            "firstName": "Stan",
+            "middleName": "",
+            "lastName": "Lee",
+            "suffix": "",
+            "fullName": "Stan Lee",
+            "modified": "2013-11-20T17:40:18-0500",
+            "resourceURI": "http://gateway.marvel.com/v1/public/creators/30",
+            "comics": empty_list,
+            "series": empty_list,
+            "stories": empty_list,
+            "events": empty_list,
+        }
+        creator = Creator.model_validate(payload)
+
+        with pytest.raises(ValidationError):
+            creator.last_name = "Lieber"
+        assert creator.last_name == "Lee"
+
+        logger.info("✅ Creator frozen test completed successfully")
+
+    def test_creator_is_hashable(self):
+        """Test equal Creator instances hash equal, even before lazy lists load.
+
+        Expected behavior:
+            - urls is stored as a tuple
+            - Two Creators parsed from the same payload hash and compare equal
+            - Equal instances collapse to one entry in a set
+        """
+        logger.info("Testing Creator instances are hashable")
+
+        empty_list = {"available": 0, "returned": 0, "collectionURI": "...", "items": []}
+        payload = {
+            "id": 30,
+            "firstName": "Stan",
+            "middleName": "",
+            "lastName": "Lee",
+            "suffix": "",
+            "fullName": "Stan Lee",
+            "modified": "2013-11-20T17:40:18-0500",
+            "resourceURI": "http://gateway.marvel.com/v1/public/creators/30",
+            "urls": [{"type": "detail", "url": "http://marvel.com/comics/creators/30/stan_lee"}],
+            "comics": empty_list,
+            "series": empty_list,
+            "stories": empty_list,
+            "events": empty_list,
+        }
+        first = Creator.model_validate(payload)
+        second = Creator.model_validate(payload)
+
+        assert isinstance(first.urls, tuple)
+        assert hash(first) == hash(second)
+        assert first == second
+        assert len({first, second}) == 1
+
+        logger.info("✅ Creator hashable test completed successfully")
+
+    def test_creator_related_lists_are_lazy(self):
+        """Test Creator defers validation of its related-resource lists.
+
+        Expected behavior:
+            - Related lists are stored raw after validation
+            - Reading a related list returns the validated list model
+            - A missing optional characters list reads as None
+        """
+        logger.info("Testing Creator defers validation of related lists")
+
+        comics = {
+            "available": 1,
+            "returned": 1,
+            "collectionURI": "http://gateway.marvel.com/v1/public/creators/30/comics",
+            "items": [{"resourceURI": "...", "name": "Amazing Spider-Man #1"}],
+        }
+        empty_list = {"available": 0, "returned": 0, "collectionURI": "...", "items": []}
+        creator = Creator.model_validate(
+            {
+                "id": 30,
+                "firstName": "Stan",
+                "middleName": "",
+                "lastName": "Lee",
+                "suffix": "",
+                "fullName": "Stan Lee",
+                "modified": "2013-11-20T17:40:18-0500",
+                "resourceURI": "http://gateway.marvel.com/v1/public/creators/30",
+                "comics": comics,
+                "series": empty_list,
+                "stories": empty_list,
+                "events": empty_list,
+            }
+        )
+
+        assert creator.__dict__["comics"] == comics
+        assert isinstance(creator.comics, ComicList)
+        assert creator.comics.items[0].name == "Amazing Spider-Man #1"
+        assert isinstance(creator.__dict__["stories"], dict)
+        assert creator.characters is None
+
+        logger.info("✅ Creator lazy related lists test completed successfully")
+
+    def test_creator_full_name_falls_back_to_name_parts(self):
+        """Test Creator keeps the API's fullName and builds one when it is missing.
+
+        Expected behavior:
+            - A fullName in the input is kept, even if it differs from the parts
+            - Without a fullName, the non-empty name parts are joined
+            - full_name is serialized as fullName
+        """
+        logger.info("Testing Creator full_name fallback")
+
+        empty_list = {"available": 0, "returned": 0, "collectionURI": "...", "items": []}
+        payload = {
+            "id": 30,
+            "firstName": "Stanley",
+            "middleName": "",
+            "lastName": "Lieber",
+            "suffix": "",
+            "fullName": "Stan Lee",
+            "modified": "2013-11-20T17:40:18-0500",
+            "resourceURI": "http://gateway.marvel.com/v1/public/creators/30",
+            "comics": empty_list,
+            "series": empty_list,
+            "stories": empty_list,
+            "events": empty_list,
+        }
+
+        creator = Creator.model_validate(payload)
+        assert creator.full_name == "Stan Lee"
+        assert creator.model_dump(by_alias=True)["fullName"] == "Stan Lee"
+
+        del payload["fullName"]
+        assert Creator.model_validate(payload).full_name == "Stanley Lieber"
+        payload["fullName"] = ""
+        assert Creator.model_validate(payload).full_name == "Stanley Lieber"
+
+        logger.info("✅ Creator full_name fallback test completed successfully")
+
+    def test_creator_repeated_strings_are_interned(self):
+        """Test creators parsed separately share suffix and modified strings.
+
+        Expected behavior:
+            - Equal suffix values are the same object
+            - Equal modified timestamps are the same object
+        """
+        logger.info("Testing Creator string interning")
+
+        def parse(creator_id: int) -> Creator:
+            empty_list = {"available": 0, "returned": 0, "collectionURI": "...", "items": []}
+            # Build the strings at runtime so each call gets a distinct object.
+            return Creator.model_validate(
+                {
+                    "id": creator_id,
+                    "firstName": "A",
+                    "middleName": "",
+                    "lastName": "B",
+                    "suffix": "".join(["Jr", "."]),
+                    "modified": "".join(["2013-11-20", "T17:40:18-0500"]),
+                    "resourceURI": f"http://gateway.marvel.com/v1/public/creators/{creator_id}",
+                    "comics": empty_list,
+                    "series": empty_list,
+                    "stories": empty_list,
+                    "events": empty_list,
+                }
+            )
+
+        first, second = parse(1), parse(2)
+        assert first.suffix is second.suffix
+        assert first.modified is second.modified
+
+        logger.info("✅ Creator string interning test completed successfully")
+
+    def test_creator_schema_is_complete_at_import(self):
+        """Test Creator needs no forward-reference resolution on first use.
+
+        Expected behavior:
+            - Creator and CreatorListResponse are fully built when the module is imported
+        """
+        logger.info("Testing Creator schema is complete at import")
+
+        assert Creator.__pydantic_complete__
+        assert CreatorListResponse.__pydantic_complete__
+
+        logger.info("✅ Creator schema completeness test completed successfully")
+
     def test_creator_missing_required_fields(self):
         """Test that Creator requires all mandatory fields."""
         logger.info("Testing Creator requires all mandatory fields")
@@ -642,6 +854,69 @@ class TestCreatorListResponse:
         logger.info("✅ CreatorListResponse empty results test completed successfully")
 
 
+    def test_creator_list_response_from_json(self):
+        """Test CreatorListResponse parses raw response bytes.
+
+        Expected behavior:
+            - Valid bytes parse into a CreatorListResponse
+            - Subclasses parse into the subclass
+            - Invalid JSON raises ValidationError
+        """
+        logger.info("Testing CreatorListResponse parses raw response bytes")
+
+        body = (
+            b'{"code": 200, "status": "Ok", "copyright": "\xc2\xa9 2024 MARVEL",'
+            b' "attributionText": "Data provided by Marvel.",'
+            b' "attributionHTML": "<a>Data provided by Marvel.</a>", "etag": "etag123",'
+            b' "data": {"offset": 0, "limit": 20, "total": 0, "count": 0, "results": []}}'
+        )
+        response = CreatorListResponse.from_json(body)
+        assert isinstance(response, CreatorListResponse)
+        assert response.data.results == []
+
+        class _Subclass(CreatorListResponse):
+            pass
+
+        assert type(_Subclass.from_json(body)) is _Subclass
+
+        with pytest.raises(ValidationError):
+            CreatorListResponse.from_json(b"{not json")
+
+        logger.info("✅ CreatorListResponse from_json test completed successfully")
+
+
+    def test_creator_list_response_from_response_bytes(self):
+        """Test CreatorListResponse parses an HTTP response from its raw bytes.
+
+        Expected behavior:
+            - from_response validates the undecoded body into typed creators
+            - trust_source=True builds an equal response without validation
+        """
+        logger.info("Testing CreatorListResponse parses raw response bytes")
+
+        body = (
+            b'{"code": 200, "status": "Ok", "copyright": "\xc2\xa9 2024 MARVEL",'
+            b' "attributionText": "Data provided by Marvel.",'
+            b' "attributionHTML": "<a>Data provided by Marvel.</a>", "etag": "etag123",'
+            b' "data": {"offset": 0, "limit": 20, "total": 1, "count": 1, "results": [{'
+            b'"id": 30, "firstName": "Stan", "middleName": "", "lastName": "Lee", "suffix": "",'
+            b' "fullName": "Stan Lee", "modified": "2013-11-20T17:40:18-0500",'
+            b' "resourceURI": "http://gateway.marvel.com/v1/public/creators/30",'
+            b' "comics": {"available": 0, "returned": 0, "collectionURI": "...", "items": []},'
+            b' "series": {"available": 0, "returned": 0, "collectionURI": "...", "items": []},'
+            b' "stories": {"available": 0, "returned": 0, "collectionURI": "...", "items": []},'
+            b' "events": {"available": 0, "returned": 0, "collectionURI": "...", "items": []}'
+            b"}]}}"
+        )
+
+        response = CreatorListResponse.from_response(httpx.Response(200, content=body))
+        assert isinstance(response.data.results[0], Creator)
+        assert response.data.results[0].full_name == "Stan Lee"
+        assert CreatorListResponse.from_json(body, trust_source=True) == response
+
+        logger.info("✅ CreatorListResponse raw bytes test completed successfully")
+
+
 class TestCreatorResponse:
     """Test cases for CreatorResponse model.
 
@@ -722,3 +997,82 @@ class TestCreatorResponse:
         assert len(errors) >= 5  # Should have errors for missing required fields
         
         logger.info("✅ CreatorResponse missing required fields test completed successfully")
+
+    def test_creator_response_from_json_trust_source(self):
+        """Test CreatorResponse.from_json can skip validation for trusted bodies.
+
+        Expected behavior:
+            - trust_source=True builds the same response as validation
+            - Nested lists and summaries are built as models
+        """
+        logger.info("Testing CreatorResponse.from_json with trust_source")
+
+        body = (
+            b'{"code": 200, "status": "Ok", "copyright": "\xc2\xa9 2024 MARVEL",'
+            b' "attributionText": "Data provided by Marvel.",'
+            b' "attributionHTML": "<a>Data provided by Marvel.</a>", "etag": "etag123",'
+            b' "data": {"id": 30, "firstName": "Stan", "middleName": "", "lastName": "Lee",'
+            b' "suffix": "", "fullName": "Stan Lee", "modified": "2013-11-20T17:40:18-0500",'
+            b' "resourceURI": "http://gateway.marvel.com/v1/public/creators/30", "urls": [],'
+            b' "comics": {"available": 1, "returned": 1, "collectionURI": "...",'
+            b' "items": [{"resourceURI": "...", "name": "Amazing Spider-Man #1"}]},'
+            b' "series": {"available": 0, "returned": 0, "collectionURI": "...", "items": []},'
+            b' "stories": {"available": 0, "returned": 0, "collectionURI": "...", "items": []},'
+            b' "events": {"available": 0, "returned": 0, "collectionURI": "...", "items": []}}}'
+        )
+
+        trusted = CreatorResponse.from_json(body, trust_source=True)
+
+        assert trusted == CreatorResponse.from_json(body)
+        assert isinstance(trusted.data, Creator)
+        assert isinstance(trusted.data.comics.items[0], ComicSummary)
+        assert trusted.data.characters is None
+
+        logger.info("✅ CreatorResponse trust_source test completed successfully")
+
+
+class TestCreatorBatch:
+    """Test cases for CreatorBatch.
+
+    Tests that CreatorBatch builds aligned columns from a list of creators.
+    """
+
+    def test_creator_batch_from_creators(self):
+        """Test CreatorBatch collects creator fields into aligned columns.
+
+        Expected behavior:
+            - Each column has one entry per creator, in input order
+            - IDs are stored in a typed array
+            - An empty input gives an empty batch
+        """
+        logger.info("Testing CreatorBatch builds aligned columns")
+
+        empty_list = {"available": 0, "returned": 0, "collectionURI": "...", "items": []}
+        creators = [
+            Creator.model_validate(
+                {
+                    "id": creator_id,
+                    "firstName": first,
+                    "middleName": "",
+                    "lastName": last,
+                    "suffix": "",
+                    "modified": "2013-11-20T17:40:18-0500",
+                    "resourceURI": f"http://gateway.marvel.com/v1/public/creators/{creator_id}",
+                    "comics": empty_list,
+                    "series": empty_list,
+                    "stories": empty_list,
+                    "events": empty_list,
+                }
+            )
+            for creator_id, first, last in ((30, "Stan", "Lee"), (32, "Steve", "Ditko"))
+        ]
+        batch = CreatorBatch.from_creators(creators)
+
+        assert len(batch) == 2
+        assert list(batch.ids) == [30, 32]
+        assert batch.ids.typecode == "q"
+        assert batch.full_names == ["Stan Lee", "Steve Ditko"]
+        assert batch.thumbnails == [None, None]
+        assert len(CreatorBatch.from_creators([])) == 0
+
+        logger.info("✅ CreatorBatch from_creators test completed successfully")
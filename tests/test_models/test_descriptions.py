@@ -0,0 +1,75 @@
+"""Tests for model field descriptions.
+
+This module contains tests for the JSON schema helper that attaches field
+descriptions to Marvel API models on demand.
+"""
+
+import logging
+
+from marvelpy.models import generate_json_schema
+from marvelpy.models.character import Character, CharacterListResponse
+
+# Configure logging for tests
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+class TestGenerateJsonSchema:
+    """Test cases for generate_json_schema function."""
+
+    def test_descriptions_are_not_stored_on_fields(self):
+        """Test model fields no longer carry descriptions at runtime.
+
+        Expected behavior:
+            - FieldInfo.description is None for described fields
+        """
+        logger.info("Testing model fields do not store descriptions")
+
+        assert Character.model_fields["name"].description is None
+
+        logger.info("✅ Field description storage test completed successfully")
+
+    def test_schema_includes_descriptions(self):
+        """Test generated schema includes descriptions keyed by alias.
+
+        Expected behavior:
+            - Plain fields get their description
+            - Aliased fields are described under the alias
+        """
+        logger.info("Testing generated schema includes descriptions")
+
+        schema = generate_json_schema(Character)
+
+        assert schema["properties"]["name"]["description"] == "Name of the character"
+        assert schema["properties"]["resourceURI"]["description"] == (
+            "URI of the character resource"
+        )
+
+        logger.info("✅ Schema descriptions test completed successfully")
+
+    def test_schema_includes_inherited_and_nested_descriptions(self):
+        """Test descriptions resolve through base classes and nested models.
+
+        Expected behavior:
+            - Fields inherited from BaseListResponse are described
+            - Subclass overrides take precedence over base descriptions
+            - Nested generic models are described in $defs
+        """
+        logger.info("Testing inherited and nested schema descriptions")
+
+        schema = generate_json_schema(CharacterListResponse)
+
+        assert schema["properties"]["code"]["description"] == "HTTP status code"
+        assert schema["properties"]["data"]["description"] == "Character data container"
+        container = next(
+            definition
+            for name, definition in schema["$defs"].items()
+            if name.startswith("DataContainer")
+        )
+        assert container["properties"]["total"]["description"] == (
+            "Total number of results available"
+        )
+
+        logger.info("✅ Inherited schema descriptions test completed successfully")
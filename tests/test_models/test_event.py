@@ -16,6 +16,7 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+from marvelpy.models import comic as comic_models  # noqa: E402
 from marvelpy.models.common import (
     URL,
     CharacterSummary,
@@ -23,12 +24,14 @@ from marvelpy.models.common import (
     CreatorSummary,
     EventSummary,
     Image,
+    SummaryList,
 )
 from marvelpy.models.event import (
     CharacterList,
     ComicList,
     CreatorList,
     Event,
+    EventBatch,
     EventListResponse,
     EventResponse,
     SeriesList,
@@ -70,6 +73,20 @@ class TestCharacterList:
         
         logger.info("✅ CharacterList creation test completed successfully")
 
+    def test_character_list_is_generic_summary_list(self):
+        """Test event related-resource lists are SummaryList specializations.
+
+        Expected behavior:
+            - CharacterList is SummaryList[CharacterSummary]
+            - Event and comic models share the same CharacterList class
+        """
+        logger.info("Testing event lists are SummaryList specializations")
+
+        assert CharacterList is SummaryList[CharacterSummary]
+        assert CharacterList is comic_models.CharacterList
+
+        logger.info("✅ Event SummaryList specialization test completed successfully")
+
     def test_character_list_empty_items(self):
         """Test creating a CharacterList with empty items list."""
         logger.info("Testing CharacterList creation with empty items list")
@@ -364,6 +381,7 @@ class TestEvent:
         assert event.thumbnail is None
         assert event.next is None
         assert event.previous is None
+        assert event.urls == ()
         
         logger.info("✅ Event creation minimal test completed successfully")
 
@@ -441,6 +459,117 @@ class TestEvent:
         
         logger.info("✅ Event creation with optional fields test completed successfully")
 
+    def test_event_is_frozen(self):
+        """Test Event instances are immutable once parsed.
+
+        Expected behavior:
+            - Assigning to a field raises ValidationError
+            - The original value is unchanged
+        """
+        logger.info("Testing Event instances are immutable")
+
+        empty_list = {"available": 0, "returned": 0, "collectionURI": "...", "items": []}
+        payload = {
+            "id": 269,
+            "title": "Secret Invasion",
+            "description": "Skrulls!",
+            "resourceURI": "http://gateway.marvel.com/v1/public/events/269",
+            "modified": "2013-06-28T16:31:24-0400",
+            "comics": empty_list,
+            "stories": empty_list,
+            "series": empty_list,
+            "characters": empty_list,
+            "creators": empty_list,
+        }
+        event = Event.model_validate(payload)
+
+        with pytest.raises(ValidationError):
+            event.title = "Dark Reign"
+        assert event.title == "Secret Invasion"
+
+        logger.info("✅ Event frozen test completed successfully")
+
+    def test_event_is_hashable(self):
+        """Test equal Event instances hash equal, even before lazy lists load.
+
+        Expected behavior:
+            - urls is stored as a tuple
+            - Two Events parsed from the same payload hash and compare equal
+            - Equal instances collapse to one entry in a set
+        """
+        logger.info("Testing Event instances are hashable")
+
+        empty_list = {"available": 0, "returned": 0, "collectionURI": "...", "items": []}
+        payload = {
+            "id": 269,
+            "title": "Secret Invasion",
+            "description": "Skrulls!",
+            "resourceURI": "http://gateway.marvel.com/v1/public/events/269",
+            "modified": "2013-06-28T16:31:24-0400",
+            "urls": [{"type": "detail", "url": "http://marvel.com/comics/events/269/secret_invasion"}],
+            "comics": empty_list,
+            "stories": empty_list,
+            "series": empty_list,
+            "characters": empty_list,
+            "creators": empty_list,
+        }
+        first = Event.model_validate(payload)
+        second = Event.model_validate(payload)
+
+        assert isinstance(first.urls, tuple)
+        assert hash(first) == hash(second)
+        assert first == second
+        assert len({first, second}) == 1
+
+        logger.info("✅ Event hashable test completed successfully")
+
+    def test_event_related_lists_are_lazy(self):
+        """Test Event defers validation of its related-resource lists.
+
+        Expected behavior:
+            - Related lists are stored raw after validation
+            - Reading a related list returns the validated list model
+            - Invalid lists raise ValidationError when first read
+        """
+        logger.info("Testing Event defers validation of related lists")
+
+        empty_list = {"available": 0, "returned": 0, "collectionURI": "...", "items": []}
+        event = Event.model_validate(
+            {
+                "id": 269,
+                "title": "Secret Invasion",
+                "description": "Skrulls!",
+                "resourceURI": "http://gateway.marvel.com/v1/public/events/269",
+                "modified": "2013-06-28T16:31:24-0400",
+                "comics": empty_list,
+                "stories": empty_list,
+                "series": empty_list,
+                "characters": empty_list,
+                "creators": {"available": "many"},
+            }
+        )
+
+        assert isinstance(event.__dict__["comics"], dict)
+        assert isinstance(event.comics, ComicList)
+        assert event.comics.available == 0
+        with pytest.raises(ValidationError):
+            event.creators  # noqa: B018
+
+        logger.info("✅ Event lazy related lists test completed successfully")
+
+    def test_event_schema_is_complete_at_import(self):
+        """Test Event needs no forward-reference resolution on first use.
+
+        Expected behavior:
+            - Event and EventListResponse are fully built when the module is imported
+        """
+        logger.info("Testing Event schema is complete at import")
+
+        assert Event.__pydantic_complete__
+        assert EventListResponse.__pydantic_complete__
+
+        logger.info("✅ Event schema completeness test completed successfully")
+
     def test_event_missing_required_fields(self):
         """Test that Event requires all mandatory fields."""
         logger.info("Testing Event requires all mandatory fields")
@@ -599,6 +728,37 @@ class TestEventListResponse:
         logger.info("✅ EventListResponse empty results test completed successfully")
 
 
+    def test_event_list_response_from_json(self):
+        """Test EventListResponse parses raw response bytes.
+
+        Expected behavior:
+            - Valid bytes parse into an EventListResponse
+            - Subclasses parse into the subclass
+            - Invalid JSON raises ValidationError
+        """
+        logger.info("Testing EventListResponse parses raw response bytes")
+
+        body = (
+            b'{"code": 200, "status": "Ok", "copyright": "\xc2\xa9 2024 MARVEL",'
+            b' "attributionText": "Data provided by Marvel.",'
+            b' "attributionHTML": "<a>Data provided by Marvel.</a>", "etag": "etag123",'
+            b' "data": {"offset": 0, "limit": 20, "total": 0, "count": 0, "results": []}}'
+        )
+        response = EventListResponse.from_json(body)
+        assert isinstance(response, EventListResponse)
+        assert response.data.results == []
+
+        class _Subclass(EventListResponse):
+            pass
+
+        assert type(_Subclass.from_json(body)) is _Subclass
+
+        with pytest.raises(ValidationError):
+            EventListResponse.from_json(b"{not json")
+
+        logger.info("✅ EventListResponse from_json test completed successfully")
+
+
 class TestEventResponse:
     """Test cases for EventResponse model.
 
@@ -678,3 +838,83 @@ class TestEventResponse:
         assert len(errors) >= 5  # Should have errors for missing required fields
         
         logger.info("✅ EventResponse missing required fields test completed successfully")
+
+    def test_event_response_from_json_trust_source(self):
+        """Test EventResponse.from_json can skip validation for trusted bodies.
+
+        Expected behavior:
+            - trust_source=True builds the same response as validation
+            - Nested lists and optional summaries are built as models
+        """
+        logger.info("Testing EventResponse.from_json with trust_source")
+
+        empty_list = b'{"available": 0, "returned": 0, "collectionURI": "...", "items": []}'
+        body = (
+            b'{"code": 200, "status": "Ok", "copyright": "\xc2\xa9 2024 MARVEL",'
+            b' "attributionText": "Data provided by Marvel.",'
+            b' "attributionHTML": "<a>Data provided by Marvel.</a>", "etag": "etag123",'
+            b' "data": {"id": 269, "title": "Secret Invasion", "description": "Skrulls!",'
+            b' "resourceURI": "http://gateway.marvel.com/v1/public/events/269", "urls": [],'
+            b' "modified": "2013-06-28T16:31:24-0400",'
+            b' "next": {"resourceURI": "...", "name": "Dark Reign"},'
+            b' "comics": ' + empty_list + b', "stories": ' + empty_list + b','
+            b' "series": ' + empty_list + b', "characters": ' + empty_list + b','
+            b' "creators": ' + empty_list + b"}}"
+        )
+
+        trusted = EventResponse.from_json(body, trust_source=True)
+
+        assert trusted == EventResponse.from_json(body)
+        assert isinstance(trusted.data, Event)
+        assert isinstance(trusted.data.next, EventSummary)
+        assert trusted.data.previous is None
+
+        logger.info("✅ EventResponse trust_source test completed successfully")
+
+
+class TestEventBatch:
+    """Test cases for EventBatch.
+
+    Tests that EventBatch builds aligned columns from a list of events.
+    """
+
+    def test_event_batch_from_events(self):
+        """Test EventBatch collects event fields into aligned columns.
+
+        Expected behavior:
+            - Each column has one entry per event, in input order
+            - Missing start and end dates are kept as None
+        """
+        logger.info("Testing EventBatch builds aligned columns")
+
+        empty_list = {"available": 0, "returned": 0, "collectionURI": "...", "items": []}
+        events = [
+            Event.model_validate(
+                {
+                    "id": event_id,
+                    "title": title,
+                    "description": "",
+                    "resourceURI": f"http://gateway.marvel.com/v1/public/events/{event_id}",
+                    "modified": "2013-06-28T16:31:24-0400",
+                    "start": start,
+                    "comics": empty_list,
+                    "stories": empty_list,
+                    "series": empty_list,
+                    "characters": empty_list,
+                    "creators": empty_list,
+                }
+            )
+            for event_id, title, start in (
+                (269, "Secret Invasion", "2008-04-01 00:00:00"),
+                (318, "Dark Reign", None),
+            )
+        ]
+        batch = EventBatch.from_events(events)
+
+        assert len(batch) == 2
+        assert list(batch.ids) == [269, 318]
+        assert batch.titles == ["Secret Invasion", "Dark Reign"]
+        assert batch.starts == ["2008-04-01 00:00:00", None]
+        assert batch.ends == [None, None]
+
+        logger.info("✅ EventBatch from_events test completed successfully")
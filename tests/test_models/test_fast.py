@@ -0,0 +1,275 @@
+"""Tests for the msgspec comic model mirrors.
+
+This module contains tests for the optional msgspec-based decoding path
+in marvelpy.models.fast. The tests are skipped when msgspec is not
+installed.
+"""
+
+import logging
+
+import pytest
+
+msgspec = pytest.importorskip("msgspec")
+
+from marvelpy.models import fast  # noqa: E402
+from marvelpy.models.comic import ComicListResponse  # noqa: E402
+from marvelpy.models.creator import CreatorListResponse  # noqa: E402
+from marvelpy.models.event import EventListResponse  # noqa: E402
+from marvelpy.models.series import SeriesListResponse  # noqa: E402
+from marvelpy.models.story import StoryListResponse  # noqa: E402
+
+# Configure logging for tests
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+COMIC_LIST_BODY = (
+    b'{"code": 200, "status": "Ok", "copyright": "\xc2\xa9 2024 MARVEL",'
+    b' "attributionText": "Data provided by Marvel.",'
+    b' "attributionHTML": "<a>Data provided by Marvel.</a>", "etag": "etag123",'
+    b' "data": {"offset": 0, "limit": 20, "total": 1, "count": 1, "results": [{'
+    b'"id": 21366, "digitalId": 0, "title": "Avengers (1963) #1", "issueNumber": 1,'
+    b' "modified": "2014-04-29T14:18:17-0400", "isbn": "", "upc": "",'
+    b' "diamondCode": "", "ean": "", "issn": "", "format": "Comic", "pageCount": 32,'
+    b' "textObjects": [{"type": "issue_solicit_text", "language": "en-us", "text": "Born!"}],'
+    b' "resourceURI": "http://gateway.marvel.com/v1/public/comics/21366",'
+    b' "series": {"resourceURI": "http://gateway.marvel.com/v1/public/series/1991",'
+    b' "name": "Avengers (1963 - 1996)"},'
+    b' "collectedIssues": [],'
+    b' "prices": [{"type": "printPrice", "price": 0.12}],'
+    b' "thumbnail": {"path": "http://i.annihil.us/u/prod/marvel/i/mg/9/c0/527bb7b37ff55",'
+    b' "extension": "jpg"},'
+    b' "creators": {"available": 1, "returned": 1, "collectionURI": "...",'
+    b' "items": [{"resourceURI": "...", "name": "Stan Lee", "role": "writer"}]},'
+    b' "characters": {"available": 0, "returned": 0, "collectionURI": "...", "items": []},'
+    b' "stories": {"available": 0, "returned": 0, "collectionURI": "...", "items": []},'
+    b' "events": {"available": 0, "returned": 0, "collectionURI": "...", "items": []},'
+    b' "unknownField": true'
+    b"}]}}"
+)
+
+
+_ENVELOPE = (
+    b'{"code": 200, "status": "Ok", "copyright": "\xc2\xa9 2024 MARVEL",'
+    b' "attributionText": "Data provided by Marvel.",'
+    b' "attributionHTML": "<a>Data provided by Marvel.</a>", "etag": "etag123",'
+    b' "data": {"offset": 0, "limit": 20, "total": 1, "count": 1, "results": ['
+)
+_EMPTY_LIST = b'{"available": 0, "returned": 0, "collectionURI": "...", "items": []}'
+
+CREATOR_LIST_BODY = (
+    _ENVELOPE
+    + b'{"id": 30, "firstName": "Stan", "middleName": "", "lastName": "Lee", "suffix": "",'
+    b' "fullName": "Stan Lee", "modified": "2013-11-20T17:40:18-0500",'
+    b' "resourceURI": "http://gateway.marvel.com/v1/public/creators/30",'
+    b' "comics": {"available": 1, "returned": 1, "collectionURI": "...",'
+    b' "items": [{"resourceURI": "...", "name": "Amazing Spider-Man #1"}]},'
+    b' "series": ' + _EMPTY_LIST + b', "stories": ' + _EMPTY_LIST + b","
+    b' "events": ' + _EMPTY_LIST + b"}]}}"
+)
+
+EVENT_LIST_BODY = (
+    _ENVELOPE + b'{"id": 269, "title": "Secret Invasion", "description": "Skrulls!",'
+    b' "resourceURI": "http://gateway.marvel.com/v1/public/events/269",'
+    b' "modified": "2013-06-28T16:31:24-0400", "start": "2008-04-01 00:00:00",'
+    b' "next": {"resourceURI": "...", "name": "Dark Reign"},'
+    b' "comics": ' + _EMPTY_LIST + b', "stories": ' + _EMPTY_LIST + b","
+    b' "series": ' + _EMPTY_LIST + b', "characters": ' + _EMPTY_LIST + b","
+    b' "creators": ' + _EMPTY_LIST + b"}]}}"
+)
+
+SERIES_LIST_BODY = (
+    _ENVELOPE + b'{"id": 1991, "title": "Avengers (1998 - 2004)", "description": null,'
+    b' "resourceURI": "http://gateway.marvel.com/v1/public/series/1991",'
+    b' "startYear": 1998, "endYear": 2004, "rating": "", "modified": "2013-11-20T17:40:18-0500",'
+    b' "comics": ' + _EMPTY_LIST + b', "stories": ' + _EMPTY_LIST + b","
+    b' "events": ' + _EMPTY_LIST + b', "characters": ' + _EMPTY_LIST + b","
+    b' "creators": ' + _EMPTY_LIST + b","
+    b' "next": {"resourceURI": "...", "name": "Avengers (2004 - 2005)"}, "previous": null}]}}'
+)
+
+STORY_LIST_BODY = (
+    _ENVELOPE + b'{"id": 12345, "title": "Cover #1", "description": "",'
+    b' "resourceURI": "http://gateway.marvel.com/v1/public/stories/12345", "type": "cover",'
+    b' "modified": "2013-11-20T17:40:18-0500", "thumbnail": null,'
+    b' "comics": ' + _EMPTY_LIST + b', "series": ' + _EMPTY_LIST + b","
+    b' "events": ' + _EMPTY_LIST + b', "characters": ' + _EMPTY_LIST + b","
+    b' "creators": ' + _EMPTY_LIST + b","
+    b' "originalIssue": {"resourceURI": "...", "name": "Avengers (1963) #1"}}]}}'
+)
+
+
+class TestDecodeComicList:
+    """Test cases for decode_comic_list.
+
+    This test class verifies that the msgspec mirrors decode the same
+    payloads as the pydantic models and expose the same field values.
+    """
+
+    def test_decode_comic_list_matches_pydantic(self):
+        """Test msgspec decoding yields the same values as the pydantic models.
+
+        Expected behavior:
+            - API aliases are mapped onto the Python field names
+            - Nested summaries, prices and images are decoded
+            - Unknown fields are ignored
+        """
+        logger.info("Testing decode_comic_list matches pydantic parsing")
+
+        fast_comic = fast.decode_comic_list(COMIC_LIST_BODY).data.results[0]
+        model_comic = ComicListResponse.from_json(COMIC_LIST_BODY).data.results[0]
+
+        assert fast_comic.id == model_comic.id
+        assert fast_comic.issue_number == model_comic.issue_number
+        assert fast_comic.resource_uri == model_comic.resource_uri
+        assert fast_comic.series.name == model_comic.series.name
+        assert fast_comic.prices[0].price == model_comic.prices[0].price
+        assert fast_comic.thumbnail.extension == model_comic.thumbnail.extension
+        assert fast_comic.creators.items[0].role == "writer"
+        assert fast_comic.text_objects[0].language == "en-us"
+
+        logger.info("✅ decode_comic_list parity test completed successfully")
+
+    def test_decode_comic_list_rejects_invalid_payloads(self):
+        """Test decode_comic_list raises msgspec errors for bad input.
+
+        Expected behavior:
+            - Invalid JSON raises msgspec.DecodeError
+            - A payload missing required fields raises msgspec.ValidationError
+        """
+        logger.info("Testing decode_comic_list rejects invalid payloads")
+
+        with pytest.raises(msgspec.DecodeError):
+            fast.decode_comic_list(b"{not json")
+        with pytest.raises(msgspec.ValidationError):
+            fast.decode_comic_list(b'{"code": 200, "status": "Ok"}')
+
+        logger.info("✅ decode_comic_list invalid payload test completed successfully")
+
+    def test_fast_models_are_frozen(self):
+        """Test the msgspec mirrors are immutable.
+
+        Expected behavior:
+            - Assigning to a decoded struct's field raises AttributeError
+        """
+        logger.info("Testing msgspec mirrors are frozen")
+
+        comic = fast.decode_comic_list(COMIC_LIST_BODY).data.results[0]
+        with pytest.raises(AttributeError):
+            comic.title = "Changed"
+
+        logger.info("✅ msgspec mirrors frozen test completed successfully")
+
+
+class TestDecodeCreatorAndEventLists:
+    """Test cases for decode_creator_list and decode_event_list.
+
+    This test class verifies that the creator and event mirrors decode the
+    same payloads as the pydantic models.
+    """
+
+    def test_decode_creator_list_matches_pydantic(self):
+        """Test msgspec creator decoding yields the same values as pydantic.
+
+        Expected behavior:
+            - Renamed fields such as firstName and fullName are mapped
+            - The optional characters list defaults to None
+        """
+        logger.info("Testing decode_creator_list matches pydantic parsing")
+
+        fast_creator = fast.decode_creator_list(CREATOR_LIST_BODY).data.results[0]
+        model_creator = CreatorListResponse.from_json(CREATOR_LIST_BODY).data.results[0]
+
+        assert fast_creator.full_name == model_creator.full_name
+        assert fast_creator.first_name == model_creator.first_name
+        assert fast_creator.comics.items[0].name == model_creator.comics.items[0].name
+        assert fast_creator.characters is None
+
+        logger.info("✅ decode_creator_list parity test completed successfully")
+
+    def test_decode_creator_list_derives_missing_full_name(self):
+        """Test msgspec creators without fullName match the pydantic fallback.
+
+        Expected behavior:
+            - A creator without fullName decodes instead of failing validation
+            - full_name is built from the name parts, as in pydantic
+        """
+        logger.info("Testing decode_creator_list derives a missing fullName")
+
+        body = CREATOR_LIST_BODY.replace(b' "fullName": "Stan Lee",', b"")
+        assert b"fullName" not in body
+
+        fast_creator = fast.decode_creator_list(body).data.results[0]
+        model_creator = CreatorListResponse.from_json(body).data.results[0]
+
+        assert fast_creator.full_name == model_creator.full_name == "Stan Lee"
+
+        logger.info("✅ decode_creator_list fullName fallback test completed successfully")
+
+    def test_decode_event_list_matches_pydantic(self):
+        """Test msgspec event decoding yields the same values as pydantic.
+
+        Expected behavior:
+            - Optional dates and neighbouring events are decoded
+            - Missing optional fields default to None
+        """
+        logger.info("Testing decode_event_list matches pydantic parsing")
+
+        fast_event = fast.decode_event_list(EVENT_LIST_BODY).data.results[0]
+        model_event = EventListResponse.from_json(EVENT_LIST_BODY).data.results[0]
+
+        assert fast_event.title == model_event.title
+        assert fast_event.start == model_event.start
+        assert fast_event.next.name == model_event.next.name
+        assert fast_event.previous is None
+        assert fast_event.end is None
+
+        logger.info("✅ decode_event_list parity test completed successfully")
+
+
+class TestDecodeSeriesAndStoryLists:
+    """Test cases for decode_series_list and decode_story_list.
+
+    This test class verifies that the series and story mirrors decode the
+    same payloads as the pydantic models.
+    """
+
+    def test_decode_series_list_matches_pydantic(self):
+        """Test msgspec series decoding yields the same values as pydantic.
+
+        Expected behavior:
+            - Scalar fields and neighbouring series match the pydantic models
+            - startYear and endYear are read from the API's field names
+        """
+        logger.info("Testing decode_series_list matches pydantic parsing")
+
+        fast_series = fast.decode_series_list(SERIES_LIST_BODY).data.results[0]
+        model_series = SeriesListResponse.from_json(SERIES_LIST_BODY).data.results[0]
+
+        assert fast_series.title == model_series.title
+        assert fast_series.description is None
+        assert fast_series.next.name == model_series.next.name
+        assert fast_series.start_year == 1998
+        assert fast_series.end_year == 2004
+
+        logger.info("✅ decode_series_list parity test completed successfully")
+
+    def test_decode_story_list_matches_pydantic(self):
+        """Test msgspec story decoding yields the same values as pydantic.
+
+        Expected behavior:
+            - Scalar fields match the pydantic models
+            - The original issue is decoded into a comic summary
+        """
+        logger.info("Testing decode_story_list matches pydantic parsing")
+
+        fast_story = fast.decode_story_list(STORY_LIST_BODY).data.results[0]
+        model_story = StoryListResponse.from_json(STORY_LIST_BODY).data.results[0]
+
+        assert fast_story.title == model_story.title
+        assert fast_story.type == model_story.type
+        assert fast_story.thumbnail is None
+        assert fast_story.original_issue.name == "Avengers (1963) #1"
+
+        logger.info("✅ decode_story_list parity test completed successfully")
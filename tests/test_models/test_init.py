@@ -0,0 +1,69 @@
+"""Tests for the marvelpy.models package exports.
+
+This module contains tests for the table-driven, lazily resolved exports
+of the models package.
+"""
+
+import logging
+import re
+
+import pytest
+
+import marvelpy.models as models
+from marvelpy.models import comic, creator
+
+# Configure logging for tests
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+class TestModelExports:
+    """Test cases for the models package exports.
+
+    This test class verifies that every name in ``__all__`` resolves to the
+    object defined in its module, including renamed related-resource lists.
+    """
+
+    def test_all_exports_resolve(self):
+        """Test every name in __all__ can be imported from the package.
+
+        Expected behavior:
+            - Each exported name resolves to a non-None object
+            - Exported names appear in dir() of the package
+        """
+        logger.info("Testing all model exports resolve")
+
+        for name in models.__all__:
+            assert getattr(models, name) is not None
+        assert set(models.__all__) <= set(dir(models))
+
+        logger.info("✅ Model exports resolve test completed successfully")
+
+    def test_renamed_exports(self):
+        """Test renamed exports point at the list models of their module.
+
+        Expected behavior:
+            - ComicEventList is comic.EventList
+            - CreatorSeriesList is creator.SeriesList
+        """
+        logger.info("Testing renamed model exports")
+
+        assert models.ComicEventList is comic.EventList
+        assert models.CreatorSeriesList is creator.SeriesList
+
+        logger.info("✅ Renamed model exports test completed successfully")
+
+    def test_unknown_export_raises(self):
+        """Test looking up an unknown name raises AttributeError.
+
+        Expected behavior:
+            - Unknown attributes raise AttributeError naming the module
+        """
+        logger.info("Testing unknown model export raises AttributeError")
+
+        with pytest.raises(AttributeError, match=re.escape("marvelpy.models")):
+            _ = models.NotAModel
+
+        logger.info("✅ Unknown model export test completed successfully")
@@ -6,6 +6,7 @@ creation, validation, field access, and error handling scenarios.
 """
 
 import logging
+import httpx
 import pytest
 from pydantic import ValidationError
 
@@ -16,6 +17,7 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+from marvelpy.models import story as story_models  # noqa: E402
 from marvelpy.models.common import (
     URL,
     CharacterSummary,
@@ -24,6 +26,7 @@ from marvelpy.models.common import (
     EventSummary,
     Image,
     SeriesSummary,
+    SummaryList,
 )
 from marvelpy.models.series import (
     CharacterList,
@@ -34,6 +37,31 @@ from marvelpy.models.series import (
     SeriesListResponse,
     SeriesResponse,
     StoryList,
+    iter_series,
+)
+
+_ENVELOPE = (
+    b'{"code": 200, "status": "Ok", "copyright": "\xc2\xa9 2024 MARVEL",'
+    b' "attributionText": "Data provided by Marvel.",'
+    b' "attributionHTML": "<a>Data provided by Marvel.</a>", "etag": "etag123",'
+    b' "data": {"offset": 0, "limit": 20, "total": 1, "count": 1, "results": ['
+)
+_EMPTY_LIST = b'{"available": 0, "returned": 0, "collectionURI": "...", "items": []}'
+
+SERIES_LIST_BODY = (
+    _ENVELOPE
+    + b'{"id": 1991, "title": "Avengers (1998 - 2004)", "description": null,'
+    b' "resourceURI": "http://gateway.marvel.com/v1/public/series/1991",'
+    b' "urls": [{"type": "detail", "url": "http://marvel.com/comics/series/1991"}],'
+    b' "startYear": 1998, "endYear": 2004, "rating": "", "modified": "2013-11-20T17:40:18-0500",'
+    b' "thumbnail": {"path": "http://i.annihil.us/u/prod/marvel/i/mg/9/c0/527bb7b37ff55",'
+    b' "extension": "jpg"},'
+    b' "comics": {"available": 1, "returned": 1, "collectionURI": "...",'
+    b' "items": [{"resourceURI": "...", "name": "Avengers (1998) #1"}]},'
+    b' "stories": ' + _EMPTY_LIST + b', "events": ' + _EMPTY_LIST + b','
+    b' "characters": ' + _EMPTY_LIST + b', "creators": ' + _EMPTY_LIST + b','
+    b' "next": {"resourceURI": "...", "name": "Avengers (2004 - 2005)"}, "previous": null'
+    b"}]}}"
 )
 
 
@@ -69,6 +97,20 @@ class TestCharacterList:
         assert character_list.items[0].name == "Iron Man"
         logger.info("✅ Character list creation test completed successfully")
 
+    def test_character_list_is_generic_summary_list(self):
+        """Test series related-resource lists are SummaryList specializations.
+
+        Expected behavior:
+            - CharacterList is SummaryList[CharacterSummary]
+            - Series and story models share the same CharacterList class
+        """
+        logger.info("Testing series lists are SummaryList specializations")
+
+        assert CharacterList is SummaryList[CharacterSummary]
+        assert CharacterList is story_models.CharacterList
+
+        logger.info("✅ Series SummaryList specialization test completed successfully")
+
     def test_character_list_empty_items(self):
         """Test creating a CharacterList with empty items list."""
         logger.info("Testing character list creation with empty items list")
@@ -470,6 +512,62 @@ class TestSeries:
         assert series.title == "Avengers (1998 - Present)"
         logger.info("✅ Series ongoing series test completed successfully")
 
+    def test_series_is_frozen(self):
+        """Test Series instances are immutable and hashable once parsed.
+
+        Expected behavior:
+            - Assigning to a field raises ValidationError
+            - The original value is unchanged
+            - Equal instances hash equally
+        """
+        logger.info("Testing Series instances are immutable")
+
+        series = SeriesListResponse.from_json(SERIES_LIST_BODY).data.results[0]
+
+        with pytest.raises(ValidationError):
+            series.title = "Avengers (2004 - 2005)"
+        assert series.title != "Avengers (2004 - 2005)"
+        assert isinstance(series.urls, tuple)
+        assert hash(series) == hash(SeriesListResponse.from_json(SERIES_LIST_BODY).data.results[0])
+
+        logger.info("✅ Series frozen test completed successfully")
+
+    def test_series_related_lists_are_lazy(self):
+        """Test Series defers validation of its related-resource lists.
+
+        Expected behavior:
+            - Related lists are stored raw after validation
+            - Reading a related list returns the validated list model
+            - Invalid lists raise ValidationError when first read
+        """
+        logger.info("Testing Series defers validation of related lists")
+
+        series = SeriesListResponse.from_json(SERIES_LIST_BODY).data.results[0]
+        assert isinstance(series.__dict__["comics"], dict)
+        assert isinstance(series.comics, ComicList)
+        assert series.comics.items[0].resource_uri == "..."
+
+        broken = SeriesListResponse.from_json(
+            SERIES_LIST_BODY.replace(b'"creators": {"available": 0', b'"creators": {"available": "many"')
+        ).data.results[0]
+        with pytest.raises(ValidationError):
+            broken.creators  # noqa: B018
+
+        logger.info("✅ Series lazy related lists test completed successfully")
+
+    def test_series_schema_is_complete_at_import(self):
+        """Test Series needs no forward-reference resolution on first use.
+
+        Expected behavior:
+            - Series and SeriesListResponse are fully built when the module is imported
+        """
+        logger.info("Testing Series schema is complete at import")
+
+        assert Series.__pydantic_complete__
+        assert SeriesListResponse.__pydantic_complete__
+
+        logger.info("✅ Series schema completeness test completed successfully")
+
     def test_series_missing_required_fields(self):
         """Test that Series requires all mandatory fields."""
         logger.info("Testing series missing required fields validation")
@@ -621,6 +719,108 @@ class TestSeriesListResponse:
         assert len(response.data.results) == 0
         logger.info("✅ Series list response empty results test completed successfully")
 
+    def test_series_list_response_from_json(self):
+        """Test SeriesListResponse parses raw response bytes.
+
+        Expected behavior:
+            - Valid bytes parse into a SeriesListResponse with typed Series results
+            - Subclasses parse into the subclass
+            - Invalid JSON raises ValidationError
+        """
+        logger.info("Testing SeriesListResponse parses raw response bytes")
+
+        response = SeriesListResponse.from_json(SERIES_LIST_BODY)
+        assert isinstance(response, SeriesListResponse)
+        assert isinstance(response.data.results[0], Series)
+
+        class _Subclass(SeriesListResponse):
+            pass
+
+        assert type(_Subclass.from_json(SERIES_LIST_BODY)) is _Subclass
+
+        with pytest.raises(ValidationError):
+            SeriesListResponse.from_json(b"{not json")
+
+        logger.info("✅ SeriesListResponse from_json test completed successfully")
+
+    def test_series_list_response_from_response_bytes(self):
+        """Test SeriesListResponse parses an HTTP response from its raw bytes.
+
+        Expected behavior:
+            - from_response validates the undecoded body in one pass
+            - The result matches parsing the same bytes with from_json
+        """
+        logger.info("Testing SeriesListResponse parses raw response bytes")
+
+        response = SeriesListResponse.from_response(httpx.Response(200, content=SERIES_LIST_BODY))
+
+        assert isinstance(response.data.results[0], Series)
+        assert response == SeriesListResponse.from_json(SERIES_LIST_BODY)
+
+        logger.info("✅ SeriesListResponse raw bytes test completed successfully")
+
+    def test_series_list_response_from_json_trust_source(self):
+        """Test trusted Series payloads are built without validation.
+
+        Expected behavior:
+            - from_json(trust_source=True) builds nested series models from API keys
+            - The result equals the validated response
+        """
+        logger.info("Testing SeriesListResponse trusted construction")
+
+        trusted = SeriesListResponse.from_json(SERIES_LIST_BODY, trust_source=True)
+
+        assert isinstance(trusted.data.results[0], Series)
+        assert isinstance(trusted.data.results[0].next, SeriesSummary)
+        assert trusted.data.results[0].comics.items[0].name == "Avengers (1998) #1"
+        assert trusted == SeriesListResponse.from_json(SERIES_LIST_BODY)
+
+        logger.info("✅ SeriesListResponse trusted construction test completed successfully")
+
+
+class TestIterSeries:
+    """Test cases for iter_series.
+
+    This test class verifies that iter_series yields validated Series objects
+    from a raw list response body.
+    """
+
+    def test_iter_series_yields_validated_models(self):
+        """Test iter_series yields the same models as the list response.
+
+        Expected behavior:
+            - Each result is yielded as a validated Series
+            - The yielded models equal the decoded response's results
+        """
+        logger.info("Testing iter_series yields validated models")
+
+        items = list(iter_series(SERIES_LIST_BODY))
+
+        assert all(isinstance(item, Series) for item in items)
+        assert items == SeriesListResponse.from_json(SERIES_LIST_BODY).data.results
+
+        logger.info("✅ iter_series test completed successfully")
+
+    def test_iter_series_validates_lazily(self):
+        """Test iter_series only validates results as they are reached.
+
+        Expected behavior:
+            - Invalid JSON raises ValueError
+            - An invalid result raises ValidationError only when reached
+        """
+        logger.info("Testing iter_series validates lazily")
+
+        with pytest.raises(ValueError):
+            next(iter_series(b"{not json"))
+
+        body = SERIES_LIST_BODY.replace(b"}]}}", b"}, {}]}}")
+        items = iter_series(body)
+        assert isinstance(next(items), Series)
+        with pytest.raises(ValidationError):
+            next(items)
+
+        logger.info("✅ iter_series lazy validation test completed successfully")
+
 
 class TestSeriesResponse:
     """Test cases for SeriesResponse model.
@@ -6,6 +6,7 @@ creation, validation, field access, and error handling scenarios.
 """
 
 import logging
+import httpx
 import pytest
 from pydantic import ValidationError
 
@@ -16,6 +17,7 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+from marvelpy.models import series as series_models  # noqa: E402
 from marvelpy.models.common import (
     CharacterSummary,
     ComicSummary,
@@ -23,6 +25,7 @@ from marvelpy.models.common import (
     EventSummary,
     Image,
     SeriesSummary,
+    SummaryList,
 )
 from marvelpy.models.story import (
     CharacterList,
@@ -33,6 +36,28 @@ from marvelpy.models.story import (
     Story,
     StoryListResponse,
     StoryResponse,
+    iter_stories,
+)
+
+_ENVELOPE = (
+    b'{"code": 200, "status": "Ok", "copyright": "\xc2\xa9 2024 MARVEL",'
+    b' "attributionText": "Data provided by Marvel.",'
+    b' "attributionHTML": "<a>Data provided by Marvel.</a>", "etag": "etag123",'
+    b' "data": {"offset": 0, "limit": 20, "total": 1, "count": 1, "results": ['
+)
+_EMPTY_LIST = b'{"available": 0, "returned": 0, "collectionURI": "...", "items": []}'
+
+STORY_LIST_BODY = (
+    _ENVELOPE
+    + b'{"id": 12345, "title": "Cover #1", "description": "Cover story for Avengers #1",'
+    b' "resourceURI": "http://gateway.marvel.com/v1/public/stories/12345", "type": "cover",'
+    b' "modified": "2013-11-20T17:40:18-0500", "thumbnail": null,'
+    b' "comics": {"available": 1, "returned": 1, "collectionURI": "...",'
+    b' "items": [{"resourceURI": "...", "name": "Avengers (1963) #1"}]},'
+    b' "series": ' + _EMPTY_LIST + b', "events": ' + _EMPTY_LIST + b','
+    b' "characters": ' + _EMPTY_LIST + b', "creators": ' + _EMPTY_LIST + b','
+    b' "originalIssue": {"resourceURI": "...", "name": "Avengers (1963) #1"}'
+    b"}]}}"
 )
 
 
@@ -68,6 +93,20 @@ class TestCharacterList:
         assert character_list.items[0].name == "Iron Man"
         logger.info("✅ Character list creation test completed successfully")
 
+    def test_character_list_is_generic_summary_list(self):
+        """Test story related-resource lists are SummaryList specializations.
+
+        Expected behavior:
+            - CharacterList is SummaryList[CharacterSummary]
+            - Story and series models share the same CharacterList class
+        """
+        logger.info("Testing story lists are SummaryList specializations")
+
+        assert CharacterList is SummaryList[CharacterSummary]
+        assert CharacterList is series_models.CharacterList
+
+        logger.info("✅ Story SummaryList specialization test completed successfully")
+
     def test_character_list_empty_items(self):
         """Test creating a CharacterList with empty items list."""
         logger.info("Testing character list creation with empty items list")
@@ -494,6 +533,61 @@ class TestStory:
         assert promo_story.title == "Promo Story"
         logger.info("✅ Story different types test completed successfully")
 
+    def test_story_is_frozen(self):
+        """Test Story instances are immutable and hashable once parsed.
+
+        Expected behavior:
+            - Assigning to a field raises ValidationError
+            - The original value is unchanged
+            - Equal instances hash equally
+        """
+        logger.info("Testing Story instances are immutable")
+
+        story = StoryListResponse.from_json(STORY_LIST_BODY).data.results[0]
+
+        with pytest.raises(ValidationError):
+            story.title = "Cover #2"
+        assert story.title != "Cover #2"
+        assert hash(story) == hash(StoryListResponse.from_json(STORY_LIST_BODY).data.results[0])
+
+        logger.info("✅ Story frozen test completed successfully")
+
+    def test_story_related_lists_are_lazy(self):
+        """Test Story defers validation of its related-resource lists.
+
+        Expected behavior:
+            - Related lists are stored raw after validation
+            - Reading a related list returns the validated list model
+            - Invalid lists raise ValidationError when first read
+        """
+        logger.info("Testing Story defers validation of related lists")
+
+        story = StoryListResponse.from_json(STORY_LIST_BODY).data.results[0]
+        assert isinstance(story.__dict__["comics"], dict)
+        assert isinstance(story.comics, ComicList)
+        assert story.comics.items[0].resource_uri == "..."
+
+        broken = StoryListResponse.from_json(
+            STORY_LIST_BODY.replace(b'"creators": {"available": 0', b'"creators": {"available": "many"')
+        ).data.results[0]
+        with pytest.raises(ValidationError):
+            broken.creators  # noqa: B018
+
+        logger.info("✅ Story lazy related lists test completed successfully")
+
+    def test_story_schema_is_complete_at_import(self):
+        """Test Story needs no forward-reference resolution on first use.
+
+        Expected behavior:
+            - Story and StoryListResponse are fully built when the module is imported
+        """
+        logger.info("Testing Story schema is complete at import")
+
+        assert Story.__pydantic_complete__
+        assert StoryListResponse.__pydantic_complete__
+
+        logger.info("✅ Story schema completeness test completed successfully")
+
     def test_story_missing_required_fields(self):
         """Test that Story requires all mandatory fields."""
         logger.info("Testing story missing required fields validation")
@@ -641,6 +735,108 @@ class TestStoryListResponse:
         assert len(response.data.results) == 0
         logger.info("✅ Story list response empty results test completed successfully")
 
+    def test_story_list_response_from_json(self):
+        """Test StoryListResponse parses raw response bytes.
+
+        Expected behavior:
+            - Valid bytes parse into a StoryListResponse with typed Story results
+            - Subclasses parse into the subclass
+            - Invalid JSON raises ValidationError
+        """
+        logger.info("Testing StoryListResponse parses raw response bytes")
+
+        response = StoryListResponse.from_json(STORY_LIST_BODY)
+        assert isinstance(response, StoryListResponse)
+        assert isinstance(response.data.results[0], Story)
+
+        class _Subclass(StoryListResponse):
+            pass
+
+        assert type(_Subclass.from_json(STORY_LIST_BODY)) is _Subclass
+
+        with pytest.raises(ValidationError):
+            StoryListResponse.from_json(b"{not json")
+
+        logger.info("✅ StoryListResponse from_json test completed successfully")
+
+    def test_story_list_response_from_response_bytes(self):
+        """Test StoryListResponse parses an HTTP response from its raw bytes.
+
+        Expected behavior:
+            - from_response validates the undecoded body in one pass
+            - The result matches parsing the same bytes with from_json
+        """
+        logger.info("Testing StoryListResponse parses raw response bytes")
+
+        response = StoryListResponse.from_response(httpx.Response(200, content=STORY_LIST_BODY))
+
+        assert isinstance(response.data.results[0], Story)
+        assert response == StoryListResponse.from_json(STORY_LIST_BODY)
+
+        logger.info("✅ StoryListResponse raw bytes test completed successfully")
+
+    def test_story_list_response_from_json_trust_source(self):
+        """Test trusted Story payloads are built without validation.
+
+        Expected behavior:
+            - from_json(trust_source=True) builds nested story models from API keys
+            - The result equals the validated response
+        """
+        logger.info("Testing StoryListResponse trusted construction")
+
+        trusted = StoryListResponse.from_json(STORY_LIST_BODY, trust_source=True)
+
+        assert isinstance(trusted.data.results[0], Story)
+        assert isinstance(trusted.data.results[0].comics, ComicList)
+        assert trusted.data.results[0].comics.items[0].name == "Avengers (1963) #1"
+        assert trusted == StoryListResponse.from_json(STORY_LIST_BODY)
+
+        logger.info("✅ StoryListResponse trusted construction test completed successfully")
+
+
+class TestIterStories:
+    """Test cases for iter_stories.
+
+    This test class verifies that iter_stories yields validated Story objects
+    from a raw list response body.
+    """
+
+    def test_iter_stories_yields_validated_models(self):
+        """Test iter_stories yields the same models as the list response.
+
+        Expected behavior:
+            - Each result is yielded as a validated Story
+            - The yielded models equal the decoded response's results
+        """
+        logger.info("Testing iter_stories yields validated models")
+
+        items = list(iter_stories(STORY_LIST_BODY))
+
+        assert all(isinstance(item, Story) for item in items)
+        assert items == StoryListResponse.from_json(STORY_LIST_BODY).data.results
+
+        logger.info("✅ iter_stories test completed successfully")
+
+    def test_iter_stories_validates_lazily(self):
+        """Test iter_stories only validates results as they are reached.
+
+        Expected behavior:
+            - Invalid JSON raises ValueError
+            - An invalid result raises ValidationError only when reached
+        """
+        logger.info("Testing iter_stories validates lazily")
+
+        with pytest.raises(ValueError):
+            next(iter_stories(b"{not json"))
+
+        body = STORY_LIST_BODY.replace(b"}]}}", b"}, {}]}}")
+        items = iter_stories(body)
+        assert isinstance(next(items), Story)
+        with pytest.raises(ValidationError):
+            next(items)
+
+        logger.info("✅ iter_stories lazy validation test completed successfully")
+
 
 class TestStoryResponse:
     """Test cases for StoryResponse model.
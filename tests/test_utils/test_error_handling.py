@@ -4,7 +4,9 @@ This module contains comprehensive tests for error handling utilities,
 including error classification, error creation, and retry logic.
 """
 
+import asyncio
 import logging
+import sys
 from unittest.mock import AsyncMock, Mock, patch
 
 import httpx
@@ -18,9 +20,12 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 from marvelpy.utils.error_handling import (
+    Bulkhead,
+    CircuitBreaker,
     classify_http_error,
     create_marvel_error,
     format_error_message,
+    full_jitter_schedule,
     handle_httpx_error,
     log_error,
     retry_with_backoff,
@@ -28,6 +33,7 @@ from marvelpy.utils.error_handling import (
 from marvelpy.utils.exceptions import (
     MarvelAPIError,
     MarvelAuthenticationError,
+    MarvelBulkheadFullError,
     MarvelNetworkError,
     MarvelNotFoundError,
     MarvelRateLimitError,
@@ -89,6 +95,15 @@ class TestClassifyHttpError:
             assert error_class == MarvelAPIError
         logger.info("✅ Other error classification test completed successfully")
 
+    def test_classify_out_of_range_codes(self):
+        """Test status codes outside 0-599 fall back to MarvelAPIError."""
+        logger.info("Testing HTTP error classification for out-of-range codes")
+        for code in [-1, 600, 999]:
+            assert classify_http_error(code) == MarvelAPIError
+        assert classify_http_error(0) == MarvelAPIError
+        assert classify_http_error(599) == MarvelServerError
+        logger.info("✅ Out-of-range classification test completed successfully")
+
     def test_classify_with_response_data(self):
         """Test classification with response data (should not affect result)."""
         logger.info("Testing HTTP error classification with response data")
@@ -211,10 +226,7 @@ class TestHandleHttpxError:
     def test_handle_http_status_error(self):
         """Test handling HTTP status errors."""
         logger.info("Testing httpx error handling for HTTP status errors")
-        response = Mock()
-        response.status_code = 404
-        response.reason_phrase = "Not Found"
-        response.json.return_value = {"error": "Not found"}
+        response = httpx.Response(404, json={"error": "Not found"})
 
         httpx_error = httpx.HTTPStatusError("Not found", request=Mock(), response=response)
         marvel_error = handle_httpx_error(httpx_error)
@@ -227,11 +239,7 @@ class TestHandleHttpxError:
     def test_handle_http_status_error_with_text_response(self):
         """Test handling HTTP status errors with text response."""
         logger.info("Testing httpx error handling for HTTP status errors with text response")
-        response = Mock()
-        response.status_code = 500
-        response.reason_phrase = "Internal Server Error"
-        response.json.side_effect = ValueError("Invalid JSON")
-        response.text = "Internal server error"
+        response = httpx.Response(500, content=b"Internal server error")
 
         httpx_error = httpx.HTTPStatusError("Server error", request=Mock(), response=response)
         marvel_error = handle_httpx_error(httpx_error)
@@ -241,6 +249,21 @@ class TestHandleHttpxError:
         assert marvel_error.response_data == {"text": "Internal server error"}
         logger.info("✅ HTTP status error with text response handling test completed successfully")
 
+    def test_handle_rate_limit_error_with_retry_after(self):
+        """Test that a 429 Retry-After header is carried onto the error."""
+        logger.info("Testing httpx error handling for rate limit errors with Retry-After")
+        response = httpx.Response(429, json={"code": 429}, headers={"Retry-After": "30"})
+
+        httpx_error = httpx.HTTPStatusError("Rate limited", request=Mock(), response=response)
+        marvel_error = handle_httpx_error(httpx_error)
+
+        assert isinstance(marvel_error, MarvelRateLimitError)
+        assert marvel_error.retry_after == 30
+
+        response.headers["Retry-After"] = "Wed, 21 Oct 2015 07:28:00 GMT"
+        assert handle_httpx_error(httpx_error).retry_after is None
+        logger.info("✅ Rate limit Retry-After handling test completed successfully")
+
     def test_handle_timeout_exception(self):
         """Test handling timeout exceptions."""
         logger.info("Testing httpx error handling for timeout exceptions")
@@ -252,6 +275,16 @@ class TestHandleHttpxError:
         assert marvel_error.original_error == timeout_error
         logger.info("✅ Timeout exception handling test completed successfully")
 
+    def test_handle_httpx_error_subclasses(self):
+        """Test httpx error subclasses use the handler of their nearest base."""
+        logger.info("Testing httpx error handling for error subclasses")
+        connect_timeout = handle_httpx_error(httpx.ConnectTimeout("Connect timeout"))
+        read_error = handle_httpx_error(httpx.ReadError("Connection reset"))
+
+        assert "timeout" in connect_timeout.message.lower()
+        assert read_error.message == "Request error: Connection reset"
+        logger.info("✅ Httpx error subclass handling test completed successfully")
+
     def test_handle_connect_error(self):
         """Test handling connection errors."""
         logger.info("Testing httpx error handling for connection errors")
@@ -372,22 +405,169 @@ class TestRetryWithBackoff:
             assert func.call_count == 3  # Initial + 2 retries
             logger.info("✅ Retry custom retryable errors test completed successfully")
 
+    @pytest.mark.asyncio
+    async def test_retry_on_matches_subclasses(self):
+        """Test retry_on accepts a tuple and retries subclasses of its types."""
+        logger.info("Testing retry with backoff for subclasses of retryable errors")
+
+        class GatewayTimeoutError(MarvelServerError):
+            pass
+
+        func = AsyncMock(side_effect=[GatewayTimeoutError("Timeout"), "success"])
+
+        with patch("asyncio.sleep", new_callable=AsyncMock):
+            result = await retry_with_backoff(func, retry_on=(MarvelServerError,))
+
+            assert result == "success"
+            assert func.call_count == 2
+            logger.info("✅ Retry subclass matching test completed successfully")
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(sys.version_info < (3, 11), reason="exception groups need Python 3.11")
+    async def test_retry_exception_groups(self):
+        """Test exception groups are retried only if all their errors are retryable."""
+        logger.info("Testing retry with backoff for exception groups")
+        retryable_group = ExceptionGroup(  # noqa: F821
+            "fan-out failed", [MarvelServerError("Server error"), MarvelNetworkError()]
+        )
+        mixed_group = ExceptionGroup(  # noqa: F821
+            "fan-out failed", [MarvelServerError("Server error"), MarvelNotFoundError()]
+        )
+        func = AsyncMock(side_effect=[retryable_group, "success"])
+
+        with patch("asyncio.sleep", new_callable=AsyncMock):
+            assert await retry_with_backoff(func) == "success"
+            assert func.call_count == 2
+
+            func = AsyncMock(side_effect=mixed_group)
+            with pytest.raises(ExceptionGroup):  # noqa: F821
+                await retry_with_backoff(func)
+            assert func.call_count == 1
+            logger.info("✅ Retry exception group test completed successfully")
+
     @pytest.mark.asyncio
     async def test_retry_backoff_delay_calculation(self):
-        """Test that backoff delay is calculated correctly."""
+        """Test that each delay is drawn up to the exponential bound."""
         logger.info("Testing retry with backoff delay calculation")
         func = AsyncMock(side_effect=MarvelServerError("Server error"))
 
-        with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep, patch(
+            "marvelpy.utils.error_handling._rng.uniform", side_effect=lambda low, high: high
+        ) as mock_uniform:
             with pytest.raises(MarvelServerError):
                 await retry_with_backoff(func, max_retries=3, base_delay=1.0, backoff_factor=2.0)
 
-            # Check that sleep was called with increasing delays
-            expected_delays = [1.0, 2.0, 4.0]  # base_delay * backoff_factor^attempt
+            # Jitter is drawn from [0, base_delay * backoff_factor^attempt]
+            expected_bounds = [(0, 1.0), (0, 2.0), (0, 4.0)]
+            assert [call[0] for call in mock_uniform.call_args_list] == expected_bounds
             actual_delays = [call[0][0] for call in mock_sleep.call_args_list]
-            assert actual_delays == expected_delays
+            assert actual_delays == [1.0, 2.0, 4.0]
             logger.info("✅ Retry backoff delay calculation test completed successfully")
 
+    @pytest.mark.asyncio
+    async def test_retry_delays_are_jittered(self):
+        """Test that retry delays are randomized within their bounds."""
+        logger.info("Testing retry with backoff applies full jitter")
+        func = AsyncMock(side_effect=MarvelServerError("Server error"))
+
+        with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            with pytest.raises(MarvelServerError):
+                await retry_with_backoff(func, max_retries=50, base_delay=1.0, backoff_factor=1.0)
+
+            actual_delays = [call[0][0] for call in mock_sleep.call_args_list]
+            assert all(0 <= delay <= 1.0 for delay in actual_delays)
+            assert len(set(actual_delays)) > 1
+            logger.info("✅ Retry full jitter test completed successfully")
+
+    @pytest.mark.asyncio
+    async def test_retry_honors_rate_limit_retry_after(self):
+        """Test that a rate limit's retry_after replaces the backoff delay."""
+        logger.info("Testing retry with backoff honors Retry-After")
+        func = AsyncMock(
+            side_effect=[MarvelRateLimitError("Rate limited", retry_after=30), "success"]
+        )
+
+        with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            result = await retry_with_backoff(func, max_retries=3, base_delay=1.0, max_delay=5.0)
+
+            assert result == "success"
+            delay = mock_sleep.call_args[0][0]
+            assert 30 <= delay <= 31
+            logger.info("✅ Retry honors Retry-After test completed successfully")
+
+    @pytest.mark.asyncio
+    async def test_retry_stops_at_deadline(self):
+        """Test no retry is scheduled past the deadline."""
+        logger.info("Testing retry with backoff stops at its deadline")
+        func = AsyncMock(side_effect=MarvelServerError("Server error"))
+
+        with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep, patch(
+            "marvelpy.utils.error_handling._rng.uniform", side_effect=lambda low, high: high
+        ):
+            with pytest.raises(MarvelServerError):
+                await retry_with_backoff(func, max_retries=3, base_delay=10.0, deadline=5.0)
+
+            assert func.call_count == 1
+            mock_sleep.assert_not_called()
+            logger.info("✅ Retry deadline test completed successfully")
+
+    @pytest.mark.asyncio
+    async def test_retry_deadline_cuts_off_slow_attempt(self):
+        """Test an attempt running past the deadline is cancelled."""
+        logger.info("Testing retry with backoff cancels attempts past the deadline")
+
+        async def slow_call():
+            await asyncio.sleep(10)
+
+        with pytest.raises(MarvelNetworkError, match="deadline"):
+            await retry_with_backoff(slow_call, max_retries=3, deadline=0.01)
+        logger.info("✅ Retry deadline cut-off test completed successfully")
+
+    def test_full_jitter_schedule_bounds(self):
+        """Test schedule delays stay within the capped exponential bounds."""
+        logger.info("Testing full jitter schedule bounds")
+        with patch(
+            "marvelpy.utils.error_handling._rng.uniform", side_effect=lambda low, high: high
+        ):
+            assert list(full_jitter_schedule(1.0, 2.0, 5.0, 4)) == [1.0, 2.0, 4.0, 5.0]
+
+        delays = list(full_jitter_schedule(1.0, 2.0, 5.0, 4))
+        assert all(0 <= delay <= bound for delay, bound in zip(delays, [1.0, 2.0, 4.0, 5.0]))
+        logger.info("✅ Full jitter schedule test completed successfully")
+
+    @pytest.mark.asyncio
+    async def test_retry_uses_schedule_factory(self):
+        """Test retry delays come from the given schedule factory."""
+        logger.info("Testing retry with backoff uses a custom schedule")
+        func = AsyncMock(side_effect=MarvelServerError("Server error"))
+        schedule_factory = Mock(return_value=iter([0.5, 1.5]))
+
+        with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            with pytest.raises(MarvelServerError):
+                await retry_with_backoff(func, max_retries=2, schedule_factory=schedule_factory)
+
+            schedule_factory.assert_called_once_with(1.0, 2.0, 60.0, 2)
+            assert [call.args[0] for call in mock_sleep.call_args_list] == [0.5, 1.5]
+            logger.info("✅ Retry schedule factory test completed successfully")
+
+    @pytest.mark.asyncio
+    async def test_retry_does_not_format_errors_when_not_logged(self):
+        """Test retried errors are only converted to text if the warning is emitted."""
+        logger.info("Testing retry with backoff formats errors lazily")
+
+        class UnprintableError(MarvelServerError):
+            def __str__(self):
+                raise AssertionError("error was formatted")
+
+        func = AsyncMock(side_effect=[UnprintableError(), "success"])
+        module_logger = logging.getLogger("marvelpy.utils.error_handling")
+
+        with patch("asyncio.sleep", new_callable=AsyncMock), patch.object(
+            module_logger, "isEnabledFor", return_value=False
+        ):
+            assert await retry_with_backoff(func) == "success"
+        logger.info("✅ Retry lazy formatting test completed successfully")
+
     @pytest.mark.asyncio
     async def test_retry_max_delay_limit(self):
         """Test that delay is capped at max_delay."""
@@ -406,6 +586,168 @@ class TestRetryWithBackoff:
             logger.info("✅ Retry max delay limit test completed successfully")
 
 
+class TestCircuitBreaker:
+    """Test cases for CircuitBreaker.
+
+    This test class verifies that the breaker opens after repeated upstream
+    failures, fails fast while open and recovers after its timeout.
+    """
+
+    @pytest.mark.asyncio
+    async def test_breaker_opens_and_fails_fast(self):
+        """Test the breaker rejects calls without retrying once open."""
+        logger.info("Testing circuit breaker opens after consecutive failures")
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=30.0)
+        func = AsyncMock(side_effect=MarvelServerError("Server error"))
+
+        with patch("asyncio.sleep", new_callable=AsyncMock):
+            for _ in range(2):
+                with pytest.raises(MarvelServerError):
+                    await breaker.call(func, max_retries=1)
+            assert breaker.state == CircuitBreaker.OPEN
+            assert func.call_count == 4
+
+            with pytest.raises(MarvelNetworkError, match="Circuit open") as first:
+                await breaker.call(func, max_retries=1)
+            with pytest.raises(MarvelNetworkError, match="Circuit open") as second:
+                await breaker.call(func, max_retries=1)
+            assert func.call_count == 4  # Rejected without calling func
+            # Each rejection is a fresh error chained from the last failure
+            assert first.value is not second.value
+            assert isinstance(first.value.__cause__, MarvelServerError)
+            assert first.value.__cause__ is second.value.__cause__
+        logger.info("✅ Circuit breaker open test completed successfully")
+
+    @pytest.mark.asyncio
+    async def test_breaker_recovers_after_timeout(self):
+        """Test a successful trial call after the timeout closes the breaker."""
+        logger.info("Testing circuit breaker recovery after the timeout")
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30.0)
+        func = AsyncMock(side_effect=[MarvelNetworkError("Connection error"), "success"])
+
+        with patch(
+            "marvelpy.utils.error_handling.time.monotonic", return_value=100.0
+        ), pytest.raises(MarvelNetworkError):
+            await breaker.call(func, max_retries=0)
+        assert breaker.state == CircuitBreaker.OPEN
+
+        with patch("marvelpy.utils.error_handling.time.monotonic", return_value=131.0):
+            result = await breaker.call(func, max_retries=0)
+
+        assert result == "success"
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.failure_count == 0
+        logger.info("✅ Circuit breaker recovery test completed successfully")
+
+    @pytest.mark.asyncio
+    async def test_breaker_allows_one_trial_call(self):
+        """Test only one call reaches the upstream while the breaker is half-open."""
+        logger.info("Testing circuit breaker allows a single trial call")
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30.0)
+        release = asyncio.Event()
+
+        async def failing_call():
+            raise MarvelNetworkError("Connection error")
+
+        async def trial_call():
+            await release.wait()
+            return "success"
+
+        with patch(
+            "marvelpy.utils.error_handling.time.monotonic", return_value=100.0
+        ), pytest.raises(MarvelNetworkError):
+            await breaker.call(failing_call, max_retries=0)
+
+        with patch("marvelpy.utils.error_handling.time.monotonic", return_value=131.0):
+            trial = asyncio.ensure_future(breaker.call(trial_call, max_retries=0))
+            await asyncio.sleep(0)
+            assert breaker.state == CircuitBreaker.HALF_OPEN
+
+            with pytest.raises(MarvelNetworkError, match="Circuit open"):
+                await breaker.call(trial_call, max_retries=0)
+
+            release.set()
+            assert await trial == "success"
+
+        assert breaker.state == CircuitBreaker.CLOSED
+        logger.info("✅ Circuit breaker trial call test completed successfully")
+
+    @pytest.mark.asyncio
+    async def test_breaker_ignores_client_errors(self):
+        """Test client errors do not count towards opening the breaker."""
+        logger.info("Testing circuit breaker ignores client errors")
+        breaker = CircuitBreaker(failure_threshold=1)
+        func = AsyncMock(side_effect=MarvelNotFoundError("Not found"))
+
+        with pytest.raises(MarvelNotFoundError):
+            await breaker.call(func)
+
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.failure_count == 0
+        logger.info("✅ Circuit breaker client error test completed successfully")
+
+
+class TestBulkhead:
+    """Test cases for Bulkhead.
+
+    This test class verifies that the bulkhead caps concurrent calls made
+    through retry_with_backoff and rejects calls once its queue is full.
+    """
+
+    @pytest.mark.asyncio
+    async def test_bulkhead_limits_concurrency(self):
+        """Test no more than the limit of calls run at once."""
+        logger.info("Testing bulkhead limits concurrent calls")
+        bulkhead = Bulkhead(limit=2, queue_depth=10)
+        assert bulkhead._sem is None  # Created on first use, on the running loop
+        running = 0
+        peak = 0
+
+        async def api_call():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+            return "success"
+
+        results = await asyncio.gather(
+            *(retry_with_backoff(api_call, bulkhead=bulkhead) for _ in range(6))
+        )
+
+        assert results == ["success"] * 6
+        assert peak == 2
+        logger.info("✅ Bulkhead concurrency test completed successfully")
+
+    @pytest.mark.asyncio
+    async def test_bulkhead_rejects_when_queue_full(self):
+        """Test calls beyond the limit and queue depth are rejected."""
+        logger.info("Testing bulkhead rejects calls when its queue is full")
+        bulkhead = Bulkhead(limit=1, queue_depth=1)
+        release = asyncio.Event()
+
+        async def api_call():
+            await release.wait()
+            return "success"
+
+        running = asyncio.ensure_future(retry_with_backoff(api_call, bulkhead=bulkhead))
+        queued = asyncio.ensure_future(retry_with_backoff(api_call, bulkhead=bulkhead))
+        await asyncio.sleep(0)
+
+        breaker = CircuitBreaker(failure_threshold=1)
+        with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep, pytest.raises(
+            MarvelBulkheadFullError
+        ):
+            await breaker.call(api_call, bulkhead=bulkhead)
+        # Local back-pressure is neither retried nor counted as an API failure
+        mock_sleep.assert_not_called()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+        release.set()
+        assert await asyncio.gather(running, queued) == ["success", "success"]
+        logger.info("✅ Bulkhead queue full test completed successfully")
+
+
 class TestFormatErrorMessage:
     """Test cases for error message formatting.
 
@@ -506,6 +848,19 @@ class TestFormatErrorMessage:
         logger.info("✅ Authentication error formatting test completed successfully")
 
 
+    def test_format_error_subclass_uses_base_hint(self):
+        """Test formatting a subclass of a known error adds its base's hint."""
+        logger.info("Testing error message formatting for an error subclass")
+
+        class GatewayTimeoutError(MarvelServerError):
+            pass
+
+        message = format_error_message(GatewayTimeoutError("Timeout", status_code=504))
+
+        assert message == "Timeout (Status: 504) - Please try again later"
+        logger.info("✅ Error subclass formatting test completed successfully")
+
+
 class TestLogError:
     """Test cases for error logging.
 
@@ -564,6 +919,35 @@ class TestLogError:
             assert "Invalid API key" in call_args[0][1]  # Check message
         logger.info("✅ Authentication error logging test completed successfully")
 
+    def test_log_error_subclass_uses_base_level(self):
+        """Test logging a subclass of a known error uses its base's level."""
+        logger.info("Testing error logging for a subclass of a known error")
+
+        class GatewayTimeoutError(MarvelServerError):
+            pass
+
+        custom_logger = Mock()
+
+        log_error(GatewayTimeoutError("Timeout"), logger=custom_logger)
+
+        assert custom_logger.log.call_args[0][0] == logging.ERROR  # Check log level
+        logger.info("✅ Subclass error logging test completed successfully")
+
+    def test_log_error_skips_disabled_level(self):
+        """Test nothing is formatted or logged when the level is disabled."""
+        logger.info("Testing error logging is skipped for disabled levels")
+        error = MarvelAPIError("Test error")
+        custom_logger = Mock()
+        custom_logger.isEnabledFor.return_value = False
+
+        with patch("marvelpy.utils.error_handling.format_error_message") as mock_format:
+            log_error(error, logger=custom_logger)
+
+            mock_format.assert_not_called()
+        custom_logger.isEnabledFor.assert_called_once_with(logging.INFO)
+        custom_logger.log.assert_not_called()
+        logger.info("✅ Disabled level error logging test completed successfully")
+
     def test_log_error_with_context(self):
         """Test logging an error with additional context."""
         logger.info("Testing error logging with additional context")
@@ -5,6 +5,7 @@ including base exception functionality and specific exception types.
 """
 
 import logging
+import pickle
 
 # Configure logging for tests
 logging.basicConfig(
@@ -16,6 +17,7 @@ logger = logging.getLogger(__name__)
 from marvelpy.utils.exceptions import (
     MarvelAPIError,
     MarvelAuthenticationError,
+    MarvelBulkheadFullError,
     MarvelNetworkError,
     MarvelNotFoundError,
     MarvelRateLimitError,
@@ -43,6 +45,17 @@ class TestMarvelAPIError:
         assert error.request_data is None
         logger.info("✅ Marvel API error creation test completed successfully")
 
+    def test_marvel_api_error_message_is_args(self):
+        """Test the message is stored once, as the exception's first argument."""
+        logger.info("Testing Marvel API error message is backed by args")
+        error = MarvelAPIError("Test error", status_code=500)
+
+        assert error.args == ("Test error",)
+        error.message = "Updated error"
+        assert error.args == ("Updated error",)
+        assert str(error) == "Updated error (Status: 500)"
+        logger.info("✅ Marvel API error message test completed successfully")
+
     def test_marvel_api_error_with_status_code(self):
         """Test creating a MarvelAPIError with status code."""
         logger.info("Testing Marvel API error creation with status code")
@@ -346,6 +359,25 @@ class TestMarvelNetworkError:
         logger.info("✅ Network error inheritance test completed successfully")
 
 
+class TestMarvelBulkheadFullError:
+    """Test cases for MarvelBulkheadFullError class.
+
+    Tests that bulkhead rejections carry no response information.
+    """
+
+    def test_bulkhead_full_error_default_values(self):
+        """Test MarvelBulkheadFullError with default values."""
+        logger.info("Testing Marvel bulkhead full error with default values")
+        error = MarvelBulkheadFullError()
+
+        assert error.message == "Bulkhead full - too many concurrent Marvel API requests"
+        assert error.status_code is None
+        assert error.response_data is None
+        assert isinstance(error, MarvelAPIError)
+        assert not isinstance(error, MarvelNetworkError)
+        logger.info("✅ Bulkhead full error default values test completed successfully")
+
+
 class TestExceptionHierarchy:
     """Test cases for exception class hierarchy and relationships.
 
@@ -406,3 +438,43 @@ class TestExceptionHierarchy:
         network_error = MarvelNetworkError()
         assert str(network_error) == "Network error occurred"
         logger.info("✅ Exception string representations test completed successfully")
+
+    def test_exceptions_store_attributes_in_slots(self):
+        """Test error attributes live in slots rather than the instance dict."""
+        logger.info("Testing exception attributes are stored in slots")
+        error = MarvelNotFoundError("Not found", resource_type="character", resource_id="1")
+
+        assert error.__dict__ == {}
+        assert error.resource_type == "character"
+        assert error.status_code == 404
+        logger.info("✅ Exception slots test completed successfully")
+
+    def test_exceptions_pickle_round_trip(self):
+        """Test slot attributes survive pickling."""
+        logger.info("Testing exception pickling round trip")
+        error = MarvelRateLimitError("Slow down", retry_after=30, request_data={"id": "1"})
+
+        restored = pickle.loads(pickle.dumps(error))
+
+        assert type(restored) is MarvelRateLimitError
+        assert restored.message == "Slow down"
+        assert restored.retry_after == 30
+        assert restored.request_data == {"id": "1"}
+        assert str(restored) == str(error)
+        logger.info("✅ Exception pickling test completed successfully")
+
+    def test_retryable_flags(self):
+        """Test only transient errors are marked retryable."""
+        logger.info("Testing exception RETRYABLE flags")
+        assert MarvelServerError.RETRYABLE
+        assert MarvelRateLimitError.RETRYABLE
+        assert MarvelNetworkError.RETRYABLE
+        for error_class in [
+            MarvelAPIError,
+            MarvelAuthenticationError,
+            MarvelBulkheadFullError,
+            MarvelNotFoundError,
+            MarvelValidationError,
+        ]:
+            assert not error_class.RETRYABLE
+        logger.info("✅ Exception RETRYABLE flags test completed successfully")